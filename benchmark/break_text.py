@@ -0,0 +1,43 @@
+__all__ = ()
+
+from timeit import repeat as timeit_repeat
+
+import click
+
+from etypography import break_text_icu_line
+from etypography import break_text_icu_line_offsets
+from etypography import break_text_uax14_line
+from etypography import break_text_uax14_line_offsets
+
+TEXTS = (
+    "hello world",
+    "the quick brown fox jumps over the lazy dog",
+    "there is a\nnewline",
+    "こんにちは、世界",
+)
+
+
+@click.command()
+@click.option("--strings", type=click.INT, default=100000, show_default=True)
+@click.option("--repeat", type=click.INT, default=5, show_default=True)
+def main(strings, repeat):
+    texts = [TEXTS[i % len(TEXTS)] for i in range(strings)]
+
+    def chunks(break_text):
+        return lambda: [list(break_text(text)) for text in texts]
+
+    def offsets(break_text_offsets):
+        return lambda: [break_text_offsets(text) for text in texts]
+
+    for name, f in (
+        ("break_text_icu_line", chunks(break_text_icu_line)),
+        ("break_text_icu_line_offsets", offsets(break_text_icu_line_offsets)),
+        ("break_text_uax14_line", chunks(break_text_uax14_line)),
+        ("break_text_uax14_line_offsets", offsets(break_text_uax14_line_offsets)),
+    ):
+        result = min(timeit_repeat(f, number=1, repeat=repeat)) * 1000
+        click.echo(f"{name}: {result:.1f}ms ({result * 1000 / strings:.2f}us per string)")
+
+
+if __name__ == "__main__":
+    main()
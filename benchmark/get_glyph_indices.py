@@ -0,0 +1,54 @@
+__all__ = ()
+
+from pathlib import Path
+from timeit import repeat as timeit_repeat
+
+import click
+
+from etypography import FontFace
+
+BENCHMARK_DIRECTORY = Path(__file__).parent
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--font",
+    type=click.Path(exists=True, dir_okay=False),
+    default=BENCHMARK_DIRECTORY / "../examples/resources/OpenSans-Regular.ttf",
+    show_default=True,
+    help="The font file to look glyphs up in.",
+)
+@click.option("--characters", type=click.INT, default=100000, show_default=True)
+@click.option("--repeat", type=click.INT, default=5, show_default=True)
+def main(font, characters, repeat):
+    font_face = FontFace.from_path(font)
+    text = "".join(chr(0x20 + i % 0x2000) for i in range(characters))
+
+    def get_glyph_index():
+        [font_face.get_glyph_index(c) for c in text]
+
+    def get_glyph_indices():
+        font_face.get_glyph_indices(text)
+
+    def missing_characters():
+        {c for c in text if not font_face.get_glyph_index(c)}
+
+    def get_missing_characters():
+        font_face.get_missing_characters(text)
+
+    # the character map is built on first use
+    font_face.get_glyph_indices("")
+
+    results = [
+        min(timeit_repeat(f, number=1, repeat=repeat)) * 1000
+        for f in (get_glyph_index, get_glyph_indices, missing_characters, get_missing_characters)
+    ]
+    click.echo(f"get_glyph_index per character: {results[0]:.1f}ms")
+    click.echo(f"get_glyph_indices: {results[1]:.1f}ms ({results[0] / results[1]:.1f}x)")
+    click.echo(f"missing characters per character: {results[2]:.1f}ms")
+    click.echo(f"get_missing_characters: {results[3]:.1f}ms ({results[2] / results[3]:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+__all__ = ()
+
+import subprocess
+import sys
+from timeit import repeat as timeit_repeat
+
+import click
+
+STATEMENTS = (
+    ("pass", "python"),
+    ("import etypography", "import etypography"),
+    ("from etypography import FontFace", "from etypography import FontFace"),
+    (
+        "from etypography import break_text_icu_line; list(break_text_icu_line('hello world'))",
+        "first break_text_icu_line",
+    ),
+)
+
+
+@click.command()
+@click.option("--repeat", type=click.INT, default=20, show_default=True)
+def main(repeat):
+    for statement, name in STATEMENTS:
+        result = (
+            min(
+                timeit_repeat(
+                    lambda: subprocess.run([sys.executable, "-c", statement], check=True),
+                    number=1,
+                    repeat=repeat,
+                )
+            )
+            * 1000
+        )
+        click.echo(f"{name}: {result:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+__all__ = ()
+
+from pathlib import Path
+from timeit import repeat as timeit_repeat
+
+import click
+
+from etypography import FontFace
+from etypography import PrimaryAxisTextAlign
+from etypography import SecondaryAxisTextAlign
+from etypography import break_text_icu_line
+
+BENCHMARK_DIRECTORY = Path(__file__).parent
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--font",
+    type=click.Path(exists=True, dir_okay=False),
+    default=BENCHMARK_DIRECTORY / "../examples/resources/OpenSans-Regular.ttf",
+    show_default=True,
+    help="The font file to layout with.",
+)
+@click.option(
+    "--lines", type=click.INT, multiple=True, default=(1000, 10000, 100000), show_default=True
+)
+@click.option("--repeat", type=click.INT, default=3, show_default=True)
+def main(font, lines, repeat):
+    font_face = FontFace.from_path(font)
+    font_face_size = font_face.request_pixel_size(height=16)
+    font_face_size.enable_simple_shaping()
+
+    # the time per line should stay the same as the number of lines grows if the layout is linear
+    # in the number of glyphs
+    for line_count in lines:
+        text = "the quick brown fox\n" * line_count
+        result = min(
+            timeit_repeat(
+                lambda: font_face_size.layout_text(
+                    text,
+                    break_text=break_text_icu_line,
+                    primary_axis_alignment=PrimaryAxisTextAlign.CENTER,
+                    secondary_axis_alignment=SecondaryAxisTextAlign.CENTER,
+                ),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        click.echo(
+            f"{line_count:>7} lines: {result * 1000:.1f}ms ({result * 1000000 / line_count:.1f}us "
+            "per line)"
+        )
+
+
+if __name__ == "__main__":
+    main()
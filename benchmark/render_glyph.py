@@ -0,0 +1,75 @@
+__all__ = ()
+
+from pathlib import Path
+from timeit import repeat as timeit_repeat
+
+import click
+
+from etypography import FontFace
+from etypography import RenderedGlyphFormat
+
+BENCHMARK_DIRECTORY = Path(__file__).parent
+CHARACTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--font",
+    type=click.Path(exists=True, dir_okay=False),
+    default=BENCHMARK_DIRECTORY / "../examples/resources/OpenSans-Regular.ttf",
+    show_default=True,
+    help="The font file to render.",
+)
+@click.option("--size", type=click.INT, default=32, show_default=True)
+@click.option("--repeat", type=click.INT, default=5, show_default=True)
+def main(font, size, repeat):
+    font_face = FontFace.from_path(font)
+    font_face_size = font_face.request_pixel_size(height=size)
+    glyph_indices = [font_face.get_glyph_index(c) for c in CHARACTERS]
+
+    for format in RenderedGlyphFormat:
+
+        def render():
+            for glyph_index in glyph_indices:
+                font_face.render_glyph(glyph_index, font_face_size, format=format)
+
+        def render_batch():
+            font_face.render_glyphs(glyph_indices, font_face_size, format=format)
+
+        # leave room for the padding around sdf glyphs
+        stride = size * 3 * 4
+        target = bytearray(stride * size * 4)
+
+        def render_into():
+            for glyph_index in glyph_indices:
+                font_face.render_glyph_into(
+                    glyph_index, font_face_size, target, 0, stride, format=format
+                )
+
+        def render_and_copy():
+            for glyph_index in glyph_indices:
+                rendered_glyph = font_face.render_glyph(glyph_index, font_face_size, format=format)
+                if not rendered_glyph.size.y:
+                    continue
+                data = memoryview(rendered_glyph.data)
+                row_size = len(data) // rendered_glyph.size.y
+                for y in range(rendered_glyph.size.y):
+                    target[y * stride : y * stride + row_size] = data[
+                        y * row_size : (y + 1) * row_size
+                    ]
+
+        results = [
+            min(timeit_repeat(f, number=1, repeat=repeat)) * 1_000_000 / len(glyph_indices)
+            for f in (render, render_batch, render_and_copy, render_into)
+        ]
+        click.echo(
+            f"{format.name:>6}: {results[0]:.1f}us per glyph, "
+            f"{results[1]:.1f}us per glyph batched, "
+            f"{results[2]:.1f}us per glyph rendered then copied into a buffer, "
+            f"{results[3]:.1f}us per glyph rendered into a buffer"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+__all__ = ()
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat as timeit_repeat
+
+import click
+
+from etypography import FontFace
+from etypography import RenderedGlyphCacheFile
+from etypography import RenderedGlyphFormat
+
+BENCHMARK_DIRECTORY = Path(__file__).parent
+CHARACTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--font",
+    type=click.Path(exists=True, dir_okay=False),
+    default=BENCHMARK_DIRECTORY / "../examples/resources/OpenSans-Regular.ttf",
+    show_default=True,
+    help="The font file to render.",
+)
+@click.option("--size", type=click.INT, default=32, show_default=True)
+@click.option(
+    "--format",
+    type=click.Choice([f.name for f in RenderedGlyphFormat]),
+    default=RenderedGlyphFormat.SDF.name,
+    show_default=True,
+)
+@click.option("--repeat", type=click.INT, default=5, show_default=True)
+def main(font, size, format, repeat):
+    format = RenderedGlyphFormat[format]
+    font_face = FontFace.from_path(font)
+    font_face_size = font_face.request_pixel_size(height=size)
+
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / "glyphs.cache"
+        with RenderedGlyphCacheFile(path) as cache:
+            for character in CHARACTERS:
+                cache.render_glyph(character, font_face_size, format=format)
+
+        def render():
+            for character in CHARACTERS:
+                font_face.render_glyph(character, font_face_size, format=format)
+
+        def load():
+            # opening the file is included, as it would be at the startup of a process
+            with RenderedGlyphCacheFile(path) as cache:
+                for character in CHARACTERS:
+                    cache.render_glyph(character, font_face_size, format=format)
+
+        for name, f in (("render", render), ("cache file", load)):
+            result = min(timeit_repeat(f, number=1, repeat=repeat))
+            click.echo(f"{name:>10}: {result * 1000:.2f}ms for {len(CHARACTERS)} glyphs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+__all__ = ()
+
+from timeit import repeat as timeit_repeat
+from unicodedata import category as unicode_category
+
+import click
+
+from etypography import character_is_normally_rendered
+from etypography import rendered_mask
+
+TEXTS = (
+    "hello world",
+    "the quick brown fox jumps over the lazy dog",
+    "there is a\nnewline",
+    "こんにちは、世界",
+    "emoji \U0001f600",
+)
+
+
+@click.command()
+@click.option("--strings", type=click.INT, default=100000, show_default=True)
+@click.option("--repeat", type=click.INT, default=5, show_default=True)
+def main(strings, repeat):
+    texts = [TEXTS[i % len(TEXTS)] for i in range(strings)]
+    characters = sum(len(text) for text in texts)
+
+    for name, f in (
+        (
+            "unicodedata.category",
+            lambda: [[unicode_category(c)[0] not in "CZ" for c in text] for text in texts],
+        ),
+        (
+            "character_is_normally_rendered",
+            lambda: [[character_is_normally_rendered(c) for c in text] for text in texts],
+        ),
+        ("rendered_mask", lambda: [rendered_mask(text) for text in texts]),
+    ):
+        result = min(timeit_repeat(f, number=1, repeat=repeat)) * 1000
+        click.echo(f"{name}: {result:.1f}ms ({result * 1000000 / characters:.1f}ns per character)")
+
+
+if __name__ == "__main__":
+    main()
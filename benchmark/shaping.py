@@ -0,0 +1,118 @@
+__all__ = ()
+
+from pathlib import Path
+from timeit import repeat as timeit_repeat
+
+import click
+
+from etypography import FontFace
+from etypography import ShapingCache
+from etypography import TextGlyphMetrics
+from etypography import TextShaping
+from etypography import break_text_icu_line
+
+BENCHMARK_DIRECTORY = Path(__file__).parent
+WORDS = "the quick brown fox jumps over the lazy dog and keeps running".split()
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--font",
+    type=click.Path(exists=True, dir_okay=False),
+    default=BENCHMARK_DIRECTORY / "../examples/resources/OpenSans-Regular.ttf",
+    show_default=True,
+    help="The font file to layout with.",
+)
+@click.option("--words", type=click.INT, default=10000, show_default=True)
+@click.option("--repeat", type=click.INT, default=5, show_default=True)
+def main(font, words, repeat):
+    font_face = FontFace.from_path(font)
+    font_face_size = font_face.request_pixel_size(height=16)
+    text = " ".join(WORDS[i % len(WORDS)] for i in range(words))
+
+    # warm the glyph metrics cache so that only shaping is being compared
+    font_face_size.layout_text(text, break_text=break_text_icu_line)
+
+    results = {}
+    for shaping in TextShaping:
+        results[shaping] = min(
+            timeit_repeat(
+                lambda: font_face_size.layout_text(
+                    text, break_text=break_text_icu_line, shaping=shaping
+                ),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        click.echo(f"{shaping.value:>8}: {results[shaping] * 1000:.1f}ms")
+    click.echo(f"speedup: {results[TextShaping.CHUNK] / results[TextShaping.RUN]:.2f}x")
+
+    # the cache is warmed by the first repetition, so the best time is a relayout
+    shaping_cache = ShapingCache()
+    cached = min(
+        timeit_repeat(
+            lambda: font_face_size.layout_text(
+                text, break_text=break_text_icu_line, shaping_cache=shaping_cache
+            ),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    click.echo(f"  cached: {cached * 1000:.1f}ms")
+    click.echo(f"speedup: {results[TextShaping.CHUNK] / cached:.2f}x")
+    click.echo(f"shaping cache: {shaping_cache.info}")
+
+    # characters that harfbuzz would shape as just their nominal glyph skip it entirely
+    font_face_size.enable_simple_shaping()
+    simple = min(
+        timeit_repeat(
+            lambda: font_face_size.layout_text(text, break_text=break_text_icu_line),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    font_face_size.disable_simple_shaping()
+    click.echo(f"  simple: {simple * 1000:.1f}ms")
+    click.echo(f"speedup: {results[TextShaping.CHUNK] / simple:.2f}x")
+
+    # glyph sizes from harfbuzz rather than loading each glyph with freetype, timed without the
+    # glyph metrics caches on text with many distinct glyphs
+    latin_text = " ".join(chr(c) * 4 for c in range(0x21, 0x250))
+    for glyph_metrics in TextGlyphMetrics:
+
+        def layout_uncached():
+            font_face_size.clear_glyph_metrics_cache()
+            font_face_size.layout_text(
+                latin_text, break_text=break_text_icu_line, glyph_metrics=glyph_metrics
+            )
+
+        result = min(timeit_repeat(layout_uncached, number=1, repeat=repeat))
+        click.echo(f"{glyph_metrics.value:>8}: {result * 1000:.1f}ms with cold glyph metrics")
+
+    # laying out the same text at many new sizes, as a zoomable canvas would, with the text
+    # either shaped at each size or shaped once and scaled to each size
+    sizes = [font_face.request_pixel_size(height=h) for h in range(8, 72, 4)]
+    for scale_independent in (False, True):
+        shaping_cache = ShapingCache(scale_independent=scale_independent)
+        for size in sizes:
+            size.layout_text(text, break_text=break_text_icu_line)
+
+        def layout_sizes():
+            for size in sizes:
+                size.layout_text(
+                    text,
+                    break_text=break_text_icu_line,
+                    shaping=TextShaping.RUN,
+                    shaping_cache=shaping_cache,
+                )
+
+        result = min(timeit_repeat(layout_sizes, number=1, repeat=1))
+        click.echo(
+            f"{len(sizes)} sizes, scale independent={scale_independent}: {result * 1000:.1f}ms "
+            f"cold, {shaping_cache.info}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from PIL import Image
 from etypography import Font
 from etypography import FontFace
 from etypography import PrimaryAxisTextAlign
+from etypography import RenderedGlyphCache
 from etypography import SecondaryAxisTextAlign
 from etypography import break_text_icu_line
 
@@ -82,8 +83,7 @@ def main(
 ):
     text = text.replace(r"\n", "\n")
 
-    with open(font, "rb") as font_file:
-        font_face = FontFace(font_file)
+    font_face = FontFace.from_path(font)
 
     size_value, size_type = size
     if size_type == "px":
@@ -108,10 +108,11 @@ def main(
     )
     image = Image.new(mode="RGB", size=image_size)
 
+    rendered_glyph_cache = RenderedGlyphCache()
     for text_glyph in text_layout.glyphs:
         if not text_glyph.is_rendered:
             continue
-        rendered_glyph = font_face.render_glyph(text_glyph.glyph_index, font_face_size)
+        rendered_glyph = rendered_glyph_cache.render_glyph(text_glyph.glyph_index, font_face_size)
         image_glyph = Image.frombytes("L", tuple(rendered_glyph.size), rendered_glyph.data)
         image.paste(
             image_glyph,
@@ -0,0 +1,327 @@
+__all__ = ()
+
+import base64
+import zlib
+from ctypes import c_char_p
+from ctypes import c_int32
+from pathlib import Path
+
+import click
+
+from etypography._break_text import _get_icu
+
+SCRIPT_DIRECTORY = Path(__file__).parent
+MAX_CODE_POINT = 0x10FFFF
+
+# icu property identifiers and values
+UCHAR_EXTENDED_PICTOGRAPHIC = 64
+UCHAR_EAST_ASIAN_WIDTH = 0x1004
+UCHAR_GENERAL_CATEGORY = 0x1005
+UCHAR_LINE_BREAK = 0x1008
+UCHAR_SCRIPT = 0x100A
+U_UNASSIGNED = 0
+U_NON_SPACING_MARK = 6
+U_COMBINING_SPACING_MARK = 8
+U_EA_HALFWIDTH = 2
+U_EA_FULLWIDTH = 3
+U_EA_WIDE = 5
+
+# icu's general category values, in the order of its UCharCategory enum
+ICU_GENERAL_CATEGORIES = (
+    "Cn Lu Ll Lt Lm Lo Mn Me Mc Nd Nl No Zs Zl Zp Cc Cf Co Cs Pd Ps Pe Pc Po Sm Sc Sk So Pi Pf"
+).split()
+
+# icu's line break property values, in the order of its ULineBreak enum
+ICU_LINE_BREAK_CLASSES = (
+    "XX AI AL B2 BA BB BK CB CL CM CR EX GL HY ID IN IS LF NS NU OP PO PR QU SA SG SP SY ZW NL WJ "
+    "H2 H3 JL JT JV CP CJ HL RI EB EM ZWJ"
+).split()
+
+# the classes after the resolution of lb1, with a few split by the context they're used in:
+# - OP_EA and CP_EA are the east asian opening and closing punctuation that lb30 excludes
+# - EP is the unassigned extended pictographic code points, which are ID, that lb30b includes
+# - HH is the hyphen, which is BA, that icu's word initial hyphen rule includes
+# - SOT is the start of the text, no code points have it
+LINE_BREAK_CLASSES = (
+    "BK CR LF NL SP ZW CM ZWJ WJ GL CL CP CP_EA EX IS SY OP OP_EA QU NS B2 BA HH BB HY CB IN HL "
+    "AL NU PR PO ID EP EB EM H2 H3 JL JV JT RI SOT"
+).split()
+LINE_BREAK_CLASS_ALIASES = {"CP_EA": "CP", "OP_EA": "OP", "EP": "ID", "HH": "BA"}
+
+# the actions of the pair table
+DIRECT = 0
+INDIRECT = 1
+PROHIBITED = 2
+
+
+def get_u_getIntPropertyValue(icuuc, postfix):
+    u_getIntPropertyValue = getattr(icuuc, f"u_getIntPropertyValue{postfix}")
+    u_getIntPropertyValue.argtypes = [c_int32, c_int32]
+    u_getIntPropertyValue.restype = c_int32
+    return u_getIntPropertyValue
+
+
+def get_property_values(u_getIntPropertyValue, property):
+    return bytes(
+        u_getIntPropertyValue(code_point, property) for code_point in range(MAX_CODE_POINT + 1)
+    )
+
+
+def get_script_names(icuuc, postfix, scripts):
+    uscript_getShortName = getattr(icuuc, f"uscript_getShortName{postfix}")
+    uscript_getShortName.argtypes = [c_int32]
+    uscript_getShortName.restype = c_char_p
+    return tuple(
+        uscript_getShortName(script).decode("ascii") for script in range(max(scripts) + 1)
+    )
+
+
+def get_line_break_classes(u_getIntPropertyValue):
+    classes = bytearray(MAX_CODE_POINT + 1)
+    for code_point in range(MAX_CODE_POINT + 1):
+        name = ICU_LINE_BREAK_CLASSES[u_getIntPropertyValue(code_point, UCHAR_LINE_BREAK)]
+        general_category = u_getIntPropertyValue(code_point, UCHAR_GENERAL_CATEGORY)
+        # lb1
+        if name in ("AI", "SG", "XX"):
+            name = "AL"
+        elif name == "SA":
+            name = (
+                "CM"
+                if general_category in (U_NON_SPACING_MARK, U_COMBINING_SPACING_MARK)
+                else "AL"
+            )
+        elif name == "CJ":
+            name = "NS"
+        # lb20a as icu implements it, lb30 and lb30b
+        if code_point == 0x2010:
+            name = "HH"
+        elif name in ("OP", "CP") and u_getIntPropertyValue(
+            code_point, UCHAR_EAST_ASIAN_WIDTH
+        ) in (U_EA_HALFWIDTH, U_EA_FULLWIDTH, U_EA_WIDE):
+            name += "_EA"
+        elif (
+            name == "ID"
+            and general_category == U_UNASSIGNED
+            and u_getIntPropertyValue(code_point, UCHAR_EXTENDED_PICTOGRAPHIC)
+        ):
+            name = "EP"
+        classes[code_point] = LINE_BREAK_CLASSES.index(name)
+    return bytes(classes)
+
+
+def is_pair_break(before, after, spaces):
+    # the rules of uax 14 that depend only on the class before, ignoring spaces, and the class
+    # after, the rules that need more context than that are applied as the text is broken
+    def is_(c, *names):
+        return c in names or LINE_BREAK_CLASS_ALIASES.get(c) in names
+
+    # lb11
+    if is_(after, "WJ") or (not spaces and is_(before, "WJ")):
+        return False
+    # lb12 and lb12a
+    if not spaces and (is_(before, "GL") or (is_(after, "GL") and not is_(before, "BA", "HY"))):
+        return False
+    # lb13
+    if is_(after, "CL", "CP", "EX", "IS", "SY"):
+        return False
+    # lb14, lb15, lb16 and lb17
+    if (
+        is_(before, "OP")
+        or (is_(before, "QU") and is_(after, "OP"))
+        or (is_(before, "CL", "CP") and is_(after, "NS"))
+        or (is_(before, "B2") and is_(after, "B2"))
+    ):
+        return False
+    # lb18
+    if spaces:
+        return True
+    # lb19
+    if is_(before, "QU") or is_(after, "QU"):
+        return False
+    # lb20
+    if is_(before, "CB") or is_(after, "CB"):
+        return True
+    # lb21 and lb21b
+    if (
+        is_(after, "BA", "HY", "NS")
+        or is_(before, "BB")
+        or (is_(before, "SY") and is_(after, "HL"))
+    ):
+        return False
+    # lb22
+    if is_(after, "IN"):
+        return False
+    # lb23 and lb23a
+    if (is_(before, "AL", "HL") and is_(after, "NU")) or (
+        is_(before, "NU") and is_(after, "AL", "HL")
+    ):
+        return False
+    if (is_(before, "PR") and is_(after, "ID", "EB", "EM")) or (
+        is_(before, "ID", "EB", "EM") and is_(after, "PO")
+    ):
+        return False
+    # lb24
+    if (is_(before, "PR", "PO") and is_(after, "AL", "HL")) or (
+        is_(before, "AL", "HL") and is_(after, "PR", "PO")
+    ):
+        return False
+    # lb25, the parts of the number expression that are pairs
+    if is_(after, "NU") and is_(before, "PR", "PO", "OP", "HY", "IS", "NU"):
+        return False
+    # lb26 and lb27
+    if (
+        (is_(before, "JL") and is_(after, "JL", "JV", "H2", "H3"))
+        or (is_(before, "JV", "H2") and is_(after, "JV", "JT"))
+        or (is_(before, "JT", "H3") and is_(after, "JT"))
+        or (is_(before, "JL", "JV", "JT", "H2", "H3") and is_(after, "PO"))
+        or (is_(before, "PR") and is_(after, "JL", "JV", "JT", "H2", "H3"))
+    ):
+        return False
+    # lb28 and lb29
+    if is_(after, "AL", "HL") and is_(before, "AL", "HL", "IS"):
+        return False
+    # lb30
+    if (before in ("AL", "HL", "NU") and after == "OP") or (
+        before == "CP" and after in ("AL", "HL", "NU")
+    ):
+        return False
+    # lb30b
+    if before in ("EB", "EP") and after == "EM":
+        return False
+    # lb31
+    return True
+
+
+def get_line_break_pairs():
+    pairs = bytearray()
+    for before in LINE_BREAK_CLASSES:
+        for after in LINE_BREAK_CLASSES:
+            if is_pair_break(before, after, False):
+                action = DIRECT
+            elif is_pair_break(before, after, True):
+                action = INDIRECT
+            else:
+                action = PROHIBITED
+            pairs.append(action)
+    return bytes(pairs)
+
+
+def get_two_stage_table(values):
+    # the values are split into blocks and identical blocks are stored once, the block size that
+    # gives the smallest table is used
+    best = None
+    for shift in range(4, 11):
+        block_size = 1 << shift
+        block_indices = {}
+        stage_1 = []
+        stage_2 = bytearray()
+        for start in range(0, len(values), block_size):
+            block = values[start : start + block_size]
+            block_index = block_indices.get(block)
+            if block_index is None:
+                block_index = block_indices[block] = len(block_indices)
+                stage_2 += block
+            stage_1.append(block_index)
+        size = len(stage_1) * 2 + len(stage_2)
+        if best is None or size < best[0]:
+            best = (size, shift, stage_1, bytes(stage_2))
+    _, shift, stage_1, stage_2 = best
+    assert len(stage_2) >> shift < 0x10000
+    return shift, b"".join(i.to_bytes(2, "little") for i in stage_1), stage_2
+
+
+def format_data(name, data, decode="_decode"):
+    encoded = base64.b85encode(zlib.compress(data, 9)).decode("ascii")
+    lines = [encoded[i : i + 88] for i in range(0, len(encoded), 88)]
+    return "\n".join((f"{name}: Final = {decode}(", *(f'    "{line}"' for line in lines), ")"))
+
+
+@click.command()
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False),
+    default=SCRIPT_DIRECTORY / "../src/etypography/_unicode_tables.py",
+    show_default=True,
+)
+def main(output):
+    icu = _get_icu()
+    u_getIntPropertyValue = get_u_getIntPropertyValue(icu.icuuc, icu.postfix)
+
+    line_break_shift, line_break_stage_1, line_break_stage_2 = get_two_stage_table(
+        get_line_break_classes(u_getIntPropertyValue)
+    )
+    general_category_shift, general_category_stage_1, general_category_stage_2 = (
+        get_two_stage_table(get_property_values(u_getIntPropertyValue, UCHAR_GENERAL_CATEGORY))
+    )
+    scripts = get_property_values(u_getIntPropertyValue, UCHAR_SCRIPT)
+    script_names = get_script_names(icu.icuuc, icu.postfix, scripts)
+    script_shift, script_stage_1, script_stage_2 = get_two_stage_table(scripts)
+
+    source = [
+        "# generated by scripts/generate_unicode_tables.py, do not edit",
+        "from __future__ import annotations",
+        "",
+        "__all__ = ()",
+        "",
+        "import sys",
+        "import zlib",
+        "from array import array",
+        "from base64 import b85decode",
+        "from typing import Final",
+        "",
+        "",
+        "def _decode(data: str) -> bytes:",
+        '    return zlib.decompress(b85decode(data.encode("ascii")))',
+        "",
+        "",
+        "def _decode_u16s(data: str) -> array[int]:",
+        '    values = array("H")',
+        "    values.frombytes(_decode(data))",
+        '    if sys.byteorder == "big":',
+        "        values.byteswap()",
+        "    return values",
+        "",
+        "",
+        f'UNICODE_VERSION: Final = "{icu.unicode_version}"',
+        "",
+        *(f"LB_{name}: Final = {i}" for i, name in enumerate(LINE_BREAK_CLASSES)),
+        f"LB_CLASS_COUNT: Final = {len(LINE_BREAK_CLASSES)}",
+        f"LB_DIRECT: Final = {DIRECT}",
+        f"LB_INDIRECT: Final = {INDIRECT}",
+        f"LB_PROHIBITED: Final = {PROHIBITED}",
+        "",
+        "# the pair table gives the action for a class before, ignoring spaces, and a class after at",
+        "# lb_class_count * before + after",
+        format_data("LB_PAIRS", get_line_break_pairs()),
+        "",
+        "# the line break class of a code point is",
+        "# lb_stage_2[lb_stage_1[code_point >> lb_shift] << lb_shift | code_point & lb_mask]",
+        f"LB_SHIFT: Final = {line_break_shift}",
+        f"LB_MASK: Final = {(1 << line_break_shift) - 1}",
+        format_data("LB_STAGE_1", line_break_stage_1, "_decode_u16s"),
+        format_data("LB_STAGE_2", line_break_stage_2),
+        "",
+        "# the general category of a code point is",
+        "# gc_names[gc_stage_2[gc_stage_1[code_point >> gc_shift] << gc_shift | code_point & gc_mask]]",
+        f"GC_NAMES: Final = {tuple(ICU_GENERAL_CATEGORIES)!r}",
+        f"GC_SHIFT: Final = {general_category_shift}",
+        f"GC_MASK: Final = {(1 << general_category_shift) - 1}",
+        format_data("GC_STAGE_1", general_category_stage_1, "_decode_u16s"),
+        format_data("GC_STAGE_2", general_category_stage_2),
+        "",
+        "# the script of a code point, as its iso 15924 code, is",
+        "# script_names[script_stage_2[script_stage_1[code_point >> script_shift] << script_shift |",
+        "# code_point & script_mask]]",
+        f"SCRIPT_NAMES: Final = {script_names!r}",
+        f"SCRIPT_SHIFT: Final = {script_shift}",
+        f"SCRIPT_MASK: Final = {(1 << script_shift) - 1}",
+        format_data("SCRIPT_STAGE_1", script_stage_1, "_decode_u16s"),
+        format_data("SCRIPT_STAGE_2", script_stage_2),
+        "",
+    ]
+    Path(output).write_text("\n".join(source), encoding="utf8")
+
+
+if __name__ == "__main__":
+    main()
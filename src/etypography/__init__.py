@@ -1,38 +1,133 @@
 __all__ = [
     "BreakText",
     "BreakTextChunk",
+    "BreakTextOffsets",
+    "CacheInfo",
     "break_text_never",
     "break_text_icu_line",
+    "break_text_icu_line_offsets",
+    "break_text_uax14_line",
+    "break_text_uax14_line_offsets",
     "character_is_normally_rendered",
     "Font",
     "FontFace",
     "FontFaceSize",
+    "get_character_general_category",
+    "get_character_script",
+    "GlyphAtlas",
+    "GlyphAtlasGlyph",
     "layout_text",
+    "render_glyphs_parallel",
     "PrimaryAxisTextAlign",
     "RenderedGlyph",
+    "RenderedGlyphCache",
+    "RenderedGlyphCacheFile",
     "RenderedGlyphFormat",
+    "RenderedGlyphs",
+    "rendered_mask",
     "RichText",
     "SecondaryAxisTextAlign",
+    "ShapingCache",
+    "SharedRenderedGlyphCache",
     "TextLayout",
     "TextLine",
     "TextGlyph",
+    "TextGlyphMetrics",
+    "TextShaping",
 ]
 
+# python
+from importlib import import_module
 
-from ._break_text import BreakText
-from ._break_text import BreakTextChunk
-from ._break_text import break_text_icu_line
-from ._break_text import break_text_never
-from ._font import Font
-from ._font_face import FontFace
-from ._font_face import FontFaceSize
-from ._font_face import PrimaryAxisTextAlign
-from ._font_face import RenderedGlyph
-from ._font_face import RenderedGlyphFormat
-from ._font_face import RichText
-from ._font_face import SecondaryAxisTextAlign
-from ._font_face import TextGlyph
-from ._font_face import TextLayout
-from ._font_face import TextLine
-from ._font_face import layout_text
-from ._unicode import character_is_normally_rendered
+# typing isn't imported so that it's not paid for on import, type checkers treat this as true
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from ._break_text import BreakText
+    from ._break_text import BreakTextChunk
+    from ._break_text import BreakTextOffsets
+    from ._break_text import break_text_icu_line
+    from ._break_text import break_text_icu_line_offsets
+    from ._break_text import break_text_never
+    from ._cache import CacheInfo
+    from ._font import Font
+    from ._font_face import FontFace
+    from ._font_face import FontFaceSize
+    from ._font_face import PrimaryAxisTextAlign
+    from ._font_face import RenderedGlyph
+    from ._font_face import RenderedGlyphFormat
+    from ._font_face import RenderedGlyphs
+    from ._font_face import RichText
+    from ._font_face import SecondaryAxisTextAlign
+    from ._font_face import ShapingCache
+    from ._font_face import TextGlyph
+    from ._font_face import TextGlyphMetrics
+    from ._font_face import TextLayout
+    from ._font_face import TextLine
+    from ._font_face import TextShaping
+    from ._font_face import layout_text
+    from ._glyph_atlas import GlyphAtlas
+    from ._glyph_atlas import GlyphAtlasGlyph
+    from ._line_break import break_text_uax14_line
+    from ._line_break import break_text_uax14_line_offsets
+    from ._parallel import render_glyphs_parallel
+    from ._rendered_glyph_cache import RenderedGlyphCache
+    from ._rendered_glyph_cache_file import RenderedGlyphCacheFile
+    from ._shared_rendered_glyph_cache import SharedRenderedGlyphCache
+    from ._unicode import character_is_normally_rendered
+    from ._unicode import get_character_general_category
+    from ._unicode import get_character_script
+    from ._unicode import rendered_mask
+
+# the attributes are imported from their modules as they're first used, so that importing the
+# package doesn't load freetype, harfbuzz or icu
+_ATTRIBUTE_MODULES = {
+    "BreakText": "_break_text",
+    "BreakTextChunk": "_break_text",
+    "BreakTextOffsets": "_break_text",
+    "break_text_icu_line": "_break_text",
+    "break_text_icu_line_offsets": "_break_text",
+    "break_text_never": "_break_text",
+    "CacheInfo": "_cache",
+    "Font": "_font",
+    "FontFace": "_font_face",
+    "FontFaceSize": "_font_face",
+    "PrimaryAxisTextAlign": "_font_face",
+    "RenderedGlyph": "_font_face",
+    "RenderedGlyphFormat": "_font_face",
+    "RenderedGlyphs": "_font_face",
+    "RichText": "_font_face",
+    "SecondaryAxisTextAlign": "_font_face",
+    "ShapingCache": "_font_face",
+    "TextGlyph": "_font_face",
+    "TextGlyphMetrics": "_font_face",
+    "TextLayout": "_font_face",
+    "TextLine": "_font_face",
+    "TextShaping": "_font_face",
+    "layout_text": "_font_face",
+    "GlyphAtlas": "_glyph_atlas",
+    "GlyphAtlasGlyph": "_glyph_atlas",
+    "break_text_uax14_line": "_line_break",
+    "break_text_uax14_line_offsets": "_line_break",
+    "render_glyphs_parallel": "_parallel",
+    "RenderedGlyphCache": "_rendered_glyph_cache",
+    "RenderedGlyphCacheFile": "_rendered_glyph_cache_file",
+    "SharedRenderedGlyphCache": "_shared_rendered_glyph_cache",
+    "character_is_normally_rendered": "_unicode",
+    "get_character_general_category": "_unicode",
+    "get_character_script": "_unicode",
+    "rendered_mask": "_unicode",
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name = _ATTRIBUTE_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
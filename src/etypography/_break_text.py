@@ -1,20 +1,28 @@
 from __future__ import annotations
 
-__all__ = ["BreakText", "BreakTextChunk", "break_text_never", "break_text_icu_line"]
+__all__ = [
+    "BreakText",
+    "BreakTextChunk",
+    "BreakTextOffsets",
+    "break_text_never",
+    "break_text_icu_line",
+    "break_text_icu_line_offsets",
+]
 
 # python
 import os
-import subprocess
+import sys
+from array import array
 from ctypes import CDLL
 from ctypes import POINTER
 from ctypes import byref
 from ctypes import c_char_p
 from ctypes import c_int
 from ctypes import c_int32
-from ctypes import c_int64
+from ctypes import c_ubyte
 from ctypes import c_void_p
-from platform import system
-from typing import Any
+from threading import Lock
+from threading import local
 from typing import Callable
 from typing import Final
 from typing import Generator
@@ -27,6 +35,12 @@ class BreakTextChunk(NamedTuple):
     force_break: bool
 
 
+class BreakTextOffsets(NamedTuple):
+    # the code point offset that each chunk ends at and whether there must be a break there
+    offsets: array[int]
+    force_breaks: array[int]
+
+
 BreakText: TypeAlias = Callable[[str], Generator[BreakTextChunk, None, None]]
 
 
@@ -37,113 +51,160 @@ def break_text_never(text: str) -> Generator[BreakTextChunk, None, None]:
 
 
 def break_text_icu_line(text: str) -> Generator[BreakTextChunk, None, None]:
-    with _UBreakIterator(text) as u_break_iterator:
-        yield from u_break_iterator
+    start = 0
+    for end, force_break in zip(*break_text_icu_line_offsets(text)):
+        yield BreakTextChunk(text[start:end], bool(force_break))
+        start = end
 
 
-if system() == "Windows":
-    _LIB_NAME = "icuuc.dll"
-    _POSTFIX = ""
-else:
-    if system() == "Darwin":
-        _HOMEBREW_REPOSITORY = os.environ.get("HOMEBREW_REPOSITORY", "/usr/local")
-        _LIB_NAME = f"{_HOMEBREW_REPOSITORY}/opt/icu4c/lib/libicuuc.dylib"
-        _UCONV_NAME = f"{_HOMEBREW_REPOSITORY}/opt/icu4c/bin/uconv"
-    else:
-        _LIB_NAME = "libicuuc.so"
-        _UCONV_NAME = "uconv"
-    _uconv_result = subprocess.run([_UCONV_NAME, "-V"], capture_output=True, check=True)
-    _POSTFIX = "_" + _uconv_result.stdout.decode("utf8").split(" ")[-1].split(".")[0]
-
+def break_text_icu_line_offsets(text: str) -> BreakTextOffsets:
+    offsets = array("I")
+    force_breaks = array("B")
+    if not text:
+        return BreakTextOffsets(offsets, force_breaks)
+
+    # icu works in utf-16 code units, surrogates are passed through so that the offsets still line
+    # up with the text
+    utf16_text = text.encode("utf-16-le", "surrogatepass")
+    utf16_length = len(utf16_text) // 2
+    icu = _get_icu()
+    u_break_iterator = _get_line_break_iterator(icu, icu.default_locale)
+    # resetting the iterator wraps the utf-16 text in a utext without copying it
+    error = c_int()
+    icu.ubrk_setText(u_break_iterator, utf16_text, utf16_length, byref(error))
+    if error.value > _U_ZERO_ERROR:
+        raise RuntimeError(f"icu ubrk_setText error: {error.value}")
+
+    ubrk_next = icu.ubrk_next
+    ubrk_get_rule_status = icu.ubrk_getRuleStatus
+    append_offset = offsets.append
+    append_force_break = force_breaks.append
+    while True:
+        offset = ubrk_next(u_break_iterator)
+        if offset == _UBRK_DONE:
+            break
+        append_offset(offset)
+        append_force_break(ubrk_get_rule_status(u_break_iterator) == _UBRK_LINE_HARD)
+
+    if utf16_length != len(text):
+        # the text has characters outside of the bmp, which take up 2 code units each, breaks
+        # never fall between the 2 units so only the first needs to be mapped
+        code_point_offsets = array("I")
+        for i, character in enumerate(text):
+            code_point_offsets.append(i)
+            if ord(character) > 0xFFFF:
+                code_point_offsets.append(i)
+        code_point_offsets.append(len(text))
+        offsets = array("I", (code_point_offsets[offset] for offset in offsets))
+
+    return BreakTextOffsets(offsets, force_breaks)
 
-_icuuc = CDLL(_LIB_NAME)
 
 _UBRK_LINE: Final = 2
 _U_ZERO_ERROR: Final = 0
 _UBRK_DONE: Final = -1
 _UBRK_LINE_HARD: Final = 100
 
-_uloc_getDefault = getattr(_icuuc, f"uloc_getDefault{_POSTFIX}")
-_uloc_getDefault.restype = c_char_p
-
-_utext_openUTF8 = getattr(_icuuc, f"utext_openUTF8{_POSTFIX}")
-_utext_openUTF8.argtypes = [c_void_p, c_char_p, c_int64, POINTER(c_int)]
-_utext_openUTF8.restype = c_void_p
-
-_utext_close = getattr(_icuuc, f"utext_close{_POSTFIX}")
-_utext_close.argtypes = [c_void_p]
-
-_ubrk_open = getattr(_icuuc, f"ubrk_open{_POSTFIX}")
-_ubrk_open.argtypes = [c_int, c_char_p, c_void_p, c_int32, POINTER(c_int)]
-_ubrk_open.restype = c_void_p
-
-_ubrk_setUText = getattr(_icuuc, f"ubrk_setUText{_POSTFIX}")
-_ubrk_setUText.argtypes = [c_void_p, c_void_p, POINTER(c_int)]
-
-_ubrk_first = getattr(_icuuc, f"ubrk_first{_POSTFIX}")
-_ubrk_first.argtypes = [c_void_p]
-
-_ubrk_next = getattr(_icuuc, f"ubrk_next{_POSTFIX}")
-_ubrk_next.argtypes = [c_void_p]
-_ubrk_next.restype = c_int32
-
-_ubrk_getRuleStatus = getattr(_icuuc, f"ubrk_getRuleStatus{_POSTFIX}")
-_ubrk_getRuleStatus.argtypes = [c_void_p]
-_ubrk_getRuleStatus.restype = c_int32
-
-_ubrk_close = getattr(_icuuc, f"ubrk_close{_POSTFIX}")
-_ubrk_close.argtypes = [c_void_p]
-
-_DEFAULT_ULOC: Final = _uloc_getDefault()
-
-
-class _UBreakIterator:
-    _previous_chunk_index: int = 0
-    _urbrk: c_void_p | None = None
-    _c_text: c_char_p | None = None
-
-    def __init__(self, text: str) -> None:
-        self._utf8_text = text.encode("utf8")
-
-    def __iter__(self) -> _UBreakIterator:
-        return self
-
-    def __next__(self) -> BreakTextChunk:
-        next_chunk_index = _ubrk_next(self._urbrk)
-        if next_chunk_index == _UBRK_DONE:
-            raise StopIteration()
-
-        chunk = self._utf8_text[self._previous_chunk_index : next_chunk_index]
-        hard_break = _ubrk_getRuleStatus(self._urbrk) == _UBRK_LINE_HARD
-        self._previous_chunk_index = next_chunk_index
-
-        return BreakTextChunk(chunk.decode("utf8"), hard_break)
-
-    def __enter__(self) -> _UBreakIterator:
-        error = c_int()
-
-        self._c_text = c_char_p(self._utf8_text)
-
-        self._urbrk = _ubrk_open(_UBRK_LINE, _DEFAULT_ULOC, 0, 0, byref(error))
-        if error.value > _U_ZERO_ERROR:
-            self._urbrk = None
-            raise RuntimeError("icu ubrk_open error: {error.value}")
-
-        utext = _utext_openUTF8(0, self._c_text, len(self._utf8_text), byref(error))
-        if error.value > _U_ZERO_ERROR:
-            raise RuntimeError("icu utext_openUTF8 error: {error.value}")
-        try:
-            _ubrk_setUText(self._urbrk, utext, byref(error))
-            if error.value > _U_ZERO_ERROR:
-                raise RuntimeError("icu ubrk_setUText error: {error.value}")
-        finally:
-            _utext_close(utext)
-
-        return self
-
-    def __exit__(self, *args: Any, **kwargs: Any) -> None:
-        if self._urbrk is not None:
-            _ubrk_close(self._urbrk)
-            self._urbrk = None
-
-        self._c_text = None
+# icu appends its major version to the names of its exported functions, unless it was built
+# without renaming, the major versions are searched from the first to use a plain number
+_ICU_MAJOR_VERSIONS: Final = range(49, 256)
+
+
+class _Icu:
+    def __init__(self) -> None:
+        if sys.platform == "win32":
+            lib_name = "icuuc.dll"
+        elif sys.platform == "darwin":
+            homebrew_repository = os.environ.get("HOMEBREW_REPOSITORY", "/usr/local")
+            lib_name = f"{homebrew_repository}/opt/icu4c/lib/libicuuc.dylib"
+        else:
+            lib_name = "libicuuc.so"
+        self.icuuc = icuuc = CDLL(lib_name)
+        self.postfix = postfix = _get_icu_postfix(icuuc)
+
+        u_getUnicodeVersion = getattr(icuuc, f"u_getUnicodeVersion{postfix}")
+        u_getUnicodeVersion.argtypes = [c_void_p]
+        unicode_version = (c_ubyte * 4)()
+        u_getUnicodeVersion(unicode_version)
+        self.unicode_version = f"{unicode_version[0]}.{unicode_version[1]}"
+
+        uloc_getDefault = getattr(icuuc, f"uloc_getDefault{postfix}")
+        uloc_getDefault.restype = c_char_p
+        self.default_locale: bytes = uloc_getDefault()
+
+        self.ubrk_open = getattr(icuuc, f"ubrk_open{postfix}")
+        self.ubrk_open.argtypes = [c_int, c_char_p, c_void_p, c_int32, POINTER(c_int)]
+        self.ubrk_open.restype = c_void_p
+
+        self.ubrk_setText = getattr(icuuc, f"ubrk_setText{postfix}")
+        self.ubrk_setText.argtypes = [c_void_p, c_char_p, c_int32, POINTER(c_int)]
+
+        self.ubrk_next = getattr(icuuc, f"ubrk_next{postfix}")
+        self.ubrk_next.argtypes = [c_void_p]
+        self.ubrk_next.restype = c_int32
+
+        self.ubrk_getRuleStatus = getattr(icuuc, f"ubrk_getRuleStatus{postfix}")
+        self.ubrk_getRuleStatus.argtypes = [c_void_p]
+        self.ubrk_getRuleStatus.restype = c_int32
+
+        self.ubrk_close = getattr(icuuc, f"ubrk_close{postfix}")
+        self.ubrk_close.argtypes = [c_void_p]
+
+
+def _get_icu_postfix(icuuc: CDLL) -> str:
+    if hasattr(icuuc, "ubrk_open"):
+        return ""
+    for major_version in _ICU_MAJOR_VERSIONS:
+        postfix = f"_{major_version}"
+        if hasattr(icuuc, f"ubrk_open{postfix}"):
+            return postfix
+    raise RuntimeError("unable to find the icu version")
+
+
+_icu: _Icu | None = None
+_icu_lock = Lock()
+
+
+def _get_icu() -> _Icu:
+    # icu is only loaded once text is first broken, so that importing stays fast
+    global _icu
+    if _icu is None:
+        with _icu_lock:
+            if _icu is None:
+                _icu = _Icu()
+    return _icu
+
+
+class _LineBreakIterators(dict[bytes, int]):
+    # the line break iterators of a single thread keyed by their locale, they're closed when the
+    # thread ends
+    def __init__(self, icu: _Icu):
+        super().__init__()
+        self._icu = icu
+
+    def __del__(self) -> None:
+        for u_break_iterator in self.values():
+            self._icu.ubrk_close(u_break_iterator)
+
+
+_thread_data = local()
+
+
+def _get_line_break_iterator(icu: _Icu, locale: bytes) -> int:
+    # opening a break iterator means loading its rules, so each thread keeps one per locale and
+    # gives it new text instead, an iterator is never used across a yield so a thread only ever
+    # needs the one
+    try:
+        u_break_iterators = _thread_data.line_break_iterators
+    except AttributeError:
+        u_break_iterators = _thread_data.line_break_iterators = _LineBreakIterators(icu)
+    try:
+        return u_break_iterators[locale]
+    except KeyError:
+        pass
+    error = c_int()
+    u_break_iterator = icu.ubrk_open(_UBRK_LINE, locale, 0, 0, byref(error))
+    if error.value > _U_ZERO_ERROR:
+        raise RuntimeError(f"icu ubrk_open error: {error.value}")
+    u_break_iterators[locale] = u_break_iterator
+    return u_break_iterator
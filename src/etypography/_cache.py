@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+__all__ = ["CacheInfo"]
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable
+from typing import Generic
+from typing import Hashable
+from typing import NamedTuple
+from typing import TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int | None
+    current_size: int
+
+
+class _LruCache(Generic[_K, _V]):
+    def __init__(self, max_size: int | None, get_value_size: Callable[[_V], int] | None = None):
+        if max_size is not None and max_size < 0:
+            raise ValueError("max size must be 0 or greater")
+        self._max_size = max_size
+        self._get_value_size = get_value_size
+        self._values: OrderedDict[_K, tuple[_V, int]] = OrderedDict()
+        self._lock = Lock()
+        self._current_size = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: _K) -> _V | None:
+        with self._lock:
+            try:
+                value, _ = self._values[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._values.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: _K, value: _V) -> None:
+        value_size = 1 if self._get_value_size is None else self._get_value_size(value)
+        if self._max_size is not None and value_size > self._max_size:
+            return
+
+        with self._lock:
+            try:
+                _, old_value_size = self._values.pop(key)
+            except KeyError:
+                pass
+            else:
+                self._current_size -= old_value_size
+
+            self._values[key] = (value, value_size)
+            self._current_size += value_size
+
+            if self._max_size is not None:
+                while self._current_size > self._max_size:
+                    _, (_, evicted_value_size) = self._values.popitem(last=False)
+                    self._current_size -= evicted_value_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._current_size = 0
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._max_size, self._current_size)
@@ -3,8 +3,10 @@ from __future__ import annotations
 __all__ = ["Font"]
 
 from typing import Callable
+from typing import Iterable
 
 from emath import FVector2
+from emath import U32Array
 
 from ._break_text import BreakText
 from ._font_face import FontFace
@@ -13,7 +15,12 @@ from ._font_face import PrimaryAxisTextAlign
 from ._font_face import RenderedGlyph
 from ._font_face import RenderedGlyphFormat
 from ._font_face import SecondaryAxisTextAlign
+from ._font_face import ShapingCache
+from ._font_face import TextGlyphMetrics
 from ._font_face import TextLayout
+from ._font_face import TextShaping
+from ._font_face import _WarmGlyphAtlas
+from ._font_face import _WarmRenderedGlyphCache
 
 
 class Font:
@@ -26,6 +33,12 @@ class Font:
     def get_glyph_index(self, character: str) -> int:
         return self._size.face.get_glyph_index(character)
 
+    def get_glyph_indices(self, text: str) -> U32Array:
+        return self._size.face.get_glyph_indices(text)
+
+    def get_missing_characters(self, text: str) -> set[str]:
+        return self._size.face.get_missing_characters(text)
+
     def render_glyph(
         self, character: str | int, *, format: RenderedGlyphFormat | None = None
     ) -> RenderedGlyph:
@@ -42,6 +55,9 @@ class Font:
         primary_axis_alignment: PrimaryAxisTextAlign | None = None,
         secondary_axis_alignment: SecondaryAxisTextAlign | None = None,
         origin: FVector2 | None = None,
+        shaping: TextShaping | None = None,
+        shaping_cache: ShapingCache | None = None,
+        glyph_metrics: TextGlyphMetrics | None = None,
     ) -> TextLayout | None:
         return self._size.layout_text(
             text,
@@ -52,6 +68,26 @@ class Font:
             primary_axis_alignment=primary_axis_alignment,
             secondary_axis_alignment=secondary_axis_alignment,
             origin=origin,
+            shaping=shaping,
+            shaping_cache=shaping_cache,
+            glyph_metrics=glyph_metrics,
+        )
+
+    def warm(
+        self,
+        text: str,
+        *,
+        formats: Iterable[RenderedGlyphFormat] | None = None,
+        rendered_glyph_cache: _WarmRenderedGlyphCache | None = None,
+        glyph_atlas: _WarmGlyphAtlas | None = None,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        self._size.warm(
+            text,
+            formats=formats,
+            rendered_glyph_cache=rendered_glyph_cache,
+            glyph_atlas=glyph_atlas,
+            progress=progress,
         )
 
     @property
@@ -8,29 +8,53 @@ __all__ = [
     "RichText",
     "RenderedGlyph",
     "RenderedGlyphFormat",
+    "RenderedGlyphs",
     "SecondaryAxisTextAlign",
+    "ShapingCache",
     "TextLayout",
     "TextLine",
     "TextGlyph",
+    "TextGlyphMetrics",
+    "TextShaping",
 ]
 
 
+import os
 from abc import ABC
 from abc import abstractmethod
+from array import array
+from collections.abc import Buffer
+from ctypes import POINTER
+from ctypes import byref
+from ctypes import c_ubyte
+from ctypes import cast
 from dataclasses import dataclass
 from enum import Enum
 from enum import StrEnum
+from hashlib import file_digest
+from hashlib import sha256
+from os import PathLike
+from threading import RLock
+from typing import Any
 from typing import BinaryIO
 from typing import Callable
+from typing import Final
 from typing import Generator
 from typing import Generic
+from typing import Hashable
+from typing import Iterable
 from typing import NamedTuple
+from typing import Protocol
 from typing import Sequence
 from typing import TypeVar
+from unicodedata import category as unicode_category
 
 from egeometry import FBoundingBox2d
 from emath import FVector2
+from emath import FVector2Array
+from emath import U32Array
 from emath import UVector2
+from emath import UVector2Array
 from freetype import FT_ENCODING_UNICODE  # type: ignore
 from freetype import FT_RENDER_MODE_LCD  # type: ignore
 from freetype import FT_RENDER_MODE_LCD_V  # type: ignore
@@ -38,18 +62,43 @@ from freetype import FT_RENDER_MODE_LIGHT  # type: ignore
 from freetype import FT_RENDER_MODE_SDF  # type: ignore
 from freetype import Face as FtFace  # type: ignore
 from freetype import FT_Exception  # type: ignore
+from freetype.ft_structs import FT_Size as FtSize  # type: ignore
+from freetype.raw import FT_Activate_Size  # type: ignore
+from freetype.raw import FT_Done_Size  # type: ignore
+from freetype.raw import FT_New_Size  # type: ignore
+from uharfbuzz import Blob as HbBlob  # type: ignore
 from uharfbuzz import Buffer as HbBuffer  # type: ignore
 from uharfbuzz import Face as HbFace  # type: ignore
 from uharfbuzz import Font as HbFont  # type: ignore
+from uharfbuzz import GlyphFlags as HbGlyphFlags  # type: ignore
 from uharfbuzz import shape as hb_shape  # type: ignore
 
 from ._break_text import BreakText
 from ._break_text import BreakTextChunk
 from ._break_text import break_text_never
+from ._cache import CacheInfo
+from ._cache import _LruCache
+from ._opentype import _get_mark_glyphs
+from ._opentype import _get_shaping_glyphs
 from ._unicode import character_is_normally_rendered
+from ._unicode import rendered_mask
 
 _T = TypeVar("_T")
 
+_HB_GLYPH_FLAG_UNSAFE_TO_BREAK: Final = int(HbGlyphFlags.UNSAFE_TO_BREAK)
+
+# harfbuzz shapes the characters in these blocks with its default shaper, which only changes
+# glyphs through the font's layout tables
+_SIMPLE_SHAPING_RANGES: Final = (
+    range(0x20, 0x300),  # latin and ipa
+    range(0x370, 0x530),  # greek and cyrillic
+    range(0x1E00, 0x2000),  # latin and greek extended
+    range(0x2000, 0x20D0),  # punctuation and currency
+    range(0x2100, 0x2150),  # letterlike symbols
+)
+# the fraction slash turns on the fraction features for the digits around it
+_FRACTION_SLASH: Final = 0x2044
+
 
 class RenderedGlyphFormat(Enum):
     ALPHA = FT_RENDER_MODE_LIGHT
@@ -71,14 +120,174 @@ class RichTextRange(NamedTuple):
     end: int
 
 
+def _get_ft_bitmap_buffer(ft_bitmap: Any) -> memoryview:
+    buffer_size = ft_bitmap.rows * abs(ft_bitmap.pitch)
+    if not buffer_size:
+        return memoryview(b"")
+    # freetype-py's Bitmap.buffer builds a list with an int per byte, so view the memory directly,
+    # the view is only valid until another glyph is loaded into the glyph slot
+    return memoryview(
+        cast(ft_bitmap._FT_Bitmap.buffer, POINTER(c_ubyte * buffer_size)).contents
+    ).cast("B")
+
+
+def _read_ft_bitmap(ft_bitmap: Any, format: RenderedGlyphFormat) -> tuple[bytes, int, int]:
+    return _repack_bitmap(
+        _get_ft_bitmap_buffer(ft_bitmap), ft_bitmap.width, ft_bitmap.rows, ft_bitmap.pitch, format
+    )
+
+
+def _get_bitmap_size(width: int, rows: int, format: RenderedGlyphFormat) -> tuple[int, int]:
+    if format == RenderedGlyphFormat.LCD:
+        return width // 3, rows
+    if format == RenderedGlyphFormat.LCD_V:
+        return width, rows // 3
+    return width, rows
+
+
+def _get_bitmap_rows(buffer: memoryview, row_size: int, rows: int, pitch: int) -> list[memoryview]:
+    if pitch == 0:
+        return [buffer[:0]] * rows
+    # a negative pitch means the rows are stored bottom to top
+    row_offsets = range(0, rows * abs(pitch), abs(pitch))
+    if pitch < 0:
+        row_offsets = row_offsets[::-1]
+    return [buffer[row_offset : row_offset + row_size] for row_offset in row_offsets]
+
+
+def _repack_bitmap(
+    buffer: memoryview, width: int, rows: int, pitch: int, format: RenderedGlyphFormat
+) -> tuple[bytes, int, int]:
+    # convert a freetype bitmap into tightly packed rows, with the subpixels of lcd formats
+    # interleaved as rgb triplets
+    packed_width, packed_height = _get_bitmap_size(width, rows, format)
+    row_size = packed_width * _get_channels(format)
+    if format != RenderedGlyphFormat.LCD_V and pitch == row_size:
+        return bytes(buffer), packed_width, packed_height
+    data = bytearray(row_size * packed_height)
+    _write_bitmap(buffer, width, rows, pitch, format, memoryview(data), 0, row_size)
+    return bytes(data), packed_width, packed_height
+
+
+def _write_bitmap(
+    buffer: memoryview,
+    width: int,
+    rows: int,
+    pitch: int,
+    format: RenderedGlyphFormat,
+    target: memoryview,
+    offset: int,
+    stride: int,
+) -> None:
+    if format == RenderedGlyphFormat.LCD_V:
+        height = rows // 3
+        source_rows = _get_bitmap_rows(buffer, width, height * 3, pitch)
+        row_size = width * 3
+        for y in range(height):
+            row_offset = offset + y * stride
+            row_extent = row_offset + row_size
+            target[row_offset:row_extent:3] = source_rows[y * 3]
+            target[row_offset + 1 : row_extent : 3] = source_rows[y * 3 + 1]
+            target[row_offset + 2 : row_extent : 3] = source_rows[y * 3 + 2]
+        return
+
+    row_size = width // 3 * 3 if format == RenderedGlyphFormat.LCD else width
+    for y, source_row in enumerate(_get_bitmap_rows(buffer, row_size, rows, pitch)):
+        row_offset = offset + y * stride
+        target[row_offset : row_offset + row_size] = source_row
+
+
+def _get_channels(format: RenderedGlyphFormat) -> int:
+    if format in (RenderedGlyphFormat.LCD, RenderedGlyphFormat.LCD_V):
+        return 3
+    return 1
+
+
+class _BytesReader:
+    # freetype-py reads streams into memory with read(), returning the bytes object itself lets
+    # freetype reference it directly rather than a copy
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+
+# a FontFace and its sizes may be shared between threads: the freetype face has a single active
+# size and glyph slot, so all freetype access happens under the face's lock, while shaping uses
+# the immutable harfbuzz font of each size and runs without it
 class FontFace:
-    def __init__(self, file: BinaryIO):
-        self._ft_face = FtFace(file)
-        file.seek(0)
-        self._hb_face = HbFace(file.read())
-        self._hb_font = HbFont(self._hb_face)
+    def __init__(self, file: BinaryIO, *, glyph_metrics_cache_size: int | None = 2048):
+        data = file.read()
+        self._init(
+            data, FtFace(_BytesReader(data)), HbFace(data), repr(file), glyph_metrics_cache_size
+        )
+
+    @classmethod
+    def from_path(
+        cls, path: str | PathLike[str], *, glyph_metrics_cache_size: int | None = 2048
+    ) -> FontFace:
+        # freetype and harfbuzz both map the file themselves, so its contents are shared through
+        # the page cache instead of being read into python
+        path = os.fspath(path)
+        face = cls.__new__(cls)
+        face._init(
+            path,
+            FtFace(path),
+            HbFace(HbBlob.from_file_path(path)),
+            repr(path),
+            glyph_metrics_cache_size,
+        )
+        return face
+
+    @classmethod
+    def from_buffer(
+        cls, buffer: bytes, *, glyph_metrics_cache_size: int | None = 2048
+    ) -> FontFace:
+        # freetype references the bytes object without copying it, harfbuzz always keeps its own
+        # copy of in-memory data so from_path should be preferred where possible
+        if not isinstance(buffer, bytes):
+            buffer = bytes(buffer)
+        face = cls.__new__(cls)
+        face._init(
+            buffer,
+            FtFace(_BytesReader(buffer)),
+            HbFace(buffer),
+            "<buffer>",
+            glyph_metrics_cache_size,
+        )
+        return face
 
-        self._name = repr(file)
+    def _init(
+        self,
+        source: str | bytes,
+        ft_face: FtFace,
+        hb_face: HbFace,
+        name: str,
+        glyph_metrics_cache_size: int | None,
+    ) -> None:
+        if glyph_metrics_cache_size is not None and glyph_metrics_cache_size < 0:
+            raise ValueError("glyph metrics cache size must be 0 or greater")
+        self._glyph_metrics_cache_size = glyph_metrics_cache_size
+
+        self._source = source
+        self._content_hash: bytes | None = None
+        self._simple_glyph_indices: dict[int, int] | None = None
+        self._cmap: dict[int, int] | None = None
+
+        self._ft_face = ft_face
+        self._hb_face = hb_face
+        # harfbuzz fonts default to a scale of the face's units per em, so results from this one
+        # are in font units
+        self._hb_font = HbFont(hb_face)
+        self._lock = RLock()
+
+        # each distinct size gets its own FT_Size so that switching between them only requires
+        # activating it, rather than having freetype recalculate the scaled metrics
+        self._ft_sizes: dict[Hashable, FtSize] = {}
+        self._active_ft_size_key: Hashable = None
+
+        self._name = name
         if self._ft_face.family_name:
             self._name = self._ft_face.family_name.decode("ascii")
         if self._ft_face.postscript_name:
@@ -89,14 +298,78 @@ class FontFace:
     def __repr__(self) -> str:
         return f"<FontFace {self._name!r}>"
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # faces are pickled by reference to the path or data they were loaded from
+        return (_load_font_face, (self._source, self._glyph_metrics_cache_size))
+
+    def _get_content_hash(self) -> bytes:
+        if self._content_hash is None:
+            if isinstance(self._source, str):
+                with open(self._source, "rb") as file:
+                    self._content_hash = file_digest(file, "sha256").digest()
+            else:
+                self._content_hash = sha256(self._source).digest()
+        return self._content_hash
+
+    def _get_simple_glyph_indices(self) -> dict[int, int]:
+        # the glyph index of each character that harfbuzz will always shape as just its nominal
+        # glyph and advance, regardless of the characters around it
+        with self._lock:
+            if self._simple_glyph_indices is not None:
+                return self._simple_glyph_indices
+            simple_glyph_indices: dict[int, int] = {}
+            mark_glyphs = _get_mark_glyphs(self._hb_face)
+            shaping_glyphs = _get_shaping_glyphs(self._hb_face, mark_glyphs)
+            if shaping_glyphs is not None:
+                for code_point_range in _SIMPLE_SHAPING_RANGES:
+                    for code_point in code_point_range:
+                        # marks, controls and separators are handled specially by harfbuzz
+                        category = unicode_category(chr(code_point))
+                        if (
+                            category[0] in "CM"
+                            or category in ("Zl", "Zp")
+                            or code_point == _FRACTION_SLASH
+                        ):
+                            continue
+                        glyph_index = self._hb_font.get_nominal_glyph(code_point)
+                        if (
+                            not glyph_index
+                            or glyph_index in shaping_glyphs
+                            or glyph_index in mark_glyphs
+                        ):
+                            continue
+                        simple_glyph_indices[code_point] = glyph_index
+            self._simple_glyph_indices = simple_glyph_indices
+            return simple_glyph_indices
+
     def get_glyph_index(self, character: str) -> int:
         if len(character) != 1:
             raise ValueError("only a single character may be entered")
 
-        index = self._ft_face.get_char_index(character)
+        with self._lock:
+            index = self._ft_face.get_char_index(character)
         assert isinstance(index, int)
         return index
 
+    def _get_cmap(self) -> dict[int, int]:
+        # built on first use, since walking the whole character map is only worth it when many
+        # characters are going to be looked up
+        cmap = self._cmap
+        if cmap is None:
+            with self._lock:
+                cmap = self._cmap
+                if cmap is None:
+                    cmap = self._cmap = dict(self._ft_face.get_chars())
+        return cmap
+
+    def get_glyph_indices(self, text: str) -> U32Array:
+        get_glyph_index = self._get_cmap().get
+        return U32Array.from_buffer(array("I", [get_glyph_index(ord(c), 0) for c in text]))
+
+    def get_missing_characters(self, text: str) -> set[str]:
+        cmap = self._get_cmap()
+        return {c for c in set(text) if ord(c) not in cmap}
+
     def request_point_size(
         self,
         *,
@@ -119,11 +392,46 @@ class FontFace:
             self, 0 if width is None else width, 0 if height is None else height
         )
 
+    def _use_ft_size(self, key: Hashable, set_ft_size: Callable[[], None]) -> None:
+        if key == self._active_ft_size_key:
+            return
+
+        try:
+            ft_size = self._ft_sizes[key]
+        except KeyError:
+            ft_size = FtSize()
+            error = FT_New_Size(self._ft_face._FT_Face, byref(ft_size))
+            if error:
+                raise FT_Exception(error)
+            self._active_ft_size_key = None
+            try:
+                error = FT_Activate_Size(ft_size)
+                if error:
+                    raise FT_Exception(error)
+                set_ft_size()
+            except:
+                FT_Done_Size(ft_size)
+                raise
+            self._ft_sizes[key] = ft_size
+        else:
+            error = FT_Activate_Size(ft_size)
+            if error:
+                raise FT_Exception(error)
+
+        self._active_ft_size_key = key
+
     def _get_glyph_size(self, character: int, size: FontFaceSize) -> FVector2:
-        size._use()
-        self._ft_face.load_glyph(character, 0)
-        ft_glyph = self._ft_face.glyph
-        return FVector2(ft_glyph.metrics.width / 64.0, ft_glyph.metrics.height / 64.0)
+        glyph_size = size._glyph_metrics_cache.get(character)
+        if glyph_size is None:
+            with self._lock:
+                size._use()
+                self._ft_face.load_glyph(character, 0)
+                ft_glyph = self._ft_face.glyph
+                glyph_size = FVector2(
+                    ft_glyph.metrics.width / 64.0, ft_glyph.metrics.height / 64.0
+                )
+            size._glyph_metrics_cache.put(character, glyph_size)
+        return glyph_size
 
     def render_glyph(
         self,
@@ -139,60 +447,127 @@ class FontFace:
         if size.face is not self:
             raise ValueError("size is not compatible with this face")
 
-        size._use()
-        if isinstance(character, str):
-            self._ft_face.load_char(character, 0)
-        else:
-            try:
-                self._ft_face.load_glyph(character, 0)
-            except FT_Exception as ex:
-                raise ValueError("face does not contain the specified glyph")
+        with self._lock:
+            size._use()
+            if isinstance(character, str):
+                self._ft_face.load_char(character, 0)
+            else:
+                self._load_glyph(character)
+            data, width, height, bearing = self._render_loaded_glyph(format)
+
+        return RenderedGlyph(data, UVector2(width, height), bearing, format)
+
+    def render_glyph_into(
+        self,
+        character: str | int,
+        size: FontFaceSize,
+        target: Buffer,
+        offset: int,
+        stride: int,
+        *,
+        format: RenderedGlyphFormat | None = None,
+    ) -> tuple[UVector2, FVector2]:
+        if format is None:
+            format = RenderedGlyphFormat.ALPHA
+        if isinstance(character, str) and len(character) != 1:
+            raise ValueError("only a single character may be rendered")
+        if size.face is not self:
+            raise ValueError("size is not compatible with this face")
+        target_view = memoryview(target)
+        if target_view.readonly:
+            raise TypeError("target must be writable")
+        target_view = target_view.cast("B")
+        if offset < 0:
+            raise ValueError("offset must be 0 or greater")
+
+        with self._lock:
+            size._use()
+            if isinstance(character, str):
+                self._ft_face.load_char(character, 0)
+            else:
+                self._load_glyph(character)
+            ft_glyph = self._rasterize_loaded_glyph(format)
+            ft_bitmap = ft_glyph.bitmap
+            width, height = _get_bitmap_size(ft_bitmap.width, ft_bitmap.rows, format)
+
+            if width and height:
+                row_size = width * _get_channels(format)
+                if stride < row_size:
+                    raise ValueError("stride must be at least the size of a glyph row")
+                if offset + (height - 1) * stride + row_size > len(target_view):
+                    raise ValueError("target is too small for the glyph")
+                _write_bitmap(
+                    _get_ft_bitmap_buffer(ft_bitmap),
+                    ft_bitmap.width,
+                    ft_bitmap.rows,
+                    ft_bitmap.pitch,
+                    format,
+                    target_view,
+                    offset,
+                    stride,
+                )
+
+            return UVector2(width, height), FVector2(ft_glyph.bitmap_left, -ft_glyph.bitmap_top)
+
+    def render_glyphs(
+        self,
+        glyph_indices: Iterable[int],
+        size: FontFaceSize,
+        *,
+        format: RenderedGlyphFormat | None = None,
+    ) -> RenderedGlyphs:
+        if format is None:
+            format = RenderedGlyphFormat.ALPHA
+        if size.face is not self:
+            raise ValueError("size is not compatible with this face")
+
+        unique_glyph_indices = tuple(dict.fromkeys(glyph_indices))
+        datas: list[bytes] = []
+        offsets: list[int] = []
+        sizes: list[UVector2] = []
+        bearings: list[FVector2] = []
+        offset = 0
+
+        with self._lock:
+            size._use()
+            for glyph_index in unique_glyph_indices:
+                self._load_glyph(glyph_index)
+                data, width, height, bearing = self._render_loaded_glyph(format)
+                datas.append(data)
+                offsets.append(offset)
+                sizes.append(UVector2(width, height))
+                bearings.append(bearing)
+                offset += len(data)
+
+        return RenderedGlyphs(
+            b"".join(datas),
+            U32Array(*unique_glyph_indices),
+            U32Array(*offsets),
+            UVector2Array(*sizes),
+            FVector2Array(*bearings),
+            format,
+        )
 
+    def _load_glyph(self, glyph_index: int) -> None:
+        try:
+            self._ft_face.load_glyph(glyph_index, 0)
+        except FT_Exception as ex:
+            raise ValueError("face does not contain the specified glyph")
+
+    def _rasterize_loaded_glyph(self, format: RenderedGlyphFormat) -> Any:
         ft_glyph = self._ft_face.glyph
         try:
             ft_glyph.render(format.value)
         except FT_Exception as ex:
             pass
-        width = ft_glyph.bitmap.width
-        height = ft_glyph.bitmap.rows
-        data = bytes(ft_glyph.bitmap.buffer)
-        if format == RenderedGlyphFormat.LCD:
-            width = width // 3
-            data = b"".join(
-                (
-                    bytes(
-                        (
-                            data[x * 3 + (y * ft_glyph.bitmap.pitch)],
-                            data[x * 3 + 1 + (y * ft_glyph.bitmap.pitch)],
-                            data[x * 3 + 2 + (y * ft_glyph.bitmap.pitch)],
-                        )
-                    )
-                    for y in range(height)
-                    for x in range(width)
-                )
-            )
-        elif format == RenderedGlyphFormat.LCD_V:
-            height = height // 3
-            data = b"".join(
-                (
-                    bytes(
-                        (
-                            data[x + (y * 3 * ft_glyph.bitmap.pitch)],
-                            data[x + ((y * 3 + 1) * ft_glyph.bitmap.pitch)],
-                            data[x + ((y * 3 + 2) * ft_glyph.bitmap.pitch)],
-                        )
-                    )
-                    for y in range(height)
-                    for x in range(width)
-                )
-            )
+        return ft_glyph
 
-        return RenderedGlyph(
-            data,
-            UVector2(width, height),
-            FVector2(ft_glyph.bitmap_left, -ft_glyph.bitmap_top),
-            format,
-        )
+    def _render_loaded_glyph(
+        self, format: RenderedGlyphFormat
+    ) -> tuple[bytes, int, int, FVector2]:
+        ft_glyph = self._rasterize_loaded_glyph(format)
+        data, width, height = _read_ft_bitmap(ft_glyph.bitmap, format)
+        return data, width, height, FVector2(ft_glyph.bitmap_left, -ft_glyph.bitmap_top)
 
     @property
     def fixed_sizes(self) -> Sequence[FontFaceSize]:
@@ -205,6 +580,12 @@ class FontFace:
         return self._name
 
 
+def _load_font_face(source: str | bytes, glyph_metrics_cache_size: int | None) -> FontFace:
+    if isinstance(source, str):
+        return FontFace.from_path(source, glyph_metrics_cache_size=glyph_metrics_cache_size)
+    return FontFace.from_buffer(source, glyph_metrics_cache_size=glyph_metrics_cache_size)
+
+
 def layout_text(
     rich_text: Sequence[RichText[_T]],
     *,
@@ -215,6 +596,9 @@ def layout_text(
     primary_axis_alignment: PrimaryAxisTextAlign | None = None,
     secondary_axis_alignment: SecondaryAxisTextAlign | None = None,
     origin: FVector2 | None = None,
+    shaping: TextShaping | None = None,
+    shaping_cache: ShapingCache | None = None,
+    glyph_metrics: TextGlyphMetrics | None = None,
 ) -> TextLayout[_T] | None:
     if break_text is None:
         break_text = break_text_never
@@ -226,6 +610,10 @@ def layout_text(
         secondary_axis_alignment = SecondaryAxisTextAlign.BEGIN
     if origin is None:
         origin = FVector2(0)
+    if shaping is None:
+        shaping = TextShaping.CHUNK
+    if glyph_metrics is None:
+        glyph_metrics = TextGlyphMetrics.FREETYPE
 
     return _TextLayout(
         rich_text,
@@ -235,6 +623,9 @@ def layout_text(
         line_height,
         primary_axis_alignment,
         secondary_axis_alignment,
+        shaping,
+        shaping_cache,
+        glyph_metrics,
     ).to_text_layout(origin)
 
 
@@ -251,6 +642,157 @@ class SecondaryAxisTextAlign(StrEnum):
     BASELINE = "baseline"
 
 
+class TextShaping(StrEnum):
+    CHUNK = "chunk"
+    RUN = "run"
+
+
+class TextGlyphMetrics(StrEnum):
+    FREETYPE = "freetype"
+    HARFBUZZ = "harfbuzz"
+
+
+class _ShapedGlyph(NamedTuple):
+    glyph_index: int
+    cluster: int
+    is_unsafe_to_break: bool
+    advance: FVector2
+    offset: FVector2
+
+
+def _shape(hb_font: HbFont, text: str) -> tuple[_ShapedGlyph, ...]:
+    hb_buffer = HbBuffer()
+    hb_buffer.direction = "LTR"
+    hb_buffer.add_str(text)
+    hb_shape(hb_font, hb_buffer, {})
+    return tuple(
+        _ShapedGlyph(
+            info.codepoint,
+            info.cluster,
+            bool(int(info.flags) & _HB_GLYPH_FLAG_UNSAFE_TO_BREAK),
+            FVector2(pos.x_advance / 64.0, pos.y_advance / 64.0),
+            FVector2(pos.x_offset / 64.0, pos.y_offset / 64.0),
+        )
+        for info, pos in zip(hb_buffer.glyph_infos, hb_buffer.glyph_positions)
+    )
+
+
+_SimpleShapingTable = list[tuple[int, FVector2] | None]
+_ZERO_OFFSET: Final = FVector2(0)
+
+
+def _shape_simple(table: _SimpleShapingTable, text: str) -> tuple[_ShapedGlyph, ...] | None:
+    # none is returned when the text has a character which isn't simple
+    try:
+        entries = [table[ord(c)] for c in text]
+    except IndexError:
+        return None
+    if None in entries:
+        return None
+    return tuple(
+        _ShapedGlyph(glyph_index, i, False, advance, _ZERO_OFFSET)
+        for i, (glyph_index, advance) in enumerate(entries)  # type: ignore
+    )
+
+
+def _scale_shaped_glyphs(
+    shaped_glyphs: tuple[_ShapedGlyph, ...], scale: FVector2
+) -> tuple[_ShapedGlyph, ...]:
+    return tuple(
+        _ShapedGlyph(
+            glyph.glyph_index,
+            glyph.cluster,
+            glyph.is_unsafe_to_break,
+            glyph.advance * scale,
+            glyph.offset * scale,
+        )
+        for glyph in shaped_glyphs
+    )
+
+
+class ShapingCache:
+    def __init__(self, max_size: int | None = 1024, *, scale_independent: bool = False):
+        self._scale_independent = scale_independent
+        self._cache: _LruCache[tuple[FontFace | FontFaceSize, str], tuple[_ShapedGlyph, ...]] = (
+            _LruCache(max_size)
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _shape(self, size: FontFaceSize, text: str) -> tuple[_ShapedGlyph, ...]:
+        # harfbuzz is only ever given left to right text without features, so the font and text
+        # are enough to identify a result
+        key: tuple[FontFace | FontFaceSize, str] = (size, text)
+        shaped_glyphs = self._cache.get(key)
+        if shaped_glyphs is None:
+            if self._scale_independent:
+                # harfbuzz doesn't hint, so its output at any scale is its output in font units
+                # scaled linearly, give or take rounding to the 1/64th of a pixel
+                face_key = (size._face, text)
+                face_shaped_glyphs = self._cache.get(face_key)
+                if face_shaped_glyphs is None:
+                    face_shaped_glyphs = _shape(size._face._hb_font, text)
+                    self._cache.put(face_key, face_shaped_glyphs)
+                shaped_glyphs = _scale_shaped_glyphs(face_shaped_glyphs, size._font_unit_scale)
+            else:
+                shaped_glyphs = _shape(size._hb_font, text)
+            self._cache.put(key, shaped_glyphs)
+        return shaped_glyphs
+
+    @property
+    def scale_independent(self) -> bool:
+        return self._scale_independent
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    @property
+    def info(self) -> CacheInfo:
+        return self._cache.info
+
+
+class _ShapedRun:
+    def __init__(self, shaped_glyphs: tuple[_ShapedGlyph, ...], text_length: int):
+        self.shaped_glyphs = shaped_glyphs
+        # the index of the first glyph of each cluster, keyed by the text index the cluster starts
+        # at, reversed so that the first glyph wins
+        glyph_count = len(shaped_glyphs)
+        self.cluster_glyph_indices = dict(
+            zip((glyph.cluster for glyph in reversed(shaped_glyphs)), reversed(range(glyph_count)))
+        )
+        self.cluster_glyph_indices[0] = 0
+        self.cluster_glyph_indices[text_length] = glyph_count
+        self._last_end = 0
+        self._last_glyph_end: int | None = 0
+
+    def _get_safe_to_break_glyph_index(self, text_index: int) -> int | None:
+        # the glyph index where the text can be split, but only if harfbuzz says that shaping
+        # either side of it independently gives the same result
+        try:
+            glyph_index = self.cluster_glyph_indices[text_index]
+        except KeyError:
+            return None
+        if glyph_index == 0 or glyph_index == len(self.shaped_glyphs):
+            return glyph_index
+        if self.shaped_glyphs[glyph_index].is_unsafe_to_break:
+            return None
+        return glyph_index
+
+    def slice(self, start: int, end: int) -> tuple[_ShapedGlyph, ...] | None:
+        # chunks are sliced in order, so the start of this slice is usually the end of the last
+        if start == self._last_end:
+            glyph_start = self._last_glyph_end
+        else:
+            glyph_start = self._get_safe_to_break_glyph_index(start)
+        glyph_end = self._get_safe_to_break_glyph_index(end)
+        self._last_end = end
+        self._last_glyph_end = glyph_end
+        if glyph_start is None or glyph_end is None:
+            return None
+        return self.shaped_glyphs[glyph_start:glyph_end]
+
+
 @dataclass(slots=True)
 class _PositionedGlyph:
     character: str
@@ -275,6 +817,10 @@ class _TextLineLayout:
         self.size = FVector2(0)
         self.baseline_offset = FVector2(0)
         self.glyphs: list[_PositionedGlyph] = []
+        # the horizontal bounds, relative to the line's position, of the first and last rendered
+        # glyphs, kept as glyphs are added so that the bounding box doesn't rescan them
+        self.rendered_position_x: float | None = None
+        self.rendered_extent_x = 0.0
 
     def add_glyphs(
         self, glyphs: Sequence[_PositionedGlyph], advance: FVector2, max_size: int | None
@@ -289,6 +835,10 @@ class _TextLineLayout:
             if round(glyph.line_size) > line_size:
                 line_size = round(glyph.line_size)
                 self.baseline_offset = glyph.font_face_size._baseline_offset
+            if glyph.is_rendered:
+                if self.rendered_position_x is None:
+                    self.rendered_position_x = glyph.rendered_position.x
+                self.rendered_extent_x = glyph.rendered_extent.x
 
         self.size = FVector2(self.size.x + advance.x, line_size)
 
@@ -306,16 +856,10 @@ class _TextLineLayout:
 
     @property
     def rendered_bounding_box(self) -> FBoundingBox2d:
-        position_x = 0.0
-        extent_x = 0.0
-        for glyph in self.glyphs:
-            if glyph.is_rendered:
-                position_x = glyph.rendered_position.x
-                break
-        for glyph in reversed(self.glyphs):
-            if glyph.is_rendered:
-                extent_x = glyph.rendered_extent.x
-                break
+        position_x = self.rendered_position_x
+        if position_x is None:
+            position_x = 0.0
+        extent_x = self.rendered_extent_x
         return FBoundingBox2d(
             FVector2(self.position.x + position_x, self.position.y),
             FVector2(extent_x - position_x, self.size.y),
@@ -332,12 +876,25 @@ class _TextLayout(Generic[_T]):
         line_height: int | None,
         primary_axis_alignment: PrimaryAxisTextAlign,
         secondary_axis_alignment: SecondaryAxisTextAlign,
+        shaping: TextShaping,
+        shaping_cache: ShapingCache | None,
+        glyph_metrics: TextGlyphMetrics,
     ):
         self.is_character_rendered = is_character_rendered
+        # the default check is made for whole rich texts at a time rather than per glyph
+        self.rendered_masks: dict[int, bytes] | None = (
+            {} if is_character_rendered is character_is_normally_rendered else None
+        )
+        self.shaping_cache = shaping_cache
+        self.use_harfbuzz_glyph_metrics = glyph_metrics == TextGlyphMetrics.HARFBUZZ
+        self.shaped_runs: dict[int, _ShapedRun] | None = {} if shaping == TextShaping.RUN else None
 
         self.line_height = line_height
         self.max_line_size = max_line_size
         self.lines: list[_TextLineLayout] = [_TextLineLayout(FVector2(0))]
+        # the sum of the heights of every line before the last, so that adding a line doesn't
+        # need to visit the ones before it
+        self.lines_size_y = 0.0
 
         self.rich_text = rich_text if isinstance(rich_text, tuple) else tuple(rich_text)
         if rich_text:
@@ -402,44 +959,80 @@ class _TextLayout(Generic[_T]):
         for rich_text_i, rich_text_start, rich_text_end in rich_text_ranges:
             rich_text = rich_texts[rich_text_i]
             size = rich_text.size
-            text = rich_text.text[rich_text_start:rich_text_end]
 
-            hb_font = size._face._hb_font
-            hb_font.scale = size._scale
-
-            hb_buffer = HbBuffer()
-            hb_buffer.direction = "LTR"
-            hb_buffer.add_str(text)
-            hb_shape(hb_font, hb_buffer, {})
+            shaped_glyphs, cluster_offset = self._shape(
+                rich_text, rich_text_i, rich_text_start, rich_text_end
+            )
+            mask = self._get_rendered_mask(rich_text, rich_text_i)
 
-            for i, (info, pos) in enumerate(zip(hb_buffer.glyph_infos, hb_buffer.glyph_positions)):
-                c = text[info.cluster]
+            for i, shaped_glyph in enumerate(shaped_glyphs):
+                c_index = cluster_offset + shaped_glyph.cluster
+                c = rich_text.text[c_index]
                 chunk_glyphs.append(
                     _PositionedGlyph(
                         c,
-                        info.codepoint,
-                        pen_position + FVector2(pos.x_advance / 64.0, 0),
-                        pen_position + FVector2(pos.x_offset / 64.0, pos.y_offset / 64.0),
-                        size._face._get_glyph_size(info.codepoint, size),
-                        self.is_character_rendered(c),
+                        shaped_glyph.glyph_index,
+                        pen_position + shaped_glyph.advance.xo,
+                        pen_position + shaped_glyph.offset,
+                        (
+                            size._get_hb_glyph_size(shaped_glyph.glyph_index)
+                            if self.use_harfbuzz_glyph_metrics
+                            else size._face._get_glyph_size(shaped_glyph.glyph_index, size)
+                        ),
+                        self.is_character_rendered(c) if mask is None else mask[c_index] == 1,
                         size,
                         size._line_size.y if self.line_height is None else self.line_height,
                         text_index,
                         (rich_text_i, rich_text_start + i),
                     )
                 )
-                pen_position += FVector2(pos.x_advance / 64.0, pos.y_advance / 64.0)
+                pen_position += shaped_glyph.advance
                 text_index += 1
 
         self._add_chunk_glyphs(chunk, chunk_glyphs, pen_position)
 
+    def _get_rendered_mask(self, rich_text: RichText[_T], rich_text_i: int) -> bytes | None:
+        if self.rendered_masks is None:
+            return None
+        try:
+            return self.rendered_masks[rich_text_i]
+        except KeyError:
+            mask = self.rendered_masks[rich_text_i] = rendered_mask(rich_text.text)
+            return mask
+
+    def _shape(
+        self, rich_text: RichText[_T], rich_text_i: int, start: int, end: int
+    ) -> tuple[tuple[_ShapedGlyph, ...], int]:
+        if self.shaped_runs is not None:
+            try:
+                shaped_run = self.shaped_runs[rich_text_i]
+            except KeyError:
+                shaped_run = self.shaped_runs[rich_text_i] = _ShapedRun(
+                    self._shape_text(rich_text.size, rich_text.text), len(rich_text.text)
+                )
+            shaped_slice = shaped_run.slice(start, end)
+            if shaped_slice is not None:
+                return shaped_slice, 0
+        return self._shape_text(rich_text.size, rich_text.text[start:end]), start
+
+    def _shape_text(self, size: FontFaceSize, text: str) -> tuple[_ShapedGlyph, ...]:
+        simple_shaping_table = size._simple_shaping_table
+        if simple_shaping_table is not None:
+            shaped_glyphs = _shape_simple(simple_shaping_table, text)
+            if shaped_glyphs is not None:
+                return shaped_glyphs
+        if self.shaping_cache is None:
+            return _shape(size._hb_font, text)
+        return self.shaping_cache._shape(size, text)
+
     def _add_chunk_glyphs(
         self, chunk: BreakTextChunk, chunk_glyphs: Sequence[_PositionedGlyph], advance: FVector2
     ) -> None:
         glyphs_added = self.lines[-1].add_glyphs(chunk_glyphs, advance, self.max_line_size)
 
         if not glyphs_added or chunk.force_break:
-            line = _TextLineLayout(FVector2(0, sum((l.size.y for l in self.lines))))
+            self.lines_size_y += self.lines[-1].size.y
+            line = _TextLineLayout(FVector2(0, self.lines_size_y))
             self.lines.append(line)
 
             if not glyphs_added:
@@ -467,12 +1060,12 @@ class _TextLayout(Generic[_T]):
         pass
 
     def _v_align_center(self) -> None:
-        center = FVector2(0, sum(l.size.y for l in self.lines) * 0.5)
+        center = FVector2(0, (self.lines_size_y + self.lines[-1].size.y) * 0.5)
         for line in self.lines:
             line.position -= center
 
     def _v_align_end(self) -> None:
-        end = FVector2(0, sum(l.size.y for l in self.lines))
+        end = FVector2(0, self.lines_size_y + self.lines[-1].size.y)
         for line in self.lines:
             line.position -= end
 
@@ -546,34 +1139,76 @@ class TextLayout(Generic[_T]):
 
 
 class RenderedGlyph(NamedTuple):
-    data: bytes
+    data: bytes | memoryview
     size: UVector2
     bearing: FVector2
     format: RenderedGlyphFormat
 
 
+class RenderedGlyphs(NamedTuple):
+    data: bytes
+    glyph_indices: U32Array
+    offsets: U32Array
+    sizes: UVector2Array
+    bearings: FVector2Array
+    format: RenderedGlyphFormat
+
+
+class _WarmRenderedGlyphCache(Protocol):
+    def render_glyph(
+        self,
+        character: str | int,
+        size: FontFaceSize,
+        *,
+        format: RenderedGlyphFormat | None = None,
+    ) -> RenderedGlyph: ...
+
+
+class _WarmGlyphAtlas(Protocol):
+    def get_glyph(self, character: str | int, size: FontFaceSize) -> Any: ...
+
+
 class FontFaceSize(ABC):
     def __init__(self, face: FontFace):
         self._face = face
-        self._use()
-        self._nominal_size = UVector2(
-            self._face._ft_face.size.x_ppem, self._face._ft_face.size.y_ppem
-        )
-        self._scale = (
-            self._face._ft_face.size.x_scale * self._face._ft_face.units_per_EM + (1 << 15) >> 16,
-            self._face._ft_face.size.y_scale * self._face._ft_face.units_per_EM + (1 << 15) >> 16,
+        with face._lock:
+            self._use()
+            ft_size = face._ft_face.size
+            units_per_em = face._ft_face.units_per_EM
+            self._nominal_size = UVector2(ft_size.x_ppem, ft_size.y_ppem)
+            self._scale = (
+                ft_size.x_scale * units_per_em + (1 << 15) >> 16,
+                ft_size.y_scale * units_per_em + (1 << 15) >> 16,
+            )
+            self._line_size = FVector2(
+                0.0,  # how
+                ft_size.height / 64.0,
+            )
+            self._baseline_offset = FVector2(0, ft_size.descender / 64.0)  # how
+        self._hb_font = HbFont(face._hb_face)
+        self._hb_font.scale = self._scale
+        # converts harfbuzz positions in font units to pixels
+        self._font_unit_scale = FVector2(*self._scale) / units_per_em
+        self._glyph_metrics_cache: _LruCache[int, FVector2] = _LruCache(
+            face._glyph_metrics_cache_size
         )
-        self._line_size = FVector2(
-            0.0,  # how
-            self._face._ft_face.size.height / 64.0,
+        self._hb_glyph_metrics_cache: _LruCache[int, FVector2] = _LruCache(
+            face._glyph_metrics_cache_size
         )
-        self._baseline_offset = FVector2(0, self._face._ft_face.size.descender / 64.0)  # how
+        self._simple_shaping_table: _SimpleShapingTable | None = None
 
     def __repr__(self) -> str:
         return f"<FontFaceSize for {self._face.name!r} of {self.nominal_size}>"
 
+    def _use(self) -> None:
+        self._face._use_ft_size(self._ft_size_key, self._set_ft_size)
+
+    @property
     @abstractmethod
-    def _use(self) -> None: ...
+    def _ft_size_key(self) -> Hashable: ...
+
+    @abstractmethod
+    def _set_ft_size(self) -> None: ...
 
     @property
     def face(self) -> FontFace:
@@ -587,6 +1222,76 @@ class FontFaceSize(ABC):
     def line_size(self) -> FVector2:
         return self._line_size
 
+    @property
+    def glyph_metrics_cache_info(self) -> CacheInfo:
+        return self._glyph_metrics_cache.info
+
+    def clear_glyph_metrics_cache(self) -> None:
+        self._glyph_metrics_cache.clear()
+        self._hb_glyph_metrics_cache.clear()
+
+    def _get_hb_glyph_size(self, glyph_index: int) -> FVector2:
+        # harfbuzz doesn't hint, so these are the exact extents of the outline rather than the
+        # whole pixel extents of the glyph as freetype renders it
+        glyph_size = self._hb_glyph_metrics_cache.get(glyph_index)
+        if glyph_size is None:
+            extents = self._hb_font.get_glyph_extents(glyph_index)
+            if extents is None:
+                glyph_size = FVector2(0)
+            else:
+                glyph_size = FVector2(extents.width / 64.0, extents.height / -64.0)
+            self._hb_glyph_metrics_cache.put(glyph_index, glyph_size)
+        return glyph_size
+
+    def enable_simple_shaping(self) -> None:
+        # a table indexed by code point of the glyph index and advance for the characters that
+        # shape the same no matter their neighbours, text made up of only those characters can
+        # skip harfbuzz
+        simple_glyph_indices = self._face._get_simple_glyph_indices()
+        table: _SimpleShapingTable = [None] * (max(simple_glyph_indices, default=-1) + 1)
+        for code_point, glyph_index in simple_glyph_indices.items():
+            table[code_point] = (
+                glyph_index,
+                FVector2(self._hb_font.get_glyph_h_advance(glyph_index) / 64.0, 0),
+            )
+        self._simple_shaping_table = table
+
+    def disable_simple_shaping(self) -> None:
+        self._simple_shaping_table = None
+
+    @property
+    def simple_shaping_enabled(self) -> bool:
+        return self._simple_shaping_table is not None
+
+    def warm(
+        self,
+        text: str,
+        *,
+        formats: Iterable[RenderedGlyphFormat] | None = None,
+        rendered_glyph_cache: _WarmRenderedGlyphCache | None = None,
+        glyph_atlas: _WarmGlyphAtlas | None = None,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        if formats is None:
+            formats = () if rendered_glyph_cache is None else (RenderedGlyphFormat.ALPHA,)
+        else:
+            formats = tuple(formats)
+            if formats and rendered_glyph_cache is None:
+                raise ValueError("formats may only be warmed with a rendered glyph cache")
+
+        glyph_indices = list(dict.fromkeys(self._face.get_glyph_indices(text)))
+        total = len(glyph_indices)
+        for i, glyph_index in enumerate(glyph_indices):
+            self._face._get_glyph_size(glyph_index, self)
+            for format in formats:
+                rendered_glyph_cache.render_glyph(glyph_index, self, format=format)  # type: ignore
+            # the atlas isn't thread-safe, when warming in a background thread it must not be
+            # used elsewhere until warming is done
+            if glyph_atlas is not None:
+                glyph_atlas.get_glyph(glyph_index, self)
+            if progress is not None:
+                progress(i + 1, total)
+
     def layout_text(
         self,
         text: str,
@@ -598,6 +1303,9 @@ class FontFaceSize(ABC):
         primary_axis_alignment: PrimaryAxisTextAlign | None = None,
         secondary_axis_alignment: SecondaryAxisTextAlign | None = None,
         origin: FVector2 | None = None,
+        shaping: TextShaping | None = None,
+        shaping_cache: ShapingCache | None = None,
+        glyph_metrics: TextGlyphMetrics | None = None,
     ) -> TextLayout | None:
         return layout_text(
             (RichText(text, self, None),),
@@ -608,15 +1316,34 @@ class FontFaceSize(ABC):
             primary_axis_alignment=primary_axis_alignment,
             secondary_axis_alignment=secondary_axis_alignment,
             origin=origin,
+            shaping=shaping,
+            shaping_cache=shaping_cache,
+            glyph_metrics=glyph_metrics,
         )
 
 
+def _load_font_face_size(
+    cls: type[FontFaceSize], face: FontFace, attributes: dict[str, Any]
+) -> FontFaceSize:
+    size = cls.__new__(cls)
+    size.__dict__.update(attributes)
+    FontFaceSize.__init__(size, face)
+    return size
+
+
 class _PointFontFaceSize(FontFaceSize):
     def __init__(self, face: FontFace, width: float | None, height: float | None, dpi: UVector2):
         self._args = (width, height, dpi.x, dpi.y)
         super().__init__(face)
 
-    def _use(self) -> None:
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_load_font_face_size, (_PointFontFaceSize, self._face, {"_args": self._args}))
+
+    @property
+    def _ft_size_key(self) -> Hashable:
+        return (_PointFontFaceSize, self._args)
+
+    def _set_ft_size(self) -> None:
         self.face._ft_face.set_char_size(*self._args)  # type: ignore
 
 
@@ -625,7 +1352,14 @@ class _PixelFontFaceSize(FontFaceSize):
         self._args = (width, height)
         super().__init__(face)
 
-    def _use(self) -> None:
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_load_font_face_size, (_PixelFontFaceSize, self._face, {"_args": self._args}))
+
+    @property
+    def _ft_size_key(self) -> Hashable:
+        return (_PixelFontFaceSize, self._args)
+
+    def _set_ft_size(self) -> None:
         self.face._ft_face.set_pixel_sizes(*self._args)  # type: ignore
 
 
@@ -634,5 +1368,12 @@ class _FixedFontFaceSize(FontFaceSize):
         self._index = index
         super().__init__(face)
 
-    def _use(self) -> None:
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_load_font_face_size, (_FixedFontFaceSize, self._face, {"_index": self._index}))
+
+    @property
+    def _ft_size_key(self) -> Hashable:
+        return (_FixedFontFaceSize, self._index)
+
+    def _set_ft_size(self) -> None:
         self.face._ft_face.select_size(self._index)
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+__all__ = ["GlyphAtlas", "GlyphAtlasGlyph"]
+
+from typing import NamedTuple
+
+from egeometry import IBoundingBox2d
+from emath import FVector2
+from emath import IVector2
+from emath import UVector2
+
+from ._font_face import FontFace
+from ._font_face import FontFaceSize
+from ._font_face import RenderedGlyphFormat
+
+_GlyphKey = tuple[FontFaceSize, int]
+
+
+class GlyphAtlasGlyph(NamedTuple):
+    page: int | None
+    bounding_box: IBoundingBox2d
+    bearing: FVector2
+    scale: FVector2 = FVector2(1)
+
+
+# unlike FontFace the atlas has no lock, callers sharing one between threads must synchronize
+# access to it themselves
+class GlyphAtlas:
+    def __init__(
+        self,
+        *,
+        format: RenderedGlyphFormat | None = None,
+        page_size: UVector2 = UVector2(1024, 1024),
+        max_pages: int | None = None,
+        padding: int = 1,
+        sdf_reference_size: int | None = None,
+    ):
+        if format is None:
+            format = RenderedGlyphFormat.ALPHA
+        if sdf_reference_size is not None:
+            if format != RenderedGlyphFormat.SDF:
+                raise ValueError("sdf reference size may only be used with the sdf format")
+            if sdf_reference_size < 1:
+                raise ValueError("sdf reference size must be 1 or greater")
+        if page_size.x == 0 or page_size.y == 0:
+            raise ValueError("page size must be greater than 0")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max pages must be 1 or greater")
+        if padding < 0:
+            raise ValueError("padding must be 0 or greater")
+
+        self._format = format
+        self._channels = 3 if format in (RenderedGlyphFormat.LCD, RenderedGlyphFormat.LCD_V) else 1
+        self._page_size = page_size
+        self._max_pages = max_pages
+        self._padding = padding
+        # a distance field can be scaled, so with a reference size each glyph is only rendered
+        # once per face, at the reference pixel height, and scaled for every requested size
+        self._sdf_reference_size = sdf_reference_size
+        self._sdf_reference_sizes: dict[FontFace, FontFaceSize] = {}
+
+        self._pages: list[_GlyphAtlasPage] = []
+        self._glyphs: dict[_GlyphKey, GlyphAtlasGlyph] = {}
+        self._use_counter = 0
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def get_glyph(self, character: str | int, size: FontFaceSize) -> GlyphAtlasGlyph:
+        if isinstance(character, str):
+            if len(character) != 1:
+                raise ValueError("only a single character may be rendered")
+            character = size.face.get_glyph_index(character)
+
+        if self._sdf_reference_size is None:
+            render_size = size
+        else:
+            try:
+                render_size = self._sdf_reference_sizes[size.face]
+            except KeyError:
+                render_size = self._sdf_reference_sizes[size.face] = size.face.request_pixel_size(
+                    height=self._sdf_reference_size
+                )
+
+        self._use_counter += 1
+        key = (render_size, character)
+        try:
+            glyph = self._glyphs[key]
+        except KeyError:
+            glyph = self._add_glyph(key)
+        if glyph.page is not None:
+            self._pages[glyph.page].last_used = self._use_counter
+
+        if render_size is not size:
+            scale = FVector2(
+                size._scale[0] / render_size._scale[0], size._scale[1] / render_size._scale[1]
+            )
+            glyph = glyph._replace(bearing=glyph.bearing * scale, scale=scale)
+        return glyph
+
+    def _add_glyph(self, key: _GlyphKey) -> GlyphAtlasGlyph:
+        size, glyph_index = key
+        rendered_glyph = size.face.render_glyph(glyph_index, size, format=self._format)
+        width, height = rendered_glyph.size
+
+        if width == 0 or height == 0:
+            glyph = GlyphAtlasGlyph(
+                None, IBoundingBox2d(IVector2(0), IVector2(0)), rendered_glyph.bearing
+            )
+            self._glyphs[key] = glyph
+            return glyph
+
+        padded_width = width + self._padding
+        padded_height = height + self._padding
+        if padded_width > self._page_size.x or padded_height > self._page_size.y:
+            raise ValueError("glyph is too large for the atlas page size")
+
+        page_index, position = self._allocate(padded_width, padded_height)
+        page = self._pages[page_index]
+
+        row_size = width * self._channels
+        stride = self._page_size.x * self._channels
+        offset = (position.y * self._page_size.x + position.x) * self._channels
+        data = memoryview(rendered_glyph.data)
+        for y in range(height):
+            row_offset = offset + y * stride
+            page.data[row_offset : row_offset + row_size] = data[y * row_size : (y + 1) * row_size]
+        page.mark_dirty(position.x, position.y, position.x + width, position.y + height)
+
+        glyph = GlyphAtlasGlyph(
+            page_index,
+            IBoundingBox2d(IVector2(position.x, position.y), IVector2(width, height)),
+            rendered_glyph.bearing,
+        )
+        page.keys.append(key)
+        self._glyphs[key] = glyph
+        return glyph
+
+    def _allocate(self, width: int, height: int) -> tuple[int, UVector2]:
+        for page_index, page in enumerate(self._pages):
+            position = page.allocate(width, height, self._page_size)
+            if position is not None:
+                return page_index, position
+
+        if self._max_pages is None or len(self._pages) < self._max_pages:
+            page_index = len(self._pages)
+            page = _GlyphAtlasPage(self._page_size, self._channels)
+            self._pages.append(page)
+        else:
+            page_index, page = min(enumerate(self._pages), key=lambda p: p[1].last_used)
+            for key in page.keys:
+                del self._glyphs[key]
+            page.reset()
+
+        position = page.allocate(width, height, self._page_size)
+        assert position is not None
+        return page_index, position
+
+    def get_page_data(self, page: int) -> memoryview:
+        return memoryview(self._pages[page].data).toreadonly()
+
+    def pop_dirty_regions(self) -> dict[int, IBoundingBox2d]:
+        dirty_regions: dict[int, IBoundingBox2d] = {}
+        for page_index, page in enumerate(self._pages):
+            if page.dirty is None:
+                continue
+            x, y, extent_x, extent_y = page.dirty
+            dirty_regions[page_index] = IBoundingBox2d(
+                IVector2(x, y), IVector2(extent_x - x, extent_y - y)
+            )
+            page.dirty = None
+        return dirty_regions
+
+    def clear(self) -> None:
+        for page in self._pages:
+            page.reset()
+        self._glyphs.clear()
+
+    @property
+    def format(self) -> RenderedGlyphFormat:
+        return self._format
+
+    @property
+    def sdf_reference_size(self) -> int | None:
+        return self._sdf_reference_size
+
+    @property
+    def channels(self) -> int:
+        return self._channels
+
+    @property
+    def page_size(self) -> UVector2:
+        return self._page_size
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+
+class _GlyphAtlasPage:
+    def __init__(self, size: UVector2, channels: int):
+        self.data = bytearray(size.x * size.y * channels)
+        self.size = size
+        self.reset()
+
+    def reset(self) -> None:
+        self.data[:] = bytes(len(self.data))
+        # each shelf is a row of glyphs: [y, height, next x]
+        self.shelves: list[list[int]] = []
+        self.next_shelf_y = 0
+        self.keys: list[_GlyphKey] = []
+        self.last_used = 0
+        self.dirty: tuple[int, int, int, int] | None = (0, 0, self.size.x, self.size.y)
+
+    def allocate(self, width: int, height: int, page_size: UVector2) -> UVector2 | None:
+        best_shelf: list[int] | None = None
+        for shelf in self.shelves:
+            shelf_y, shelf_height, shelf_next_x = shelf
+            if shelf_height < height or shelf_next_x + width > page_size.x:
+                continue
+            if best_shelf is None or shelf_height < best_shelf[1]:
+                best_shelf = shelf
+
+        if best_shelf is None:
+            if self.next_shelf_y + height > page_size.y:
+                return None
+            best_shelf = [self.next_shelf_y, height, 0]
+            self.shelves.append(best_shelf)
+            self.next_shelf_y += height
+
+        position = UVector2(best_shelf[2], best_shelf[0])
+        best_shelf[2] += width
+        return position
+
+    def mark_dirty(self, x: int, y: int, extent_x: int, extent_y: int) -> None:
+        if self.dirty is None:
+            self.dirty = (x, y, extent_x, extent_y)
+        else:
+            self.dirty = (
+                min(x, self.dirty[0]),
+                min(y, self.dirty[1]),
+                max(extent_x, self.dirty[2]),
+                max(extent_y, self.dirty[3]),
+            )
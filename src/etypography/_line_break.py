@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+__all__ = ["break_text_uax14_line", "break_text_uax14_line_offsets"]
+
+from array import array
+from typing import Final
+from typing import Generator
+
+from ._break_text import BreakTextChunk
+from ._break_text import BreakTextOffsets
+from ._unicode_tables import LB_AL
+from ._unicode_tables import LB_BA
+from ._unicode_tables import LB_BK
+from ._unicode_tables import LB_CB
+from ._unicode_tables import LB_CL
+from ._unicode_tables import LB_CLASS_COUNT
+from ._unicode_tables import LB_CM
+from ._unicode_tables import LB_CP
+from ._unicode_tables import LB_CP_EA
+from ._unicode_tables import LB_CR
+from ._unicode_tables import LB_DIRECT
+from ._unicode_tables import LB_HH
+from ._unicode_tables import LB_HL
+from ._unicode_tables import LB_HY
+from ._unicode_tables import LB_IS
+from ._unicode_tables import LB_LF
+from ._unicode_tables import LB_MASK
+from ._unicode_tables import LB_NL
+from ._unicode_tables import LB_NU
+from ._unicode_tables import LB_OP
+from ._unicode_tables import LB_OP_EA
+from ._unicode_tables import LB_PAIRS
+from ._unicode_tables import LB_PO
+from ._unicode_tables import LB_PR
+from ._unicode_tables import LB_PROHIBITED
+from ._unicode_tables import LB_RI
+from ._unicode_tables import LB_SHIFT
+from ._unicode_tables import LB_SOT
+from ._unicode_tables import LB_SP
+from ._unicode_tables import LB_STAGE_1
+from ._unicode_tables import LB_STAGE_2
+from ._unicode_tables import LB_SY
+from ._unicode_tables import LB_ZW
+from ._unicode_tables import LB_ZWJ
+
+# lb4 and lb5
+_MANDATORY_BREAK_CLASSES: Final = frozenset((LB_BK, LB_CR, LB_LF, LB_NL))
+# lb6 and lb7
+_NO_BREAK_BEFORE_CLASSES: Final = _MANDATORY_BREAK_CLASSES | {LB_SP, LB_ZW}
+# lb9, the classes that combining marks don't attach to
+_NO_COMBINE_CLASSES: Final = _NO_BREAK_BEFORE_CLASSES | {LB_SOT}
+_COMBINING_CLASSES: Final = frozenset((LB_CM, LB_ZWJ))
+# the classes either side of a position that mean one of lb4 to lb10 may apply to it
+_SPECIAL_PREVIOUS_CLASSES: Final = _MANDATORY_BREAK_CLASSES | {LB_ZWJ}
+_SPECIAL_CLASSES: Final = _NO_BREAK_BEFORE_CLASSES | _COMBINING_CLASSES
+
+_OPEN_CLASSES: Final = frozenset((LB_OP, LB_OP_EA))
+# lb25
+_NUMBER_CONTINUE_CLASSES: Final = frozenset((LB_NU, LB_SY, LB_IS))
+_NUMBER_CLOSE_CLASSES: Final = frozenset((LB_CL, LB_CP, LB_CP_EA))
+_NUMBER_AFFIX_CLASSES: Final = frozenset((LB_PR, LB_PO))
+# lb20a and lb21a
+_HYPHEN_CLASSES: Final = frozenset((LB_HY, LB_HH))
+_HL_HYPHEN_CLASSES: Final = _HYPHEN_CLASSES | {LB_BA}
+# lb20a, the classes that a hyphen must follow to be at the start of a word
+_WORD_START_CLASSES: Final = _MANDATORY_BREAK_CLASSES | {LB_SOT, LB_ZW, LB_CB}
+# the classes before a position that the rules which need more than the pair table depend on
+_CONTEXT_BEFORE_CLASSES: Final = (
+    _NUMBER_CONTINUE_CLASSES
+    | _NUMBER_CLOSE_CLASSES
+    | _NUMBER_AFFIX_CLASSES
+    | _HL_HYPHEN_CLASSES
+    | {LB_RI}
+)
+# the classes that change the state kept for those rules
+_CONTEXT_CLASSES: Final = (
+    _NUMBER_CONTINUE_CLASSES | _NUMBER_CLOSE_CLASSES | _HYPHEN_CLASSES | {LB_RI, LB_ZW}
+)
+_STATE_CLASSES: Final = _CONTEXT_CLASSES | _COMBINING_CLASSES | {LB_SP}
+
+# the classes of the bmp as characters, so that the classes of a whole string can be looked up
+# with str.translate
+_BMP_CLASSES: Final = b"".join(
+    LB_STAGE_2[block << LB_SHIFT : (block + 1) << LB_SHIFT]
+    for block in LB_STAGE_1[: 0x10000 >> LB_SHIFT]
+).decode("latin-1")
+
+
+def break_text_uax14_line(text: str) -> Generator[BreakTextChunk, None, None]:
+    start = 0
+    for end, force_break in zip(*break_text_uax14_line_offsets(text)):
+        yield BreakTextChunk(text[start:end], bool(force_break))
+        start = end
+
+
+def break_text_uax14_line_offsets(text: str) -> BreakTextOffsets:
+    # the line breaking algorithm of uax 14 as icu implements it, the rules that depend only on
+    # the classes either side of a position, ignoring spaces, are in the pair table and the rest
+    # are applied here
+    offsets = array("I")
+    force_breaks = array("B")
+    if not text:
+        return BreakTextOffsets(offsets, force_breaks)
+
+    try:
+        # characters outside of the bmp are left as they are, so can't be encoded
+        classes: bytes | list[int] = text.translate(_BMP_CLASSES).encode("latin-1")
+    except UnicodeEncodeError:
+        stage_1 = LB_STAGE_1
+        stage_2 = LB_STAGE_2
+        classes = [
+            stage_2[stage_1[c >> LB_SHIFT] << LB_SHIFT | c & LB_MASK] for c in map(ord, text)
+        ]
+
+    pairs = LB_PAIRS
+    append_offset = offsets.append
+    append_force_break = force_breaks.append
+    mandatory_break_classes = _MANDATORY_BREAK_CLASSES
+    no_break_before_classes = _NO_BREAK_BEFORE_CLASSES
+    no_combine_classes = _NO_COMBINE_CLASSES
+    combining_classes = _COMBINING_CLASSES
+    special_previous_classes = _SPECIAL_PREVIOUS_CLASSES
+    special_classes = _SPECIAL_CLASSES
+    context_before_classes = _CONTEXT_BEFORE_CLASSES
+    context_classes = _CONTEXT_CLASSES
+    state_classes = _STATE_CLASSES
+
+    # the class of the previous character
+    previous = LB_SOT
+    # the class that the pair table is indexed by, the last character that isn't a space with
+    # combining marks taking the class of the character they're attached to
+    before = LB_SOT
+    # the class of the character before that, if there were no spaces between them
+    before_before = LB_SOT
+    spaces = False
+    # lb8, whether the position follows zw sp*
+    after_zw = False
+    # lb25, whether the position follows nu (nu | sy | is)* or that followed by (cl | cp)
+    in_number = False
+    after_number_close = False
+    # lb20a, whether the position follows a hyphen at the start of a word
+    after_word_start_hyphen = False
+    # lb30a, whether the position follows an odd number of regional indicators
+    after_odd_ri = False
+
+    for i, c in enumerate(classes):
+        if i:
+            after = c
+            if previous in special_previous_classes or c in special_classes or after_zw:
+                after = LB_SOT
+                if previous in mandatory_break_classes and (previous != LB_CR or c != LB_LF):
+                    # lb4 and lb5
+                    append_offset(i)
+                    append_force_break(True)
+                elif c in no_break_before_classes:
+                    # lb6 and lb7
+                    pass
+                elif after_zw:
+                    # lb8
+                    append_offset(i)
+                    append_force_break(False)
+                elif previous == LB_ZWJ or previous not in no_combine_classes:
+                    # lb8a and lb9
+                    pass
+                else:
+                    # lb10
+                    after = LB_AL
+            if after != LB_SOT:
+                action = pairs[before * LB_CLASS_COUNT + after]
+                if action == LB_DIRECT:
+                    if (
+                        spaces
+                        or before not in context_before_classes
+                        or _is_context_break(
+                            classes,
+                            i,
+                            before,
+                            before_before,
+                            after,
+                            in_number,
+                            after_number_close,
+                            after_word_start_hyphen,
+                            after_odd_ri,
+                        )
+                    ):
+                        append_offset(i)
+                        append_force_break(False)
+                elif action == LB_PROHIBITED:
+                    # lb15c
+                    if (
+                        spaces
+                        and after == LB_IS
+                        and before not in _OPEN_CLASSES
+                        and _is_number_start(classes, i)
+                    ):
+                        append_offset(i)
+                        append_force_break(False)
+                elif spaces:
+                    append_offset(i)
+                    append_force_break(False)
+
+        if c in state_classes:
+            if c in combining_classes:
+                if previous not in no_combine_classes:
+                    # lb9, the mark takes the class of the character it's attached to
+                    previous = c
+                    continue
+                # lb10
+                previous = c
+                c = LB_AL
+            elif c == LB_SP:
+                previous = c
+                spaces = True
+                continue
+            else:
+                # icu doesn't apply lb20a where lb8a or lb14 already matched the hyphen
+                after_word_start_hyphen = (
+                    c in _HYPHEN_CLASSES
+                    and previous != LB_ZWJ
+                    and (before not in _OPEN_CLASSES if spaces else before in _WORD_START_CLASSES)
+                )
+                if spaces:
+                    in_number = after_number_close = False
+                if c == LB_NU:
+                    in_number = True
+                    after_number_close = False
+                elif c == LB_SY or c == LB_IS:
+                    after_number_close = False
+                elif c in _NUMBER_CLOSE_CLASSES:
+                    after_number_close = in_number
+                    in_number = False
+                else:
+                    in_number = after_number_close = False
+                after_odd_ri = c == LB_RI and not (before == LB_RI and not spaces and after_odd_ri)
+                after_zw = c == LB_ZW
+                previous = c
+                before_before = LB_SOT if spaces else before
+                before = c
+                spaces = False
+                continue
+        else:
+            previous = c
+        in_number = after_number_close = after_word_start_hyphen = after_odd_ri = False
+        after_zw = False
+        before_before = LB_SOT if spaces else before
+        before = c
+        spaces = False
+
+    append_offset(len(classes))
+    append_force_break(previous in mandatory_break_classes)
+    return BreakTextOffsets(offsets, force_breaks)
+
+
+def _is_context_break(
+    classes: bytes | list[int],
+    i: int,
+    before: int,
+    before_before: int,
+    after: int,
+    in_number: bool,
+    after_number_close: bool,
+    after_word_start_hyphen: bool,
+    after_odd_ri: bool,
+) -> bool:
+    # the rules that can stop a break that the pair table gives when there are no spaces
+    if before == LB_RI:
+        # lb30a
+        return not (after == LB_RI and after_odd_ri)
+    if before in _NUMBER_CONTINUE_CLASSES:
+        # lb25
+        return not in_number or (after != LB_NU and after not in _NUMBER_AFFIX_CLASSES)
+    if before in _NUMBER_CLOSE_CLASSES:
+        # lb25
+        return not after_number_close or after not in _NUMBER_AFFIX_CLASSES
+    if before in _NUMBER_AFFIX_CLASSES:
+        # lb25
+        return after not in _OPEN_CLASSES or not _is_number_start(classes, i + 1)
+    if after == LB_AL and after_word_start_hyphen:
+        # lb20a
+        return False
+    # lb21a
+    return before_before != LB_HL or after == LB_CB
+
+
+def _is_number_start(classes: bytes | list[int], i: int) -> bool:
+    # lb25, whether the text from i is (is)? nu, ignoring combining marks
+    length = len(classes)
+    while i < length and classes[i] in _COMBINING_CLASSES:
+        i += 1
+    if i < length and classes[i] == LB_IS:
+        i += 1
+        while i < length and classes[i] in _COMBINING_CLASSES:
+            i += 1
+    return i < length and classes[i] == LB_NU
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+__all__ = ()
+
+from struct import Struct
+from struct import error as StructError
+from typing import Final
+
+from uharfbuzz import Face as HbFace  # type: ignore
+from uharfbuzz import OTLayoutGlyphClass as HbOTLayoutGlyphClass  # type: ignore
+
+_U16: Final = Struct(">H")
+_U32: Final = Struct(">I")
+# minor version, script list, feature list and lookup list offsets
+_HEADER: Final = Struct(">HHHH")
+_FEATURE_RECORD: Final = Struct(">4sH")
+_LOOKUP: Final = Struct(">HHH")
+_COVERAGE: Final = Struct(">HH")
+
+# tables that harfbuzz uses to shape text other than gsub and gpos, if a face has any of these
+# then which glyphs are affected by shaping isn't known
+_OTHER_SHAPING_TABLES: Final = frozenset(("kern", "morx", "mort", "kerx", "trak"))
+
+# lookup types, keyed by table, for extension, ligature, context and chained context lookups
+_LOOKUP_TYPES: Final = {"GSUB": (7, 4, 5, 6), "GPOS": (9, None, 7, 8)}
+
+# the features that harfbuzz applies to horizontal left to right text by default, the fraction
+# features are also applied but only around a fraction slash
+_DEFAULT_FEATURES: Final = frozenset(
+    (
+        b"abvm",
+        b"blwm",
+        b"calt",
+        b"ccmp",
+        b"clig",
+        b"curs",
+        b"dist",
+        b"kern",
+        b"liga",
+        b"locl",
+        b"ltra",
+        b"ltrm",
+        b"mark",
+        b"mkmk",
+        b"rand",
+        b"rclt",
+        b"rlig",
+        b"rvrn",
+    )
+)
+
+
+def _get_mark_glyphs(hb_face: HbFace) -> frozenset[int]:
+    return frozenset(
+        glyph
+        for glyph in range(hb_face.glyph_count)
+        if hb_face.get_layout_glyph_class(glyph) == HbOTLayoutGlyphClass.MARK
+    )
+
+
+def _get_shaping_glyphs(hb_face: HbFace, mark_glyphs: frozenset[int]) -> frozenset[int] | None:
+    # the glyphs that may be substituted or positioned by harfbuzz, or cause other glyphs to be,
+    # in text without any marks, none is returned when that can't be known
+    table_tags = set(hb_face.table_tags)
+    if table_tags & _OTHER_SHAPING_TABLES:
+        return None
+    glyphs: set[int] = set()
+    for tag, lookup_types in _LOOKUP_TYPES.items():
+        if tag not in table_tags:
+            continue
+        try:
+            if not _add_table_shaping_glyphs(
+                hb_face.reference_table(tag).data, *lookup_types, mark_glyphs, glyphs
+            ):
+                return None
+        except StructError:
+            # the table is malformed, so there's no telling what harfbuzz will make of it
+            return None
+    return frozenset(glyphs)
+
+
+def _add_table_shaping_glyphs(
+    data: bytes,
+    extension_type: int,
+    ligature_type: int | None,
+    context_type: int,
+    chained_context_type: int,
+    mark_glyphs: frozenset[int],
+    glyphs: set[int],
+) -> bool:
+    minor_version, _, feature_list_offset, lookup_list_offset = _HEADER.unpack_from(data, 2)
+    if minor_version >= 1 and _U32.unpack_from(data, 10)[0]:
+        # feature variations swap in other lookups depending on the variation coordinates
+        return False
+
+    # lookups that are only referenced by context lookups can only be applied once the context
+    # lookup has matched, so only the lookups of features need to be considered
+    lookup_indices: set[int] = set()
+    feature_count = _U16.unpack_from(data, feature_list_offset)[0]
+    for i in range(feature_count):
+        feature_tag, feature_offset = _FEATURE_RECORD.unpack_from(
+            data, feature_list_offset + 2 + i * _FEATURE_RECORD.size
+        )
+        if feature_tag not in _DEFAULT_FEATURES:
+            continue
+        feature_offset += feature_list_offset
+        lookup_index_count = _U16.unpack_from(data, feature_offset + 2)[0]
+        lookup_indices.update(_unpack_u16s(data, feature_offset + 4, lookup_index_count))
+
+    for lookup_index in lookup_indices:
+        lookup_offset = (
+            lookup_list_offset
+            + _U16.unpack_from(data, lookup_list_offset + 2 + lookup_index * 2)[0]
+        )
+        lookup_type, _, subtable_count = _LOOKUP.unpack_from(data, lookup_offset)
+        for subtable_offset in _unpack_u16s(data, lookup_offset + 6, subtable_count):
+            subtable_offset += lookup_offset
+            subtable_type = lookup_type
+            if subtable_type == extension_type:
+                subtable_type = _U16.unpack_from(data, subtable_offset + 2)[0]
+                subtable_offset += _U32.unpack_from(data, subtable_offset + 4)[0]
+
+            format = _U16.unpack_from(data, subtable_offset)[0]
+            if subtable_type == ligature_type:
+                _add_ligature_shaping_glyphs(data, subtable_offset, mark_glyphs, glyphs)
+            elif format == 3 and subtable_type in (context_type, chained_context_type):
+                _add_context_shaping_glyphs(
+                    data,
+                    subtable_offset,
+                    subtable_type == chained_context_type,
+                    mark_glyphs,
+                    glyphs,
+                )
+            else:
+                # every other subtable starts matching at the glyphs in its coverage
+                glyphs.update(
+                    _get_coverage(
+                        data, subtable_offset + _U16.unpack_from(data, subtable_offset + 2)[0]
+                    )
+                )
+    return True
+
+
+def _add_ligature_shaping_glyphs(
+    data: bytes, offset: int, mark_glyphs: frozenset[int], glyphs: set[int]
+) -> None:
+    first_glyphs = _get_coverage(data, offset + _U16.unpack_from(data, offset + 2)[0])
+    ligature_set_count = _U16.unpack_from(data, offset + 4)[0]
+    for first_glyph, ligature_set_offset in zip(
+        first_glyphs, _unpack_u16s(data, offset + 6, ligature_set_count)
+    ):
+        ligature_set_offset += offset
+        ligature_count = _U16.unpack_from(data, ligature_set_offset)[0]
+        for ligature_offset in _unpack_u16s(data, ligature_set_offset + 2, ligature_count):
+            ligature_offset += ligature_set_offset
+            component_count = _U16.unpack_from(data, ligature_offset + 2)[0]
+            # a ligature of a glyph followed by a mark, such as those used to compose accented
+            # characters, can't form without the mark
+            if (
+                component_count < 2
+                or _U16.unpack_from(data, ligature_offset + 4)[0] not in mark_glyphs
+            ):
+                glyphs.add(first_glyph)
+                break
+
+
+def _add_context_shaping_glyphs(
+    data: bytes, offset: int, is_chained: bool, mark_glyphs: frozenset[int], glyphs: set[int]
+) -> None:
+    if is_chained:
+        backtrack_count = _U16.unpack_from(data, offset + 2)[0]
+        input_offset = offset + 4 + backtrack_count * 2
+        input_count = _U16.unpack_from(data, input_offset)[0]
+        input_coverage_offsets = _unpack_u16s(data, input_offset + 2, input_count)
+        lookahead_offset = input_offset + 2 + input_count * 2
+        lookahead_count = _U16.unpack_from(data, lookahead_offset)[0]
+        coverage_offsets = (
+            *_unpack_u16s(data, offset + 4, backtrack_count),
+            *input_coverage_offsets,
+            *_unpack_u16s(data, lookahead_offset + 2, lookahead_count),
+        )
+    else:
+        input_count = _U16.unpack_from(data, offset + 2)[0]
+        coverage_offsets = input_coverage_offsets = _unpack_u16s(data, offset + 6, input_count)
+    if not input_coverage_offsets:
+        return
+    # the context can't match without a mark if any of its glyphs must be one
+    for coverage_offset in coverage_offsets:
+        if mark_glyphs.issuperset(_get_coverage(data, offset + coverage_offset)):
+            return
+    glyphs.update(_get_coverage(data, offset + input_coverage_offsets[0]))
+
+
+def _get_coverage(data: bytes, offset: int) -> list[int]:
+    format, count = _COVERAGE.unpack_from(data, offset)
+    if format == 1:
+        return list(_unpack_u16s(data, offset + 4, count))
+    if format == 2:
+        ranges = _unpack_u16s(data, offset + 4, count * 3)
+        return [
+            glyph
+            for start, end in zip(ranges[0::3], ranges[1::3])
+            for glyph in range(start, end + 1)
+        ]
+    raise StructError("unknown coverage format")
+
+
+def _unpack_u16s(data: bytes, offset: int, count: int) -> tuple[int, ...]:
+    return Struct(f">{count}H").unpack_from(data, offset)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+__all__ = ["render_glyphs_parallel"]
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from itertools import repeat
+from typing import Iterable
+
+from emath import FVector2Array
+from emath import U32Array
+from emath import UVector2Array
+
+from ._font_face import FontFaceSize
+from ._font_face import RenderedGlyphFormat
+from ._font_face import RenderedGlyphs
+
+_PickledRenderedGlyphs = tuple[bytes, bytes, bytes, bytes, bytes, RenderedGlyphFormat]
+
+
+def render_glyphs_parallel(
+    jobs: Iterable[tuple[FontFaceSize, Iterable[int]]],
+    *,
+    format: RenderedGlyphFormat | None = None,
+    max_workers: int | None = None,
+) -> list[RenderedGlyphs]:
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    elif max_workers < 1:
+        raise ValueError("max workers must be 1 or greater")
+
+    job_list = [(size, list(glyph_indices)) for size, glyph_indices in jobs]
+    if not job_list:
+        return []
+
+    # each worker is sent a contiguous batch of jobs, so that a face shared by several jobs is
+    # only pickled and loaded once per batch
+    batch_size = -(-len(job_list) // max_workers)
+    batches = [job_list[i : i + batch_size] for i in range(0, len(job_list), batch_size)]
+    with ProcessPoolExecutor(max_workers=len(batches)) as executor:
+        results = chain.from_iterable(executor.map(_render_glyphs_batch, batches, repeat(format)))
+        return [_load_rendered_glyphs(*result) for result in results]
+
+
+def _render_glyphs_batch(
+    jobs: list[tuple[FontFaceSize, list[int]]], format: RenderedGlyphFormat | None
+) -> list[_PickledRenderedGlyphs]:
+    results: list[_PickledRenderedGlyphs] = []
+    for size, glyph_indices in jobs:
+        rendered_glyphs = size.face.render_glyphs(glyph_indices, size, format=format)
+        # emath arrays cannot be pickled, so they are sent back as their raw data
+        results.append(
+            (
+                rendered_glyphs.data,
+                bytes(rendered_glyphs.glyph_indices),
+                bytes(rendered_glyphs.offsets),
+                bytes(rendered_glyphs.sizes),
+                bytes(rendered_glyphs.bearings),
+                rendered_glyphs.format,
+            )
+        )
+    return results
+
+
+def _load_rendered_glyphs(
+    data: bytes,
+    glyph_indices: bytes,
+    offsets: bytes,
+    sizes: bytes,
+    bearings: bytes,
+    format: RenderedGlyphFormat,
+) -> RenderedGlyphs:
+    return RenderedGlyphs(
+        data,
+        U32Array.from_buffer(glyph_indices),
+        U32Array.from_buffer(offsets),
+        UVector2Array.from_buffer(sizes),
+        FVector2Array.from_buffer(bearings),
+        format,
+    )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+__all__ = ["RenderedGlyphCache"]
+
+from ._cache import CacheInfo
+from ._cache import _LruCache
+from ._font_face import FontFace
+from ._font_face import FontFaceSize
+from ._font_face import RenderedGlyph
+from ._font_face import RenderedGlyphFormat
+
+_RenderedGlyphKey = tuple[FontFace, FontFaceSize, int, RenderedGlyphFormat]
+
+
+class RenderedGlyphCache:
+    def __init__(self, max_bytes: int | None = 4 * 1024 * 1024):
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max bytes must be 0 or greater")
+        self._cache: _LruCache[_RenderedGlyphKey, RenderedGlyph] = _LruCache(
+            max_bytes, _get_rendered_glyph_bytes
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def render_glyph(
+        self,
+        character: str | int,
+        size: FontFaceSize,
+        *,
+        format: RenderedGlyphFormat | None = None,
+    ) -> RenderedGlyph:
+        if format is None:
+            format = RenderedGlyphFormat.ALPHA
+        if isinstance(character, str):
+            if len(character) != 1:
+                raise ValueError("only a single character may be rendered")
+            character = size.face.get_glyph_index(character)
+
+        key = (size.face, size, character, format)
+        rendered_glyph = self._cache.get(key)
+        if rendered_glyph is None:
+            rendered_glyph = size.face.render_glyph(character, size, format=format)
+            self._cache.put(key, rendered_glyph)
+        return rendered_glyph
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    @property
+    def info(self) -> CacheInfo:
+        return self._cache.info
+
+
+def _get_rendered_glyph_bytes(rendered_glyph: RenderedGlyph) -> int:
+    return len(rendered_glyph.data)
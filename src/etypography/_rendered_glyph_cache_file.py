@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+__all__ = ["RenderedGlyphCacheFile"]
+
+import os
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as get_package_version
+from mmap import ACCESS_READ
+from mmap import mmap
+from os import PathLike
+from struct import Struct
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Final
+
+from emath import FVector2
+from emath import UVector2
+from freetype import version as get_freetype_version  # type: ignore
+
+from ._font_face import FontFaceSize
+from ._font_face import RenderedGlyph
+from ._font_face import RenderedGlyphFormat
+
+_MAGIC: Final = b"ETYPOGLC"
+_FORMAT_VERSION: Final = 1
+_HEADER: Final = Struct("<8sH")
+# font content hash, format, glyph index, width, height, bearing x, bearing y, data length and
+# size key length, followed by the size key and then the data
+_RECORD: Final = Struct("<32sBIIIffIH")
+
+_RenderedGlyphKey = tuple[bytes, str, int, RenderedGlyphFormat]
+
+
+class RenderedGlyphCacheFile:
+    def __init__(self, path: str | PathLike[str]):
+        self._path = os.fspath(path)
+        self._lock = Lock()
+        self._index: dict[_RenderedGlyphKey, RenderedGlyph] = {}
+        self._open()
+
+    def _open(self) -> None:
+        header = _get_header()
+        file = open(self._path, "a+b", buffering=0)
+        try:
+            file_size = os.fstat(file.fileno()).st_size
+            map = mmap(file.fileno(), 0, access=ACCESS_READ) if file_size else None
+            if map is None or not self._load(map, header):
+                # the file is replaced rather than truncated, other processes may still have the
+                # old file mapped
+                self._index.clear()
+                if map is not None:
+                    map.close()
+                file.close()
+                self._replace(header)
+                file = open(self._path, "a+b", buffering=0)
+                map = mmap(file.fileno(), 0, access=ACCESS_READ)
+        except:
+            file.close()
+            raise
+        self._file = file
+        self._map: mmap | None = map
+
+    def _load(self, map: mmap, header: bytes) -> bool:
+        if map[: len(header)] != header:
+            return False
+        data = memoryview(map)
+        offset = len(header)
+        while offset < len(map):
+            record_end = offset + _RECORD.size
+            if record_end > len(map):
+                return False
+            (
+                content_hash,
+                format,
+                glyph_index,
+                width,
+                height,
+                bearing_x,
+                bearing_y,
+                data_length,
+                size_key_length,
+            ) = _RECORD.unpack_from(map, offset)
+            data_offset = record_end + size_key_length
+            data_end = data_offset + data_length
+            if data_end > len(map):
+                # the process that wrote this record most likely died part way through
+                return False
+            try:
+                size_key = bytes(data[record_end:data_offset]).decode("utf8")
+                rendered_glyph_format = RenderedGlyphFormat(format)
+            except ValueError:
+                return False
+            self._index[(content_hash, size_key, glyph_index, rendered_glyph_format)] = (
+                RenderedGlyph(
+                    data[data_offset:data_end],
+                    UVector2(width, height),
+                    FVector2(bearing_x, bearing_y),
+                    rendered_glyph_format,
+                )
+            )
+            offset = data_end
+        return True
+
+    def _replace(self, header: bytes) -> None:
+        directory = os.path.dirname(os.path.abspath(self._path))
+        with NamedTemporaryFile(dir=directory, delete=False) as file:
+            file.write(header)
+        os.replace(file.name, self._path)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __enter__(self) -> RenderedGlyphCacheFile:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def render_glyph(
+        self,
+        character: str | int,
+        size: FontFaceSize,
+        *,
+        format: RenderedGlyphFormat | None = None,
+    ) -> RenderedGlyph:
+        if format is None:
+            format = RenderedGlyphFormat.ALPHA
+        if isinstance(character, str):
+            if len(character) != 1:
+                raise ValueError("only a single character may be rendered")
+            character = size.face.get_glyph_index(character)
+
+        key = (size.face._get_content_hash(), _get_size_key(size), character, format)
+        try:
+            return self._index[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if self._map is None:
+                raise ValueError("cache file is closed")
+            rendered_glyph = self._index.get(key)
+            if rendered_glyph is None:
+                rendered_glyph = size.face.render_glyph(character, size, format=format)
+                self._append(key, rendered_glyph)
+                self._index[key] = rendered_glyph
+        return rendered_glyph
+
+    def _append(self, key: _RenderedGlyphKey, rendered_glyph: RenderedGlyph) -> None:
+        content_hash, size_key, glyph_index, format = key
+        encoded_size_key = size_key.encode("utf8")
+        record = b"".join(
+            (
+                _RECORD.pack(
+                    content_hash,
+                    format.value,
+                    glyph_index,
+                    rendered_glyph.size.x,
+                    rendered_glyph.size.y,
+                    rendered_glyph.bearing.x,
+                    rendered_glyph.bearing.y,
+                    len(rendered_glyph.data),
+                    len(encoded_size_key),
+                ),
+                encoded_size_key,
+                rendered_glyph.data,
+            )
+        )
+        # the file is opened for appending, so a record written in a single call won't interleave
+        # with records appended by other processes
+        written = os.write(self._file.fileno(), record)
+        if written != len(record):
+            raise OSError(f"only {written} of {len(record)} bytes could be written")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index.clear()
+            self._close()
+            self._replace(_get_header())
+            self._open()
+
+    def close(self) -> None:
+        with self._lock:
+            self._index.clear()
+            self._close()
+
+    def _close(self) -> None:
+        if self._map is None:
+            return
+        self._file.close()
+        try:
+            self._map.close()
+        except BufferError:
+            # rendered glyphs returned from the cache still reference the mapping, it will be
+            # closed once they are released
+            pass
+        self._map = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+
+def _get_header() -> bytes:
+    try:
+        etypography_version = get_package_version("etypography")
+    except PackageNotFoundError:
+        etypography_version = ""
+    # rendered glyphs depend on both this library and the version of freetype doing the rendering
+    version = (
+        f"{_FORMAT_VERSION}/{etypography_version}/"
+        f"{'.'.join(str(v) for v in get_freetype_version())}"
+    ).encode("utf8")
+    return _HEADER.pack(_MAGIC, len(version)) + version
+
+
+def _get_size_key(size: FontFaceSize) -> str:
+    size_type, args = size._ft_size_key  # type: ignore
+    return f"{size_type.__name__}{args!r}"
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+__all__ = ["SharedRenderedGlyphCache"]
+
+from hashlib import blake2b
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from typing import Any
+from typing import Final
+
+from emath import FVector2
+from emath import UVector2
+
+from ._cache import CacheInfo
+from ._font_face import FontFaceSize
+from ._font_face import RenderedGlyph
+from ._font_face import RenderedGlyphFormat
+from ._rendered_glyph_cache_file import _get_size_key
+
+_MAGIC: Final = b"ETYPOSGC"
+# magic, sequence, slot count, data size, head, tail, wrap end, used bytes and glyph count
+_HEADER: Final = Struct("<8sQQQQQQQQ")
+_SEQUENCE: Final = Struct("<Q")
+_SEQUENCE_OFFSET: Final = 8
+# key and entry offset, an all zero key marks an empty slot
+_SLOT: Final = Struct("<16sQ")
+_EMPTY_KEY: Final = bytes(16)
+# key, data length, width, height, bearing x, bearing y and format, followed by the data
+_ENTRY: Final = Struct("<16sIIIffB")
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class SharedRenderedGlyphCache:
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, *, max_glyphs: int = 4096):
+        if max_bytes < 0:
+            raise ValueError("max bytes must be 0 or greater")
+        if max_glyphs < 1:
+            raise ValueError("max glyphs must be 1 or greater")
+        # the table is kept at most half full so that probes stay short
+        slot_count = max_glyphs * 2
+        data_size = _align(max_bytes)
+        self._shared_memory = SharedMemory(
+            create=True, size=_HEADER.size + slot_count * _SLOT.size + data_size
+        )
+        # a lock from a fork context can't be sent to spawned processes, whereas a lock from a
+        # spawn context works with both
+        self._lock = get_context("spawn").Lock()
+        _HEADER.pack_into(
+            self._shared_memory.buf, 0, _MAGIC, 0, slot_count, data_size, 0, 0, 0, 0, 0
+        )
+        self._init()
+
+    def _init(self) -> None:
+        self._buffer = self._shared_memory.buf
+        _, _, self._slot_count, self._data_size, *_ = _HEADER.unpack_from(self._buffer, 0)
+        self._max_glyphs = self._slot_count // 2
+        self._data_offset = _HEADER.size + self._slot_count * _SLOT.size
+        self._hits = 0
+        self._misses = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the lock can only be sent to child processes as they are started, so the cache must be
+        # shared with workers through inheritance
+        return {"name": self._shared_memory.name, "lock": self._lock}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._shared_memory = SharedMemory(name=state["name"])
+        self._lock = state["lock"]
+        self._init()
+
+    def __len__(self) -> int:
+        return self._read_header()[8]
+
+    def render_glyph(
+        self,
+        character: str | int,
+        size: FontFaceSize,
+        *,
+        format: RenderedGlyphFormat | None = None,
+    ) -> RenderedGlyph:
+        if format is None:
+            format = RenderedGlyphFormat.ALPHA
+        if isinstance(character, str):
+            if len(character) != 1:
+                raise ValueError("only a single character may be rendered")
+            character = size.face.get_glyph_index(character)
+
+        key = blake2b(
+            size.face._get_content_hash()
+            + f"{_get_size_key(size)}/{character}/{format.value}".encode("utf8"),
+            digest_size=16,
+        ).digest()
+
+        rendered_glyph = self._get(key)
+        if rendered_glyph is not None:
+            self._hits += 1
+            return rendered_glyph
+        self._misses += 1
+
+        # rendering happens outside of the lock so that other processes can keep inserting, if
+        # two processes render the same glyph only the first is stored
+        rendered_glyph = size.face.render_glyph(character, size, format=format)
+        with self._lock:
+            self._begin_write()
+            try:
+                if self._find_slot(key)[1] is None:
+                    self._insert(key, rendered_glyph)
+            finally:
+                self._end_write()
+        return rendered_glyph
+
+    def _get(self, key: bytes) -> RenderedGlyph | None:
+        # readers don't take the lock, instead writers make the sequence odd while they modify the
+        # cache and a read is retried if the sequence changed while it was taking place
+        buffer = self._buffer
+        while True:
+            sequence = _SEQUENCE.unpack_from(buffer, _SEQUENCE_OFFSET)[0]
+            if sequence & 1:
+                # wait for the write to finish
+                with self._lock:
+                    pass
+                continue
+            try:
+                rendered_glyph = self._read(key)
+            except (IndexError, ValueError):
+                rendered_glyph = None
+            if _SEQUENCE.unpack_from(buffer, _SEQUENCE_OFFSET)[0] == sequence:
+                return rendered_glyph
+
+    def _read(self, key: bytes) -> RenderedGlyph | None:
+        entry_offset = self._find_slot(key)[1]
+        if entry_offset is None:
+            return None
+        offset = self._data_offset + entry_offset
+        _, data_length, width, height, bearing_x, bearing_y, format = _ENTRY.unpack_from(
+            self._buffer, offset
+        )
+        data_start = offset + _ENTRY.size
+        return RenderedGlyph(
+            bytes(self._buffer[data_start : data_start + data_length]),
+            UVector2(width, height),
+            FVector2(bearing_x, bearing_y),
+            RenderedGlyphFormat(format),
+        )
+
+    def _find_slot(self, key: bytes) -> tuple[int, int | None]:
+        slot_index = int.from_bytes(key[:8], "little") % self._slot_count
+        for _ in range(self._slot_count):
+            slot_key, entry_offset = _SLOT.unpack_from(
+                self._buffer, _HEADER.size + slot_index * _SLOT.size
+            )
+            if slot_key == key:
+                return slot_index, entry_offset
+            if slot_key == _EMPTY_KEY:
+                return slot_index, None
+            slot_index = (slot_index + 1) % self._slot_count
+        return slot_index, None
+
+    def _read_header(self) -> list[int]:
+        return list(_HEADER.unpack_from(self._buffer, 0))
+
+    def _write_header(self, header: list[int]) -> None:
+        _HEADER.pack_into(self._buffer, 0, *header)
+
+    def _begin_write(self) -> None:
+        sequence = _SEQUENCE.unpack_from(self._buffer, _SEQUENCE_OFFSET)[0]
+        _SEQUENCE.pack_into(self._buffer, _SEQUENCE_OFFSET, sequence + 1)
+
+    def _end_write(self) -> None:
+        sequence = _SEQUENCE.unpack_from(self._buffer, _SEQUENCE_OFFSET)[0]
+        _SEQUENCE.pack_into(self._buffer, _SEQUENCE_OFFSET, sequence + 1)
+
+    def _insert(self, key: bytes, rendered_glyph: RenderedGlyph) -> None:
+        entry_size = _align(_ENTRY.size + len(rendered_glyph.data))
+        if entry_size > self._data_size:
+            return
+
+        header = self._read_header()
+        # entries are stored in a ring in the order they were inserted, the data of the entries
+        # lies in [tail, head) or, once it has wrapped, [tail, wrap end) and [0, head)
+        while True:
+            head, tail, wrap_end, used, count = header[4:9]
+            if count == 0:
+                header[4:8] = [0, 0, 0, 0]
+                break
+            if count >= self._max_glyphs:
+                self._evict(header)
+            elif tail < head:
+                if head + entry_size <= self._data_size:
+                    break
+                header[6] = head
+                header[4] = 0
+            elif head + entry_size <= tail:
+                break
+            else:
+                self._evict(header)
+
+        head = header[4]
+        offset = self._data_offset + head
+        _ENTRY.pack_into(
+            self._buffer,
+            offset,
+            key,
+            len(rendered_glyph.data),
+            rendered_glyph.size.x,
+            rendered_glyph.size.y,
+            rendered_glyph.bearing.x,
+            rendered_glyph.bearing.y,
+            rendered_glyph.format.value,
+        )
+        data_start = offset + _ENTRY.size
+        self._buffer[data_start : data_start + len(rendered_glyph.data)] = rendered_glyph.data
+
+        slot_index, _ = self._find_slot(key)
+        _SLOT.pack_into(self._buffer, _HEADER.size + slot_index * _SLOT.size, key, head)
+
+        header[4] = head + entry_size
+        header[7] += entry_size
+        header[8] += 1
+        self._write_header(header)
+
+    def _evict(self, header: list[int]) -> None:
+        tail = header[5]
+        key, data_length, *_ = _ENTRY.unpack_from(self._buffer, self._data_offset + tail)
+        self._remove_slot(self._find_slot(key)[0])
+        entry_size = _align(_ENTRY.size + data_length)
+        tail += entry_size
+        header[7] -= entry_size
+        header[8] -= 1
+        if tail == header[6]:
+            tail = 0
+            header[6] = 0
+        header[5] = tail
+        if header[8] == 0:
+            header[4:8] = [0, 0, 0, 0]
+
+    def _remove_slot(self, slot_index: int) -> None:
+        # linear probing with backwards shift deletion, so that no tombstones are left behind
+        slot_count = self._slot_count
+        buffer = self._buffer
+        empty_index = slot_index
+        slot_index = (slot_index + 1) % slot_count
+        while True:
+            slot_key, entry_offset = _SLOT.unpack_from(
+                buffer, _HEADER.size + slot_index * _SLOT.size
+            )
+            if slot_key == _EMPTY_KEY:
+                break
+            home_index = int.from_bytes(slot_key[:8], "little") % slot_count
+            if (slot_index - home_index) % slot_count >= (slot_index - empty_index) % slot_count:
+                _SLOT.pack_into(
+                    buffer, _HEADER.size + empty_index * _SLOT.size, slot_key, entry_offset
+                )
+                empty_index = slot_index
+            slot_index = (slot_index + 1) % slot_count
+        _SLOT.pack_into(buffer, _HEADER.size + empty_index * _SLOT.size, _EMPTY_KEY, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._begin_write()
+            try:
+                slots_end = _HEADER.size + self._slot_count * _SLOT.size
+                self._buffer[_HEADER.size : slots_end] = bytes(slots_end - _HEADER.size)
+                header = self._read_header()
+                header[4:9] = [0, 0, 0, 0, 0]
+                self._write_header(header)
+            finally:
+                self._end_write()
+        self._hits = 0
+        self._misses = 0
+
+    def close(self) -> None:
+        self._buffer = None  # type: ignore
+        self._shared_memory.close()
+
+    def unlink(self) -> None:
+        self._shared_memory.unlink()
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self._data_size, self._read_header()[7])
@@ -1,10 +1,74 @@
 from __future__ import annotations
 
-__all__ = ["character_is_normally_rendered"]
+__all__ = [
+    "character_is_normally_rendered",
+    "get_character_general_category",
+    "get_character_script",
+    "rendered_mask",
+]
 
-from unicodedata import category as unicode_category
+from typing import Final
+
+from ._unicode_tables import GC_MASK
+from ._unicode_tables import GC_NAMES
+from ._unicode_tables import GC_SHIFT
+from ._unicode_tables import GC_STAGE_1
+from ._unicode_tables import GC_STAGE_2
+from ._unicode_tables import SCRIPT_MASK
+from ._unicode_tables import SCRIPT_NAMES
+from ._unicode_tables import SCRIPT_SHIFT
+from ._unicode_tables import SCRIPT_STAGE_1
+from ._unicode_tables import SCRIPT_STAGE_2
+
+# http://www.unicode.org/reports/tr44/#GC_Values_Table
+_RENDERED: Final = bytes(name[0] not in "CZ" for name in GC_NAMES).ljust(256, b"\0")
+# the general category table with each category replaced by whether it's rendered
+_RENDERED_STAGE_2: Final = GC_STAGE_2.translate(_RENDERED)
+# the rendered flags of the bmp as characters, so that a whole string can be classified with
+# str.translate
+_BMP_RENDERED: Final = b"".join(
+    _RENDERED_STAGE_2[block << GC_SHIFT : (block + 1) << GC_SHIFT]
+    for block in GC_STAGE_1[: 0x10000 >> GC_SHIFT]
+).decode("latin-1")
 
 
 def character_is_normally_rendered(character: str) -> bool:
-    # http://www.unicode.org/reports/tr44/#GC_Values_Table
-    return unicode_category(character)[0] not in "CZ"
+    code_point = ord(character)
+    if code_point < 0x10000:
+        return _BMP_RENDERED[code_point] == "\x01"
+    return (
+        _RENDERED_STAGE_2[GC_STAGE_1[code_point >> GC_SHIFT] << GC_SHIFT | code_point & GC_MASK]
+        == 1
+    )
+
+
+def get_character_general_category(character: str) -> str:
+    code_point = ord(character)
+    return GC_NAMES[
+        GC_STAGE_2[GC_STAGE_1[code_point >> GC_SHIFT] << GC_SHIFT | code_point & GC_MASK]
+    ]
+
+
+def get_character_script(character: str) -> str:
+    code_point = ord(character)
+    return SCRIPT_NAMES[
+        SCRIPT_STAGE_2[
+            SCRIPT_STAGE_1[code_point >> SCRIPT_SHIFT] << SCRIPT_SHIFT | code_point & SCRIPT_MASK
+        ]
+    ]
+
+
+def rendered_mask(text: str) -> bytes:
+    # 1 for each character of the text that is normally rendered, otherwise 0
+    try:
+        # characters outside of the bmp are left as they are, so can't be encoded
+        return text.translate(_BMP_RENDERED).encode("latin-1")
+    except UnicodeEncodeError:
+        stage_1 = GC_STAGE_1
+        rendered_stage_2 = _RENDERED_STAGE_2
+        return bytes(
+            [
+                rendered_stage_2[stage_1[c >> GC_SHIFT] << GC_SHIFT | c & GC_MASK]
+                for c in map(ord, text)
+            ]
+        )
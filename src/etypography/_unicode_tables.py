@@ -0,0 +1,468 @@
+# generated by scripts/generate_unicode_tables.py, do not edit
+from __future__ import annotations
+
+__all__ = ()
+
+import sys
+import zlib
+from array import array
+from base64 import b85decode
+from typing import Final
+
+
+def _decode(data: str) -> bytes:
+    return zlib.decompress(b85decode(data.encode("ascii")))
+
+
+def _decode_u16s(data: str) -> array[int]:
+    values = array("H")
+    values.frombytes(_decode(data))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+UNICODE_VERSION: Final = "15.0"
+
+LB_BK: Final = 0
+LB_CR: Final = 1
+LB_LF: Final = 2
+LB_NL: Final = 3
+LB_SP: Final = 4
+LB_ZW: Final = 5
+LB_CM: Final = 6
+LB_ZWJ: Final = 7
+LB_WJ: Final = 8
+LB_GL: Final = 9
+LB_CL: Final = 10
+LB_CP: Final = 11
+LB_CP_EA: Final = 12
+LB_EX: Final = 13
+LB_IS: Final = 14
+LB_SY: Final = 15
+LB_OP: Final = 16
+LB_OP_EA: Final = 17
+LB_QU: Final = 18
+LB_NS: Final = 19
+LB_B2: Final = 20
+LB_BA: Final = 21
+LB_HH: Final = 22
+LB_BB: Final = 23
+LB_HY: Final = 24
+LB_CB: Final = 25
+LB_IN: Final = 26
+LB_HL: Final = 27
+LB_AL: Final = 28
+LB_NU: Final = 29
+LB_PR: Final = 30
+LB_PO: Final = 31
+LB_ID: Final = 32
+LB_EP: Final = 33
+LB_EB: Final = 34
+LB_EM: Final = 35
+LB_H2: Final = 36
+LB_H3: Final = 37
+LB_JL: Final = 38
+LB_JV: Final = 39
+LB_JT: Final = 40
+LB_RI: Final = 41
+LB_SOT: Final = 42
+LB_CLASS_COUNT: Final = 43
+LB_DIRECT: Final = 0
+LB_INDIRECT: Final = 1
+LB_PROHIBITED: Final = 2
+
+# the pair table gives the action for a class before, ignoring spaces, and a class after at
+# lb_class_count * before + after
+LB_PAIRS: Final = _decode(
+    "c-rlfQ4WA03`5)9|InH#MiAU!nO_z^UzXYyI3yGmK<c-@fqvA1@>D@-%Yk+bh~H~LZ-*>2CoG473vH1UwH3US5KK"
+    "S}6#lDNA0fuS)w^o81w#vAv6@SFFky6RuaBsr)7FOOP^O@hUX28*t4_3u?NbAbd))xHd<3`"
+)
+
+# the line break class of a code point is
+# lb_stage_2[lb_stage_1[code_point >> lb_shift] << lb_shift | code_point & lb_mask]
+LB_SHIFT: Final = 7
+LB_MASK: Final = 127
+LB_STAGE_1: Final = _decode_u16s(
+    "c-rmN^;1+)7{>9htC-jc*xiYNh27n)*oqCd*xlXT9oQX!{#(ABx$Nu}esCPb#eL>8C*F6@*>m^3_s&8Q0!~qixiQ"
+    "LGaY|5<Qk13)(Uhee<*7hLDp8p#RHYi#sX+{}#8H!4)OI`TSgY%OTY!4hrvVLVL}QxJlx8%i1ubc1pSAYZw4p8SX"
+    "m7I)#M6;Z!QGwdLIPdAs9P`}pgTS2Ng}=IO&|KwkNyl`phX2|P=TKIKO3AYGsNBHp$v25a7HkaQH*AcMPnJqcqTB"
+    "BNla!+*hf=Cp4)#Xr?S($csetf$t;qX?czDiwSFG+SzzNr-`+*m7F$bZ2}`})GS@F>1uI!a3aPAS4Qp9v+4XF&ej"
+    "}SmW3$b+u$66WX9qjkW$|wIu$O%{+s^?G=DOBHfA|{@bA+Qd9?O@C9S@897U~2iIpxco<_u^5^4odN7v-FMK8)&;"
+    "eO(t^fAKeWT*|kzFMHz^u5vBU71x8a8{Euu#Vu}g$Ib3~nR~yixX%M${LmLY;xSKn$}`ff2G4oHOJ4DsH@xK?@A<"
+    "$-KJl3^e6`izY*nZX{R4?atW4EFB!b`nfQX2Qh=_=Yh=_=Yh=_=Yh=_=Y6gpYfzVkzs5D^g(5s3gl0hQ|Vx&"
+)
+LB_STAGE_2: Final = _decode(
+    "c-rk8i<YY<aQmV+-b3ofrMB5wHMYIC{r?{<AS!P~0o^@2NsI<$m<Kb=fI&zA`SI!L2V}s{_y$c2xAH4A*FUbmy-j"
+    "ev0ssa#l+9Q0K}iZ2ko<(4a4FlSX?Xn`5P+7R*C4KG8}JDnYMA(<|Lg@67cR=h07?ZF`&H_~!3?|-c5K2JLJ+M_-"
+    "+1c%s~g5*JN~w9*@%)F#|UE_K!LS~^LTCF-dLp!ti-cO=WiHJ=Ki>-*sQM!DRN_3q{q?-S2reEBrKb?s#Jfv3hQz"
+    "Vig&7?LPuP|*_$@42_2=xBc&aDLb9H#Eh+d_Eos|fyi;2PC<gu!$#80IZN_iZi9!FQp>{bb^f#)$B;mg%fBz^&dq"
+    ";_+i>^j3_#3r_ee`Si5rPH!Yng;PFMecLx~<H2;rEWe(ci|glbRll{n6~FjDIISq)eC^-CWO@2ub4#HAkj)AjBUE"
+    "O{72%m%1hw%;3U<3LED}Ae_NvQ5G9`sZZd<(Qxx?rhhQ<7)j)iVK`kb2`3?FLEf`l5C(P@m@(i~?<sqV9CPw-iQ#"
+    ")B_%{(GWiD4ye-#49f(L(DL`JpFA};AYvlqngmX_RB0z;q}HBwQ&k_OhqTYxd4CJXbR?Sg{scN{%k>0a}L9;evi7"
+    "K{(!8u(}W`^k>LG*}4y41HVbf9z0l%UwRKia#bqcgkvYT8dCe!egs^_c6)AXht0gm7i{sQ@A{*W*~VAn_yCQ2~U<"
+    "Doiru`T<GT)^eaNY)3X<rT)&k!_F>iT_d9ud8oJyHpcSC1MC!CGs_|UNwdJZ$KVNi%;PdbnkKYW?HVU-j(CP)vhG"
+    "bK##Dj8heh4%Td|bG@Cwsc^yH2@$E<OYUx=y7_zaA;?SV?b|$u|b!4f;8Nm=T87*a<%$Xpno^N%sJwZN8uX+*63k"
+    ">Kg|-JL`mg&9BHpU2M>cS?yY+F0N^!%s-@N1B{u2z}dr3k~ykaaz{4>gg2(1vm{J`xgQn^!G6cUy((|{<z;ZO<$T"
+    "jngz<Ds*br91Q?wJ-;eXGt-ei)Z=(?)wo{RA{pI6VUaD+i$hEsm5D%M8TjV~8e3!Rnj9=|H4xO7feF(fJ4ACB}pR"
+    "0$F*45ZeEN`qMaIchw`m=6VOR6=6%vO$Y~iRlj`XO^^_OpL@_aH@}JX_0B|Y$-*9jG%2}*jvy0YPL}54l2!jh%W%"
+    "GE%`4$MrXdn8RB{uM_|+XtBssVqE>oP1buc#@ko}X(mq*8)NheJO#2N6j3|r(-lM!}A8D=A<p1CQxZ$(xv+T1hZP"
+    "}VS@?dr>PqU)<YtOGp+P$joWfezw6>oWyYd$F6_5SbHGC#N$#r2Bub8)xNANXu@4i@K-QA|XOuAngn#@$#l#t}{1"
+    "osb1z0C%iwoB-N)IS61;0QStepOxzNavDL?ch#*9xU@i|S{pG~znP31`fW?;Q(68At2ZTlOh6w3Mat#%VC9IdP3P"
+    "I!a0nYn4pjhY`(a=r9hn&gqQ%#zP<O3=_Xv{7N2e^81IGi6;F7Jz#9QUq#oa?Jag24H1x1v0)vD2dF!AOVoUr>X`"
+    "Kb-r7kQTx-^3K=lIvakH#0$O?Mq}fCHm^vlPgW&jPQID46?h+F8N1z{$lC*Cw2RIf(@{vN6_}eqZIbSyQL_xf6yM"
+    "RWDoBU!n4^#g*4fF3;o&<)9J5eh=@81zb$f>@#UUo<$K=syz#@dt$19^;?H-I^TaFq2&HZatrKb}20r@vxR+6ERu"
+    "FSw6E=Di>v$~Vka-A#^az+@2A1@%#-VbsZlph&12C+F&APaM{7nNJoh07M5l)7!AnGP&TvC)0lBePq-za`?e#MqH"
+    "$bhFT%c5Adzmio-uqXBGP!^jg7XK+z7W_~a=u}gq^GQ*)2k})u)ZPphYqtYd1~G|0-+ZsDGHB}`I;Bd+u_d>Qnlw"
+    "=0=pDMzHZpF6@V$lA62FZqmGpGh``9HtDGNz$%|k~?{{NneMWj2lSoaTXXC?DY-Fgd#9p-wok=G**1YnyLTOZ&~l"
+    "`ipU<%T~$+u=XoM*`xYd>7i?cdfroZr-Kl*Af1}y}naM-5=M&zJ2!_=RXrXDCC%zJR~rR^dA<kmoVteNIluycmHD"
+    "}{O1IX-H*-sFx~&KwD&kI@b2}l`Elnh7><44^A`Ab2>iuh|7ht4+#@*Z7%-B}PUqWtofpu-NT;}j6fuZDG+7n3gm"
+    "KIz^nR`oFSfOoM`WT9=lUo3Z?~I>N!PS)M`srHOTI$?O}D@KV*aUn>5>YjJ>}P${gH2b?BIvlp2fcf-EXfI+m_3%"
+    "_mT>!=B&3^vJDp3qtl@#x9=@&2wS>fjH5ok>yxE92F>wj`tP6_fS}ri&1`>S%_B@dQ{~H#oqZgg4}?Ac_x=gn^ZX"
+    "P15584p5d"
+)
+
+# the general category of a code point is
+# gc_names[gc_stage_2[gc_stage_1[code_point >> gc_shift] << gc_shift | code_point & gc_mask]]
+GC_NAMES: Final = (
+    "Cn",
+    "Lu",
+    "Ll",
+    "Lt",
+    "Lm",
+    "Lo",
+    "Mn",
+    "Me",
+    "Mc",
+    "Nd",
+    "Nl",
+    "No",
+    "Zs",
+    "Zl",
+    "Zp",
+    "Cc",
+    "Cf",
+    "Co",
+    "Cs",
+    "Pd",
+    "Ps",
+    "Pe",
+    "Pc",
+    "Po",
+    "Sm",
+    "Sc",
+    "Sk",
+    "So",
+    "Pi",
+    "Pf",
+)
+GC_SHIFT: Final = 8
+GC_MASK: Final = 255
+GC_STAGE_1: Final = _decode_u16s(
+    "c-rmLXH!!_6oBEEA_9sSP*95WCek~EqV%qSf>H#e7wIUyNR_5EDSy^YhRM)|kWAo9&OCGPIlE_f@6O&?u)!8P?0J"
+    "9#4{^i^XCCnw7oOnCQ#82Y&NCIC<AEnHc!?L@_~6Sc{O~7$K!OM+giyi=SM3O16UiH*h$e<u)vGaCoEdZOU;J52P"
+    "){OBB$GlaX?OIsbTTf{noL6`S?Zll4sUr!E_virK%wd@qL>m&DWjYUDtXTbs;H)hk9?w*IzID-dKze?iLW%D?W=`"
+    "WzR`9?yJ6=Y*Hq8bjp;Np<~DTebkVKPd+0UseESSpKi@5|n*p`bAVb$whHo{0gi*#A=LbKTV3H|ylfsxb)MuDwj("
+    "L?W=-Z3@Vo9GZv%;#1YpnB|4gI`Lw%As2hd&q2OIXHVqa$|NGhw}bvv+cE<NY|i)Hd#)k@}GZ?urmX2qA<JLI@#*"
+    "5JCt`I_5-9!HQ{x6+4wPu=4-^A8s$I9R"
+)
+GC_STAGE_2: Final = _decode(
+    "c-rk9iGt!PvUCE&Yv=8_t2R+){{J_Z`wE03iLI?=x8@)mMN!lR`Tctyeo;!V{QrERBRx_2j|ED{ainyYg)_a}K5z"
+    "RhoX5-f`**SYD+fkz4E-68?8e5!;kKvrc0hj*heNLTQUB)39?ik7^HaW1_~@tff%p@7>~`*Czq849rUZ3M9_*1wg"
+    "E;Jd?Db!{PCD6cx9|UG%&A)JbftrP%K**X8zyk$5T85nFAcZoCI@_H5I7ocyFI|bTSIri;da{zItKnx*bD&dQ3dK"
+    "04b9NCN;K-eYlqgpEK?Jcc=`FWlNy(e!sZXup^0}dl~9c+dIDhV3Qg2>!W64N(17w_Zc_>ljuIp%=WL!aFLQe2^+"
+    "yF5++nhY{(K>F!)SY;rYc9>oMFIN9wOxG!xJ)wXaI05RdA*=W|6-PyiyPZ5VWT<lVM=ItpfnQUh_!@m)@QM&<J63"
+    "rSa4d(O)+GO{X~?Rl96+YhlQB%ds?wNN1lAj0hn%7jaAon$(*QBwuP8CfN{h7*hYq(QAJ-7CDYg`2ai<{_lu`C|r"
+    "XqKctfD^&o*=kzgCV=HT;(a{1;DFv#*%cgZdjM;;>rG@(+78SHT&SH3Q!s{FA1Smwfy0ixjnar^1j+|Yxz9shp$I"
+    "K;o#rVRcWQrPzpfE@l!Ir?ERN9s;kHQCLA<m4}rePP>Aa$G`myo4)LrHjWZ&_BH{YOd)XR2N{^epO#I#lKEL51I%"
+    "C{nN(s1N^J<W&3UUgqY5smXA<?8_|Fo@=J0!JN^v*5!0kkbo(a#e>m8dt0H~+3py7S5dn@^&A?L?QX^BLChC8Ygo"
+    "Xp8k?q-uL_B?sm~WsTLJep-pTj)(x3D*nnfAkA=8K@EcG8(Eo)3j+PGejQ;?jZ|CW)RqFf2aj%lYDHrwWh$#HMEr"
+    "g*822_`*bu_y<gbt}N)bFxjX|^jCwTbz&<n&QU1e8F^9OQVkMgL|l-d+Za!Pii?QxLtK91oUuxATk28byFoRfgVv"
+    "wlumXUYK>Z=xKwq`#>&k(Z+OY^DVhmfZa!5d8{4on^eC{>@Gfn_bZ_2$Nu&FxzE1&v&fmKyXPJ|yHAAvTO${%a#H"
+    "8(x*+uq!gx}Tk2q<l4VzgqAjp3<ciFW+#%m0Mx9MhVF?7<^##*^~H^x?-HZM)U0C4le&1H5a39d}RwS=Lbf!#afm"
+    "m#LU&IADP5qtrfz^YkmDcpMIk0h}sn)Phvz`JG#(IEP-<I9)~sppHle@5z||Iu4fNzO^n6IpHmxDBlH+Rbn7%Fcn"
+    "VZde<Mv>u$8n|c!P?iE1{F9F(29QnrbYoD)TaJr?jqrEtj#~C=o527xWjZub=W&c=lmvp6_L1Ylw6GNfR1|7RRj$"
+    "MT{Y_#g;!TgD|g^id(}U^LU@7-pP)V0{@PoLq{L6|EH85cIuOR-aKcHerTvV2bJHC+x~XD`RDRX<|=EW&u#hqT$b"
+    "q4!!HNY6LOM3>7T#nKjPnvuYdm|Z~wCL{GY$#`}323jpvJJJ{akzJ5iZxFN=V~U}TVS<j)OG9+Bq|5VtU}lpw*+-"
+    "Sogge9g=dT*DTen15Lh^j@4P2fAX@JM|Ig%GoQJ$eusJ&qe{VSJ}v~uvo?UD8p_qz7I;{k@?9|)z4`Dm_D0@QKl`"
+    "YdV>Lj6JgEDVN@qzYs1*tP1X4~rJjYX{8UPFSODu{`yOT74aQm`DiPP0)%(Rj@E7-4kM3nBo-YM1=SuG7CEpbuU<"
+    "wLJBiB(KnU>SE_kU(WY9gkxT>|db|96Q0+PSc-oe5;r3f{6f#A+Q!H<cesjn69ohuZioP|xi9?QdEf7$UD6E*a>i"
+    "(Fbk6CH+?@GE$Y{UrMDh2GNr|=Q@xckiH#CCON5u=g@h|WU#RMoXYm6uNVV$<v%mj;ai*wg_aHI!!cerSD((83$t"
+    "pPvV5JSV#>tj0rB46DCSKlvLbjFZRnq(ydlj-_3dK(RQ5_vFWRRQ{=zzHXnY=Or81kUQI>0#`c~Fop5CRnMf(Tzh"
+    "A)Ys=$?<7{b|Pk5L`?6LwtWmYCdU`#E`H?dj1JI%%v9A{dExg;mu;9zvPw%Z#7A5FJC5$4uNUkyRHgCGiB(-K?#{"
+    "zUDEx*rPRGWO#p8cFJ~C`E}#zi-l1gN7m*G;YtORbqg~UXkAKn;eN7^8M(xNSHwm|M!DoWh#d3r?f1Q(-%K`etk1"
+    "wUA@!sWrbv{u-!f^Z{Y`?BA9+Km^G1}D?>Uj}-x)E_Be)%c?>R_iW;U({g{g5$*$OcRzjPjw4A%Bxq=U0Y-;8-A<"
+    "{$}*A2G#c#I6Vj9dusEyR;`t*irbWblqBL|o@81q&2L>z5fA<E#o@m%4)><yuNgIY2%}HjCA~(*Wj7|&U~sE}?gt"
+    "ZDZ9z!;Qn;Mg)+c+bZ_GO_@%~p9toJmrlT<DDPs>mAbo%^^ZS^v}jD`@Q4|3i=S)<{28pjdD>QY-iJj}#$gl+dX;"
+    "Moc!^s3gwQ114e0Hf|+uj7qfufUXlB3Sq<PAhF&kiG^5>RomH$tDa^t0GN)d0$Qc=z*l+N?w9kt7nbzoK04P_Hfb"
+    "Fp^m!yr#(F1kH!3hwVFxOf<0)UXBUZ8Xbi1wvem66fz{)GZNJ~zLp0V`>H=fy^sE;CvxHyy_JHKZ9^pCvg~0b1`y"
+    "%b{*5j|DNww<>W~@;n(6K&>82sqSwb~ERCX?tj*?D!;F89is?dR{uXp2^@Eb3p-+0K-2%c7;}^NZ*YsRo#u`aHcY"
+    "#tx~qwpP|P!cJ*o()=689Ydpl{KDiyOOsD6{@DC<WBWT=F3_)SP=CGe^!^O}2LzoZ`Jk5WfxF5d>#N({^KUf0#rk"
+    "^-1PHB_R;D{iz#A%{q)Idp7{(`nZbHi}{wfN;noQ=$i)SFPOs00c8LPvB@jAmBN~4u@ZvT@uo8)@j+y6#7E&Lv6E"
+    "1x*$50x8qQBR3G&hWF$_^sSxDOgH|qg8&qQZ4ea@S^$quXMQoJZGD6D9T<SzCVwO>yT6Yvh{^R!D<<y>Tl7TtIR)"
+    "UAA@{dXxDs&J!ED2zkB~9xwnVf|3~kCM56tNG}f#Y(by9oh(C7?{%9>IRy!y~>p_Jf6c+`9?xKlVmn{ac8&J<SKl"
+    "e3X5}Rr~O@kAAH^RTi2vBmTtw<lpOmR(P8N1Fm{9tK+my{fT)1P=JF%detO!|E;`U@r=jOjh<x703|*uN^({J@wo"
+    "=h4%<iYcZpHf%x!`;@&l|7rG%Sq`B$uHd|p%;g^k231GGAW!b|_Fwg;g#{9&W-L>#v9`WC%bZ>SYMftT43WP*n;@"
+    "?ccd7m2{E=7MaRM?cHh?(FAS+5x6+=EnrgFbQw@V$$+6U^h*E>04xy1}dZ+pX5^P38Tv-%ezmFiCr5UOZEc2ywaY"
+    "~5d|#=c_woAT8Gvuk50dRVv*eSF*(Af9T_H-I;ndBel`BXY1%o;*f?ljhKu!}sgaTix@JT#v9K>url?*U~lZZ@+K"
+    "v7t(}WMa7c#pIH}A);a%Vu+%=0@r&I}AzfJvz>~#EmEinAINkzm5pe1pe0EI8o#&eem)X8|>sss|Z+HdpL+JP~v="
+    "b95(bFW!_aAT1%O&p3l;SISc@lt$caR;;8=<y=w%ua0>1}?GwcAS>UUS#8=Jqc`lr)&iUjbHiw%cLH`(mdTYZO!T"
+    "kjZjfifVn`d{zkWDc;|jz-AYpJhc8cv!`3>8R&Q>RSw8a&H?mZ=WfM>-jgj+Twi;@?x!BE#3(=GUO!ax%m%oAfoI"
+    "(Q;;A=1?+fpEewiotzV)dVI=9VdiKWAJPkFB^^G;I{2+8-Lt<C=mZ=LoNeM@~X`?@**mKU|T>=h8@>O8dl+u_T$C"
+    "$v8!25;D~Kk%ad3*SdAAHTj3{)R;RUxl6^6NLod#E@gviq>gzjg{YqCr17+>F;}Uw3>jW%J)I=|LfYiV{;82P>Eg"
+    "0AE2<(J6axYUTuy%d$>9e(%Wk$v^wTR(Tj~CYcPem`;9P;{q~=G*$ZdtH@(ocYj}qIpLk#I1y<g5=)pdpD*188{|"
+    "mqRLvEh-oh|&Si?ionT)i!L#iY;~`d?D1X?|_vt8P3_`O71Y|9t*4^w(7%n8hB<<^Q<+4^}{X7M^kc+btu3mgfB3"
+    "vG<M=c`OQk<6~V0@aijDHjQt3!{e{DDnyqZH--oC|Gf;v?SJjv?*aY~#I>3w"
+)
+
+# the script of a code point, as its iso 15924 code, is
+# script_names[script_stage_2[script_stage_1[code_point >> script_shift] << script_shift |
+# code_point & script_mask]]
+SCRIPT_NAMES: Final = (
+    "Zyyy",
+    "Zinh",
+    "Arab",
+    "Armn",
+    "Beng",
+    "Bopo",
+    "Cher",
+    "Copt",
+    "Cyrl",
+    "Dsrt",
+    "Deva",
+    "Ethi",
+    "Geor",
+    "Goth",
+    "Grek",
+    "Gujr",
+    "Guru",
+    "Hani",
+    "Hang",
+    "Hebr",
+    "Hira",
+    "Knda",
+    "Kana",
+    "Khmr",
+    "Laoo",
+    "Latn",
+    "Mlym",
+    "Mong",
+    "Mymr",
+    "Ogam",
+    "Ital",
+    "Orya",
+    "Runr",
+    "Sinh",
+    "Syrc",
+    "Taml",
+    "Telu",
+    "Thaa",
+    "Thai",
+    "Tibt",
+    "Cans",
+    "Yiii",
+    "Tglg",
+    "Hano",
+    "Buhd",
+    "Tagb",
+    "Brai",
+    "Cprt",
+    "Limb",
+    "Linb",
+    "Osma",
+    "Shaw",
+    "Tale",
+    "Ugar",
+    "Hrkt",
+    "Bugi",
+    "Glag",
+    "Khar",
+    "Sylo",
+    "Talu",
+    "Tfng",
+    "Xpeo",
+    "Bali",
+    "Batk",
+    "Blis",
+    "Brah",
+    "Cham",
+    "Cirt",
+    "Cyrs",
+    "Egyd",
+    "Egyh",
+    "Egyp",
+    "Geok",
+    "Hans",
+    "Hant",
+    "Hmng",
+    "Hung",
+    "Inds",
+    "Java",
+    "Kali",
+    "Latf",
+    "Latg",
+    "Lepc",
+    "Lina",
+    "Mand",
+    "Maya",
+    "Mero",
+    "Nkoo",
+    "Orkh",
+    "Perm",
+    "Phag",
+    "Phnx",
+    "Plrd",
+    "Roro",
+    "Sara",
+    "Syre",
+    "Syrj",
+    "Syrn",
+    "Teng",
+    "Vaii",
+    "Visp",
+    "Xsux",
+    "Zxxx",
+    "Zzzz",
+    "Cari",
+    "Jpan",
+    "Lana",
+    "Lyci",
+    "Lydi",
+    "Olck",
+    "Rjng",
+    "Saur",
+    "Sgnw",
+    "Sund",
+    "Moon",
+    "Mtei",
+    "Armi",
+    "Avst",
+    "Cakm",
+    "Kore",
+    "Kthi",
+    "Mani",
+    "Phli",
+    "Phlp",
+    "Phlv",
+    "Prti",
+    "Samr",
+    "Tavt",
+    "Zmth",
+    "Zsym",
+    "Bamu",
+    "Lisu",
+    "Nkgb",
+    "Sarb",
+    "Bass",
+    "Dupl",
+    "Elba",
+    "Gran",
+    "Kpel",
+    "Loma",
+    "Mend",
+    "Merc",
+    "Narb",
+    "Nbat",
+    "Palm",
+    "Sind",
+    "Wara",
+    "Afak",
+    "Jurc",
+    "Mroo",
+    "Nshu",
+    "Shrd",
+    "Sora",
+    "Takr",
+    "Tang",
+    "Wole",
+    "Hluw",
+    "Khoj",
+    "Tirh",
+    "Aghb",
+    "Mahj",
+    "Ahom",
+    "Hatr",
+    "Modi",
+    "Mult",
+    "Pauc",
+    "Sidd",
+    "Adlm",
+    "Bhks",
+    "Marc",
+    "Newa",
+    "Osge",
+    "Hanb",
+    "Jamo",
+    "Zsye",
+    "Gonm",
+    "Soyo",
+    "Zanb",
+    "Dogr",
+    "Gong",
+    "Maka",
+    "Medf",
+    "Rohg",
+    "Sogd",
+    "Sogo",
+    "Elym",
+    "Hmnp",
+    "Nand",
+    "Wcho",
+    "Chrs",
+    "Diak",
+    "Kits",
+    "Yezi",
+    "Cpmn",
+    "Ougr",
+    "Tnsa",
+    "Toto",
+    "Vith",
+    "Kawi",
+    "Nagm",
+)
+SCRIPT_SHIFT: Final = 7
+SCRIPT_MASK: Final = 127
+SCRIPT_STAGE_1: Final = _decode_u16s(
+    "c-rmNbC6q66vy#zZQHhOw_DpzZQHhO+qP}nw*7DKzNVQ?w=>;ocDHH!o6p>vdrt0qH#skp0|5wV2}EFm5R_m9Cj="
+    "o0MQFkhmT-h80uhNsWTFt2XhbIlF^NTN;t-d3#5WR<kVGUVi9=G7k(?ByBo(PiLt4_2o(yCp6Pc|Ovyhc+WG4qX$"
+    "z_+@vHB*D@qL|_eB`G91t~;fir_&}icy>rl%y1;DP#6{_=~dsbk4u8oHymEU{s_Mm8n8is!^R9)T9=*sbl@t{vLI"
+    ")xdG2Q*P}iSXh<WYF->SnGn&(amb9WZZOpE=w4*&8=tw6z)5YjYH@ee<p7f$OedtR+`ZIumX7?ZlGlZcGV>lxi$t"
+    "XrM#^lE`&dlSPz(gjQ)nukHm1#_81~W}Oi`mR!u361vJ_}grWD$$ayu`=fY$?lru-wI3t*~3^7EjK`D!bLJVJ+(%"
+    "`SomIBb(Ulr?xmnTP@qz?k2Udv4frLVmEt?y*|2PANzgn^aC6;9p?~-Il@tnaopriaFSD2w>oXc8O}PK^LG7tGcI"
+    "tEOICE*p1tB_$5pOzof}><H@U@a^LmH7R(y~9=9~vSG;8P1`H06n;VI9o=s7RU{PL&&4I=L6mCJW{ZN?iv`+RTzK"
+    "uzBLR`2)p{ul52h7T^^;iKDh77-B<5fKp)5fKp)5fKp)5fKp)5fOLv$&Al@Q6)q~L_|dX1788xE{ga"
+)
+SCRIPT_STAGE_2: Final = _decode(
+    "c-rlq=Z_af7{~Wc(Npn`15^+d@$4OyAlB#`UuYyzV#9aFe2rp@C6=fO#6lvrL@ZIUV1Hrn3U>c3cj`{tX*;{W-yM"
+    "8z%gi&+^Gw;<{q4?{tE!HyY$Yx|J|kzm&G$+_q4e=5W%JO`qD8LsiGi7}sp=VEA=K0>Dw?J;6Q?kNgEh?5sc~RpV"
+    "rssC1EN5ro@Ik&d4Lm8(Uof^3Du;!5>&RxMp00DdAt6^<bYIRl@l~@LI*&sQ;T>~GSIj&A8Pz$5`Zb#<N??Ot$jp"
+    ")Yo|^}j9#%$aA;{r_cugU)vkVE4G!c0Y<2;;22)WK8#~c0Xh0aXxui);mMkGNS%JjBV<u?Ud;*s#b|l10z;u;}?o"
+    "Bc?Gec&E9@9XxW<g-ava4nK?g3MCW=2UMvDK?rlbHgr*#(+4q_Szpee;k*Q!x?D&D9fuhFOG*Awnz#Tv4jSwwvQl"
+    "^;Vd3K~qjt0iRu1a>Z8K@$9$+Tu04CYH*HF0iRvK3<9<t_bvibYGk2sv<mo~iehK^q%x1`nl)?4Y*2ey(*l%`)FS"
+    "$jMrf2+Emg--$T&G0VqJw4f~;79`j5bt4$zte7z!}cLfM~Eh$u%186rnX#L0yX%Pq(;W6t6zu$We+UM`NOB8#OX="
+    "CD$LE+AuiJk`EyJ}6X=PA!742E2(i2layR3!FM)j`dO3|M+s$2PGxOk3Xk7k%y<#&u~#yQsGPo>hbL?6|h-NKdM("
+    "$|7LzHzG_uft*TZz5a~UEWdBsZOs{L&|6D&>x~Wg&hU@|_0AEQiPQb5k`J=H=4_WU4Sik<xZor=kEkbCIGg)AG6R"
+    "BKQl5~H#zay7tAnH!S*JV<hJ0*7~(hO`e63(BfvS<fUr@9a5W9lMC2iy6WI~{jt$MCqpel}E{e2;*dX#vSpnY$3v"
+    "CGH0}#{8kLL)iM@e{pt+z#o^TY0I%mfPOEg>IXHKm4N4_n%*Cw>9+XR32tyhKdu7P^iGz$$i91oRh4o-ExtVa9Id"
+    "}!A)S!pvq#Km8Z%{w?UxICCbZifJOXIP<l)rul}j?=yMqjfxcA~4$~Z&jI&?pGM28K@Y%89mj>P3ZpFzy=y7|4Et"
+    "^eAPKFN>w(xs}H`dHoz<V2#X>Ogg5Z&buLZIngvpx@z8>%bo>PwHN1HbQE7QVIAke#A-b1O0WbIJ)lXUEAxlaiZ>"
+    "@`Id}riQG1ia2?P4e%@<qPsCsU4fZ%?R~LLd2P@G;9q2|ErJ%JJ^L9%nqBQpw!R3ufLXQh=OrqL&PXtP1-{b#v1F"
+    "kI!DkV(42X61;$~<HRO|cmc-CusHJ8d1ECO+T>#s!YOZn^$R*`=FNO16jhaX<5cBmlDsqD~4GJSyoYn`6Mx*G1!S"
+    "4d(bYP(}P<Xz#<!;7csylVEaq%qmUpJ5*Kq#_Y5aCPV$rdLG@tJipLWqsEKSCX@M(OBbn6r;va8necv7?geM?`dJ"
+    "?Ko$Ka&5!O%ukFHhFB06x(Ofg`_L#!Pgq8XBJ`>6WUWr3N|bmH%6Qbi_!yL{CC?nuSF9~c;yIxYg~tPUUE4pq519"
+    ";(023)Wp40r6u?;y9!*=O=QW7eEaYK93+p@3}}sd+o|VY3^PBG~gc{G;2hvb?5r|Nud08{ru;@372)y$6LB`4y9i"
+    "6P#hp8AZ8CbfegJA;6*>8n3f=x_ibufleF1Gt+RPcE7Zr9uI+zAfE_ImTeo~i5*unzPlOE|@VOnTtD0~Rih#$T4)"
+    "8*NQ2RX^hp8&<AIhRJe8LGJLXX+dd`0AO3tliKDC35x1UHo;GyiMSDP+$g-$x?yvnAtA=nC-nXoxC6=8}c`F%n_&"
+    "Lp1Iz|7<0$$iI1T>Hp+Lre9H%SdUHik94Q0Y#n^P4X$De9?rpGC5rHF9J0u-^^Eg1PNjdmZQ&4k>9z~*W?(niN=J"
+    "<|{g?AG?3usqHFQA(V6zJ}YZk=BcFV3_aJSO=cEzO-DfR!XN0@Ve`@d5N+h5%F|0s)CyKw#=l)&lF@qUvd|2MKR?"
+    "eq4(_u8=%J^I=E|JNND;{4^6@@Ve&FaR=%2%UUjkD|`(ISx@Le&IBsI5d5a|E~%m{C!y-t-R)&gdgSt^ZAU?oS%O"
+    "pXhJa<+75qCE8x=rZ5lAu3h@O4bc%;qYBq*HDfxy1Iz`YZLbX=}^NerX;OYOG*pfC})_QUeY(vDCZM^8_w~sBu^p"
+    "Bw{Wmaw6TI!Gf(ek@$K@#8IZ!HY6``gy}3NQbwew1{k{a0C_1S!vW5$R3)UtI*3KNxF=h1b*k;Jf}9r2My*qm#R~"
+    ";&iRwn>%M`_iE3Z8tMBeqW*gqBnkb)Y>)*Gd8$yn1PC%M-;WRRifF@fZ~M}BSC4eGIcMj7B&0o_9S&Iesd2u2)I_"
+    "q3dy74vw6Eo~>gPTGIoMnNg`QXKp~S^L*%5fs*70qh=8=2r+55Kt)KGpi6?$xWWP~c3lU}leg*1Bq-cv_E<P`~s{"
+    ";z*MqC&CkpzmW*j+GLjvfp$V_=`Q`@sXx<oBPHHW7lRfzfNaj-swic=Z#JHXOdujI7v+cmvnyLKUkcpp^x7`r(o%"
+    ";aptXSdH(ie>HnGyGcVnq|3x#*_SL>>ZGRUV&o2Z3TN25~1=0Pn*w_s~jQWD3XnD#!pNzmi1R^g5LlaS<_)kG>G0"
+    "AiqeJR7Fo((i7x?B65Vwr;Ai{Eke&2Rppt`|M!vjthF-nrecd?#OSIL+Q3(%zNx@YnxN-==J2;}1i0WxIW8+|&MD"
+    "3T69C+rDxA!R}w<@N*P@{P6U@yyJnl_2Bd0o*xQSJEFbC{kYM7g{7<Kh4a0dxE5SMpF)kOPyeUGrE5AKUo}cO0FU"
+    "<mz{Ea=*}ne+j@Jtd"
+)
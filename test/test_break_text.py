@@ -1,11 +1,20 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
 
 from etypography import BreakTextChunk
+from etypography import BreakTextOffsets
 from etypography import break_text_icu_line
+from etypography import break_text_icu_line_offsets
 from etypography import break_text_never
+from etypography import break_text_uax14_line
+from etypography import break_text_uax14_line_offsets
+from etypography._break_text import _get_icu
 
 
-@pytest.mark.parametrize("func", [break_text_never, break_text_icu_line])
+@pytest.mark.parametrize("func", [break_text_never, break_text_icu_line, break_text_uax14_line])
 def test_empty_string(func):
     assert list(func("")) == []
 
@@ -42,5 +51,74 @@ def test_break_text_never(text):
         ),
     ],
 )
-def test_break_text_icu_line(text, expected_result):
-    assert list(break_text_icu_line(text)) == expected_result
+@pytest.mark.parametrize("func", [break_text_icu_line, break_text_uax14_line])
+def test_break_text_line(func, text, expected_result):
+    assert list(func(text)) == expected_result
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "hello world",
+        "there is a\nnewline",
+        "こんにちは、世界",
+        "a \U0001f600 b\r\n\U0001f600\U0001f600 c",
+        "\ud800 lone surrogate",
+    ],
+)
+@pytest.mark.parametrize(
+    "func, offsets_func",
+    [
+        (break_text_icu_line, break_text_icu_line_offsets),
+        (break_text_uax14_line, break_text_uax14_line_offsets),
+    ],
+)
+def test_break_text_line_offsets(func, offsets_func, text):
+    offsets = offsets_func(text)
+    assert isinstance(offsets, BreakTextOffsets)
+    assert isinstance(offsets.offsets, array)
+    assert isinstance(offsets.force_breaks, array)
+
+    chunks = []
+    start = 0
+    for end, force_break in zip(*offsets):
+        chunks.append(BreakTextChunk(text[start:end], bool(force_break)))
+        start = end
+    assert start == len(text)
+    assert chunks == list(func(text))
+
+
+@pytest.mark.parametrize(
+    "offsets_func", [break_text_icu_line_offsets, break_text_uax14_line_offsets]
+)
+def test_break_text_line_offsets_astral(offsets_func):
+    assert offsets_func("a \U0001f600 b\nc") == (
+        array("I", [2, 4, 6, 7]),
+        array("B", [0, 0, 1, 0]),
+    )
+
+
+def test_break_text_icu_line_reuses_break_iterator():
+    break_text_icu_line_offsets("warm")
+    with patch.object(_get_icu(), "ubrk_open") as ubrk_open:
+        for text in ("hello world", "there is a\nnewline", "こんにちは、世界"):
+            break_text_icu_line_offsets(text)
+            list(break_text_icu_line(text))
+    ubrk_open.assert_not_called()
+
+
+def test_break_text_icu_line_nested():
+    outer = break_text_icu_line("hello world")
+    assert next(outer) == BreakTextChunk("hello ", False)
+    assert list(break_text_icu_line("there is")) == [
+        BreakTextChunk("there ", False),
+        BreakTextChunk("is", False),
+    ]
+    assert list(outer) == [BreakTextChunk("world", False)]
+
+
+def test_break_text_icu_line_threads():
+    texts = ["hello world", "there is a\nnewline", "こんにちは、世界"] * 100
+    expected = [list(break_text_icu_line(text)) for text in texts]
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(lambda text: list(break_text_icu_line(text)), texts)) == expected
@@ -0,0 +1,74 @@
+import pytest
+
+from etypography import CacheInfo
+from etypography._cache import _LruCache
+
+
+@pytest.mark.parametrize("max_size", [-1, -100])
+def test_invalid_max_size(max_size):
+    with pytest.raises(ValueError) as excinfo:
+        _LruCache(max_size)
+    assert str(excinfo.value) == "max size must be 0 or greater"
+
+
+def test_get_put():
+    cache = _LruCache(None)
+    assert cache.info == CacheInfo(0, 0, None, 0)
+
+    assert cache.get("a") is None
+    assert cache.info == CacheInfo(0, 1, None, 0)
+
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert cache.info == CacheInfo(1, 1, None, 1)
+    assert len(cache) == 1
+
+    cache.put("a", 2)
+    assert cache.get("a") == 2
+    assert cache.info == CacheInfo(2, 1, None, 1)
+    assert len(cache) == 1
+
+
+def test_evict_least_recently_used():
+    cache = _LruCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.info.current_size == 2
+
+
+def test_value_size():
+    cache = _LruCache(10, len)
+    cache.put("a", b"12345")
+    cache.put("b", b"1234")
+    assert cache.info.current_size == 9
+
+    cache.put("c", b"12")
+    assert cache.get("a") is None
+    assert cache.info.current_size == 6
+
+    cache.put("d", b"12345678901")
+    assert cache.get("d") is None
+    assert cache.info.current_size == 6
+
+
+def test_zero_max_size():
+    cache = _LruCache(0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_clear():
+    cache = _LruCache(None)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    cache.clear()
+    assert cache.info == CacheInfo(0, 0, None, 0)
+    assert cache.get("a") is None
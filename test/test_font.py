@@ -7,6 +7,8 @@ from etypography import Font
 from etypography import PrimaryAxisTextAlign
 from etypography import RenderedGlyphFormat
 from etypography import SecondaryAxisTextAlign
+from etypography import TextGlyphMetrics
+from etypography import TextShaping
 
 
 def test_properties():
@@ -35,6 +37,24 @@ def test_get_glyph_index(character):
     assert index == size.face.get_glyph_index(character)
 
 
+def test_get_glyph_indices():
+    size = Mock()
+    font = Font(size)
+
+    indices = font.get_glyph_indices("abc")
+    size.face.get_glyph_indices.assert_called_once_with("abc")
+    assert indices == size.face.get_glyph_indices("abc")
+
+
+def test_get_missing_characters():
+    size = Mock()
+    font = Font(size)
+
+    missing_characters = font.get_missing_characters("abc")
+    size.face.get_missing_characters.assert_called_once_with("abc")
+    assert missing_characters == size.face.get_missing_characters("abc")
+
+
 @pytest.mark.parametrize("character", ["a", "私", 1])
 @pytest.mark.parametrize("format", [None] + list(RenderedGlyphFormat))
 def test_render_glyph(character, format):
@@ -58,6 +78,9 @@ def test_render_glyph(character, format):
 @pytest.mark.parametrize("primary_axis_alignment", [None, *PrimaryAxisTextAlign])
 @pytest.mark.parametrize("secondary_axis_alignment", [None, *SecondaryAxisTextAlign])
 @pytest.mark.parametrize("origin", [None, FVector2(-1, 1)])
+@pytest.mark.parametrize("shaping", [None, TextShaping.RUN])
+@pytest.mark.parametrize("shaping_cache", [None, Mock()])
+@pytest.mark.parametrize("glyph_metrics", [None, TextGlyphMetrics.HARFBUZZ])
 def test_layout_text(
     text,
     break_text,
@@ -67,6 +90,9 @@ def test_layout_text(
     primary_axis_alignment,
     secondary_axis_alignment,
     origin,
+    shaping,
+    shaping_cache,
+    glyph_metrics,
 ):
     size = Mock()
     font = Font(size)
@@ -94,6 +120,15 @@ def test_layout_text(
     if origin is not None:
         kwargs["origin"] = origin
 
+    if shaping is not None:
+        kwargs["shaping"] = shaping
+
+    if shaping_cache is not None:
+        kwargs["shaping_cache"] = shaping_cache
+
+    if glyph_metrics is not None:
+        kwargs["glyph_metrics"] = glyph_metrics
+
     text_layout = font.layout_text(text, **kwargs)
     size.layout_text.assert_called_once_with(
         text,
@@ -104,5 +139,38 @@ def test_layout_text(
         primary_axis_alignment=primary_axis_alignment,
         secondary_axis_alignment=secondary_axis_alignment,
         origin=origin,
+        shaping=shaping,
+        shaping_cache=shaping_cache,
+        glyph_metrics=glyph_metrics,
     )
     assert text_layout == size.layout_text(text, size, **kwargs)
+
+
+def test_warm():
+    size = Mock()
+    font = Font(size)
+    formats = [RenderedGlyphFormat.ALPHA]
+    rendered_glyph_cache = Mock()
+    glyph_atlas = Mock()
+    progress = Mock()
+
+    font.warm("abc")
+    size.warm.assert_called_once_with(
+        "abc", formats=None, rendered_glyph_cache=None, glyph_atlas=None, progress=None
+    )
+
+    size.warm.reset_mock()
+    font.warm(
+        "abc",
+        formats=formats,
+        rendered_glyph_cache=rendered_glyph_cache,
+        glyph_atlas=glyph_atlas,
+        progress=progress,
+    )
+    size.warm.assert_called_once_with(
+        "abc",
+        formats=formats,
+        rendered_glyph_cache=rendered_glyph_cache,
+        glyph_atlas=glyph_atlas,
+        progress=progress,
+    )
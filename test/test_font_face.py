@@ -1,4 +1,10 @@
 import json
+import mmap
+import pickle
+import struct
+import sys
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -6,19 +12,33 @@ from unittest.mock import patch
 import pytest
 from egeometry import FBoundingBox2d
 from emath import FVector2
+from emath import U32Array
 from emath import UVector2
+from freetype import FT_Exception
 
 import etypography
+from etypography import BreakTextChunk
+from etypography import CacheInfo
 from etypography import FontFace
 from etypography import FontFaceSize
+from etypography import GlyphAtlas
 from etypography import PrimaryAxisTextAlign
+from etypography import RenderedGlyphCache
 from etypography import RenderedGlyphFormat
+from etypography import RenderedGlyphs
 from etypography import RichText
 from etypography import SecondaryAxisTextAlign
+from etypography import ShapingCache
+from etypography import TextGlyphMetrics
 from etypography import TextLayout
+from etypography import TextShaping
+from etypography import break_text_icu_line
 from etypography import break_text_never
 from etypography import character_is_normally_rendered
 from etypography import layout_text
+from etypography._font_face import _repack_bitmap
+from etypography._font_face import _shape
+from etypography._font_face import _shape_simple
 
 from . import resources
 
@@ -42,6 +62,124 @@ def test_repr_open_sans_regular(resource_dir):
     assert repr(face) == f"<FontFace {face.name!r}>"
 
 
+@pytest.mark.parametrize("path_type", [str, Path])
+def test_from_path(resource_dir, face, path_type):
+    path_face = FontFace.from_path(path_type(resource_dir / "OpenSans-Regular.ttf"))
+    assert path_face.name == "OpenSans-Regular"
+    assert path_face._ft_face._filebodys == []
+
+    size = path_face.request_pixel_size(height=12)
+    expected_size = face.request_pixel_size(height=12)
+    assert path_face.render_glyph("a", size) == face.render_glyph("a", expected_size)
+    assert [
+        (g.glyph_index, g.rendered_bounding_box) for g in size.layout_text("office").glyphs
+    ] == [
+        (g.glyph_index, g.rendered_bounding_box)
+        for g in expected_size.layout_text("office").glyphs
+    ]
+
+
+@pytest.mark.parametrize("buffer_type", [bytes, bytearray, memoryview])
+def test_from_buffer(resource_dir, face, buffer_type):
+    data = (resource_dir / "OpenSans-Regular.ttf").read_bytes()
+    buffer_face = FontFace.from_buffer(buffer_type(data))
+    assert buffer_face.name == "OpenSans-Regular"
+    if buffer_type is bytes:
+        assert buffer_face._ft_face._filebodys[0] is data
+
+    size = buffer_face.request_pixel_size(height=12)
+    expected_size = face.request_pixel_size(height=12)
+    assert buffer_face.render_glyph("a", size) == face.render_glyph("a", expected_size)
+
+
+@pytest.mark.parametrize("glyph_metrics_cache_size", [None, 0, 10])
+def test_from_path_from_buffer_glyph_metrics_cache_size(resource_dir, glyph_metrics_cache_size):
+    path = resource_dir / "OpenSans-Regular.ttf"
+    for face in (
+        FontFace.from_path(path, glyph_metrics_cache_size=glyph_metrics_cache_size),
+        FontFace.from_buffer(path.read_bytes(), glyph_metrics_cache_size=glyph_metrics_cache_size),
+    ):
+        size = face.request_pixel_size(height=12)
+        assert size.glyph_metrics_cache_info.max_size == glyph_metrics_cache_size
+
+
+@pytest.mark.parametrize("load", ["file", "path", "buffer"])
+@pytest.mark.parametrize("glyph_metrics_cache_size", [None, 10])
+def test_pickle(resource_dir, load, glyph_metrics_cache_size):
+    path = resource_dir / "OpenSans-Regular.ttf"
+    if load == "file":
+        with open(path, "rb") as file:
+            face = FontFace(file, glyph_metrics_cache_size=glyph_metrics_cache_size)
+    elif load == "path":
+        face = FontFace.from_path(path, glyph_metrics_cache_size=glyph_metrics_cache_size)
+    else:
+        face = FontFace.from_buffer(
+            path.read_bytes(), glyph_metrics_cache_size=glyph_metrics_cache_size
+        )
+
+    pickled_face = pickle.dumps(face)
+    if load == "path":
+        assert len(pickled_face) < 1024
+    unpickled_face = pickle.loads(pickled_face)
+    assert isinstance(unpickled_face, FontFace)
+    assert unpickled_face is not face
+    assert unpickled_face.name == face.name
+
+    size = unpickled_face.request_pixel_size(height=12)
+    assert size.glyph_metrics_cache_info.max_size == glyph_metrics_cache_size
+    assert unpickled_face.render_glyph("a", size) == face.render_glyph(
+        "a", face.request_pixel_size(height=12)
+    )
+
+
+@pytest.mark.parametrize(
+    "request_size",
+    [
+        lambda face: face.request_pixel_size(height=12),
+        lambda face: face.request_pixel_size(width=9, height=14),
+        lambda face: face.request_point_size(height=12),
+        lambda face: face.request_point_size(width=10, dpi=UVector2(96, 120)),
+    ],
+)
+def test_pickle_size(face, request_size):
+    size = request_size(face)
+    other_size = face.request_pixel_size(height=20)
+    unpickled_size, unpickled_other_size = pickle.loads(pickle.dumps((size, other_size)))
+
+    assert type(unpickled_size) is type(size)
+    assert unpickled_size.face is unpickled_other_size.face
+    assert unpickled_size.face is not face
+    assert unpickled_size.nominal_size == size.nominal_size
+    assert unpickled_size.line_size == size.line_size
+    assert unpickled_size.face.render_glyph("a", unpickled_size) == face.render_glyph("a", size)
+    assert unpickled_other_size.nominal_size == other_size.nominal_size
+
+
+def test_font_data_memory(resource_dir):
+    path = resource_dir / "OpenSans-Regular.ttf"
+    font_size = path.stat().st_size
+
+    def measure(create_face):
+        tracemalloc.start()
+        try:
+            face = create_face()
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return current
+
+    # the font file is read into python once and that buffer is referenced by freetype
+    with open(path, "rb") as file:
+        assert font_size <= measure(lambda: FontFace(file)) < font_size * 1.5
+
+    # freetype references the given buffer rather than a copy of it
+    data = path.read_bytes()
+    assert measure(lambda: FontFace.from_buffer(data)) < font_size * 0.5
+
+    # the font file is mapped by freetype and harfbuzz rather than read into python
+    assert measure(lambda: FontFace.from_path(path)) < font_size * 0.5
+
+
 @pytest.mark.parametrize("character", ["a", "z", "A", "Z", "\n", "食", "\u2028"])
 def test_get_glyph_index(face, character):
     glyph_index = face.get_glyph_index(character)
@@ -55,6 +193,25 @@ def test_get_glyph_index_invalid_length(face, character):
     assert str(excinfo.value) == "only a single character may be entered"
 
 
+@pytest.mark.parametrize("text", ["", "a", "hello world", "a食\n\u2028\U0001f600z", "\ud800"])
+def test_get_glyph_indices(face, text):
+    with patch.object(face._ft_face, "get_chars", wraps=face._ft_face.get_chars) as get_chars:
+        glyph_indices = face.get_glyph_indices(text)
+        assert face.get_glyph_indices(text) == glyph_indices
+    get_chars.assert_called_once()
+    assert isinstance(glyph_indices, U32Array)
+    assert list(glyph_indices) == [0 if c == "\ud800" else face.get_glyph_index(c) for c in text]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("", set()), ("hello world", set()), ("a食b食\U0001f600", {"食", "\U0001f600"})],
+)
+def test_get_missing_characters(face, text, expected):
+    assert face.get_missing_characters(text) == expected
+    assert expected == {c for c in text if face.get_glyph_index(c) == 0}
+
+
 def test_request_point_size_no_dimensions(face) -> None:
     with pytest.raises(TypeError) as excinfo:
         face.request_point_size()
@@ -133,6 +290,149 @@ def test_fixed_sizes(face) -> None:
     assert len(fixed_sizes) == 0
 
 
+@pytest.mark.parametrize("glyph_metrics_cache_size", [-1, -100])
+def test_invalid_glyph_metrics_cache_size(resource_dir, glyph_metrics_cache_size):
+    with open(resource_dir / "OpenSans-Regular.ttf", "rb") as file:
+        with pytest.raises(ValueError) as excinfo:
+            FontFace(file, glyph_metrics_cache_size=glyph_metrics_cache_size)
+    assert str(excinfo.value) == "glyph metrics cache size must be 0 or greater"
+
+
+def test_glyph_metrics_cache(face):
+    size = face.request_pixel_size(height=10)
+    assert size.glyph_metrics_cache_info == CacheInfo(0, 0, 2048, 0)
+
+    first_layout = size.layout_text("hello world")
+    assert size.glyph_metrics_cache_info == CacheInfo(3, 8, 2048, 8)
+
+    second_layout = size.layout_text("hello world")
+    assert size.glyph_metrics_cache_info == CacheInfo(14, 8, 2048, 8)
+    assert first_layout == second_layout
+
+    other_size = face.request_pixel_size(height=20)
+    assert other_size.glyph_metrics_cache_info == CacheInfo(0, 0, 2048, 0)
+
+    size.clear_glyph_metrics_cache()
+    assert size.glyph_metrics_cache_info == CacheInfo(0, 0, 2048, 0)
+    assert size.layout_text("hello world") == first_layout
+
+
+@pytest.mark.parametrize("glyph_metrics_cache_size", [None, 0, 1, 4])
+def test_glyph_metrics_cache_size(resource_dir, face, glyph_metrics_cache_size):
+    with open(resource_dir / "OpenSans-Regular.ttf", "rb") as file:
+        bounded_face = FontFace(file, glyph_metrics_cache_size=glyph_metrics_cache_size)
+    size = bounded_face.request_pixel_size(height=10)
+    layout = size.layout_text("hello world")
+
+    info = size.glyph_metrics_cache_info
+    assert info.max_size == glyph_metrics_cache_size
+    assert info.current_size == (
+        8 if glyph_metrics_cache_size is None else min(8, glyph_metrics_cache_size)
+    )
+
+    expected_layout = face.request_pixel_size(height=10).layout_text("hello world")
+    assert [(g.glyph_index, g.rendered_bounding_box) for g in layout.glyphs] == [
+        (g.glyph_index, g.rendered_bounding_box) for g in expected_layout.glyphs
+    ]
+
+
+def test_warm_glyph_metrics_cache(face):
+    size = face.request_pixel_size(height=10)
+    size.warm("hello world")
+    assert size.glyph_metrics_cache_info == CacheInfo(0, 8, 2048, 8)
+    size.layout_text("hello world")
+    assert size.glyph_metrics_cache_info.misses == 8
+
+
+@pytest.mark.parametrize("formats", [None, [RenderedGlyphFormat.ALPHA, RenderedGlyphFormat.LCD]])
+def test_warm_rendered_glyph_cache(face, formats):
+    size = face.request_pixel_size(height=10)
+    cache = RenderedGlyphCache()
+    size.warm("abca", formats=formats, rendered_glyph_cache=cache)
+    assert len(cache) == 3 * (1 if formats is None else len(formats))
+    with patch.object(face, "render_glyph") as render_glyph:
+        for format in formats or [None]:
+            for character in "abc":
+                cache.render_glyph(character, size, format=format)
+    render_glyph.assert_not_called()
+
+
+def test_warm_formats_without_rendered_glyph_cache(face):
+    size = face.request_pixel_size(height=10)
+    with pytest.raises(ValueError) as excinfo:
+        size.warm("a", formats=[RenderedGlyphFormat.ALPHA])
+    assert str(excinfo.value) == "formats may only be warmed with a rendered glyph cache"
+    size.warm("a", formats=[])
+
+
+def test_warm_glyph_atlas(face):
+    size = face.request_pixel_size(height=10)
+    atlas = GlyphAtlas()
+    size.warm("abc", glyph_atlas=atlas)
+    glyphs = {c: atlas.get_glyph(c, size) for c in "abc"}
+    with patch.object(face, "render_glyph") as render_glyph:
+        for character, glyph in glyphs.items():
+            assert atlas.get_glyph(character, size) is glyph
+    render_glyph.assert_not_called()
+
+
+def test_warm_background_thread_progress(face):
+    size = face.request_pixel_size(height=10)
+    cache = RenderedGlyphCache()
+    progress = MagicMock()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(size.warm, "hello", rendered_glyph_cache=cache, progress=progress).result()
+    assert [c.args for c in progress.call_args_list] == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    assert len(cache) == 4
+
+
+def test_size_reuses_ft_size(face):
+    with patch.object(
+        face._ft_face, "set_pixel_sizes", wraps=face._ft_face.set_pixel_sizes
+    ) as set_pixel_sizes:
+        size_10 = face.request_pixel_size(height=10)
+        size_20 = face.request_pixel_size(height=20)
+        assert set_pixel_sizes.call_count == 2
+
+        other_size_10 = face.request_pixel_size(height=10)
+        assert set_pixel_sizes.call_count == 2
+
+        for size in (size_10, size_20, other_size_10, size_20, size_10):
+            face.render_glyph("a", size)
+            size.layout_text("abc")
+        assert set_pixel_sizes.call_count == 2
+
+
+def test_size_switching(resource_dir, face):
+    size_requests = [
+        ("request_pixel_size", {"height": 10}),
+        ("request_point_size", {"height": 20}),
+        ("request_pixel_size", {"width": 15}),
+    ]
+    sizes = [getattr(face, method)(**kwargs) for method, kwargs in size_requests]
+    rendered_glyphs = [face.render_glyph("a", size) for size in sizes]
+    for size, rendered_glyph in reversed(list(zip(sizes, rendered_glyphs))):
+        assert face.render_glyph("a", size) == rendered_glyph
+
+    for (method, kwargs), rendered_glyph in zip(size_requests, rendered_glyphs):
+        with open(resource_dir / "OpenSans-Regular.ttf", "rb") as file:
+            other_face = FontFace(file)
+        other_size = getattr(other_face, method)(**kwargs)
+        assert other_face.render_glyph("a", other_size) == rendered_glyph
+
+
+def test_size_hb_font(face):
+    size_10 = face.request_pixel_size(height=10)
+    size_20 = face.request_pixel_size(height=20)
+    assert size_10._hb_font is not size_20._hb_font
+    assert size_10._hb_font.scale == size_10._scale
+    assert size_20._hb_font.scale == size_20._scale
+
+    size_10.layout_text("abc")
+    size_20.layout_text("abc")
+    assert size_10._hb_font.scale == size_10._scale
+
+
 @pytest.mark.parametrize("character", ["", "ab"])
 def test_render_glyph_invalid_character(face, character):
     size = face.request_pixel_size(height=10)
@@ -198,6 +498,310 @@ def test_render_glyph(face, character, use_glyph_index, format):
     assert rendered_glyph.format is format
 
 
+def render_glyph_per_pixel(face, character, size, format):
+    size._use()
+    face._ft_face.load_char(character, 0)
+    ft_glyph = face._ft_face.glyph
+    try:
+        ft_glyph.render(format.value)
+    except FT_Exception:
+        pass
+    pitch = ft_glyph.bitmap.pitch
+    width = ft_glyph.bitmap.width
+    height = ft_glyph.bitmap.rows
+    data = bytes(ft_glyph.bitmap.buffer)
+    if format == RenderedGlyphFormat.LCD:
+        width = width // 3
+        data = b"".join(
+            bytes(
+                (
+                    data[x * 3 + (y * pitch)],
+                    data[x * 3 + 1 + (y * pitch)],
+                    data[x * 3 + 2 + (y * pitch)],
+                )
+            )
+            for y in range(height)
+            for x in range(width)
+        )
+    elif format == RenderedGlyphFormat.LCD_V:
+        height = height // 3
+        data = b"".join(
+            bytes(
+                (
+                    data[x + (y * 3 * pitch)],
+                    data[x + ((y * 3 + 1) * pitch)],
+                    data[x + ((y * 3 + 2) * pitch)],
+                )
+            )
+            for y in range(height)
+            for x in range(width)
+        )
+    return data, UVector2(width, height)
+
+
+@pytest.mark.parametrize("character", ["a", "W", "g", "食", " "])
+@pytest.mark.parametrize("pixel_size", [7, 10, 17, 48])
+@pytest.mark.parametrize("format", list(RenderedGlyphFormat))
+def test_render_glyph_matches_per_pixel(face, character, pixel_size, format):
+    size = face.request_pixel_size(height=pixel_size)
+    rendered_glyph = face.render_glyph(character, size, format=format)
+    expected_data, expected_size = render_glyph_per_pixel(face, character, size, format)
+    assert rendered_glyph.data == expected_data
+    assert rendered_glyph.size == expected_size
+
+
+@pytest.mark.parametrize("pitch_padding", [0, 1, 3])
+@pytest.mark.parametrize("flip", [False, True])
+@pytest.mark.parametrize("format", list(RenderedGlyphFormat))
+def test_repack_bitmap(pitch_padding, flip, format):
+    width, height = 4, 3
+    if format == RenderedGlyphFormat.LCD:
+        source_width, source_rows = width * 3, height
+    elif format == RenderedGlyphFormat.LCD_V:
+        source_width, source_rows = width, height * 3
+    else:
+        source_width, source_rows = width, height
+    pitch = source_width + pitch_padding
+    source_row_data = [
+        bytes((y * 16 + x) for x in range(source_width)) + b"\xff" * pitch_padding
+        for y in range(source_rows)
+    ]
+    buffer = b"".join(reversed(source_row_data) if flip else source_row_data)
+
+    data, repacked_width, repacked_height = _repack_bitmap(
+        memoryview(buffer), source_width, source_rows, -pitch if flip else pitch, format
+    )
+    assert (repacked_width, repacked_height) == (width, height)
+    if format == RenderedGlyphFormat.LCD_V:
+        expected_data = bytes(
+            source_row_data[y * 3 + c][x]
+            for y in range(height)
+            for x in range(width)
+            for c in range(3)
+        )
+    else:
+        expected_data = b"".join(row[:source_width] for row in source_row_data)
+    assert data == expected_data
+
+
+@pytest.mark.parametrize("character", ["", "ab"])
+def test_render_glyph_into_invalid_character(face, character):
+    size = face.request_pixel_size(height=10)
+    with pytest.raises(ValueError) as excinfo:
+        face.render_glyph_into(character, size, bytearray(1024), 0, 32)
+    assert str(excinfo.value) == "only a single character may be rendered"
+
+
+def test_render_glyph_into_invalid_size(resource_dir, face):
+    other_face = FontFace.from_path(resource_dir / "OpenSans-Regular.ttf")
+    size = other_face.request_pixel_size(height=10)
+    with pytest.raises(ValueError) as excinfo:
+        face.render_glyph_into("a", size, bytearray(1024), 0, 32)
+    assert str(excinfo.value) == "size is not compatible with this face"
+
+
+def test_render_glyph_into_readonly_target(face):
+    size = face.request_pixel_size(height=10)
+    with pytest.raises(TypeError) as excinfo:
+        face.render_glyph_into("a", size, bytes(1024), 0, 32)
+    assert str(excinfo.value) == "target must be writable"
+
+
+def test_render_glyph_into_invalid_offset(face):
+    size = face.request_pixel_size(height=10)
+    with pytest.raises(ValueError) as excinfo:
+        face.render_glyph_into("a", size, bytearray(1024), -1, 32)
+    assert str(excinfo.value) == "offset must be 0 or greater"
+
+
+@pytest.mark.parametrize("format", list(RenderedGlyphFormat))
+def test_render_glyph_into_invalid_stride(face, format):
+    size = face.request_pixel_size(height=10)
+    rendered_glyph = face.render_glyph("W", size, format=format)
+    row_size = len(rendered_glyph.data) // rendered_glyph.size.y
+    with pytest.raises(ValueError) as excinfo:
+        face.render_glyph_into("W", size, bytearray(1024), 0, row_size - 1, format=format)
+    assert str(excinfo.value) == "stride must be at least the size of a glyph row"
+
+
+@pytest.mark.parametrize("format", list(RenderedGlyphFormat))
+def test_render_glyph_into_target_too_small(face, format):
+    size = face.request_pixel_size(height=10)
+    rendered_glyph = face.render_glyph("W", size, format=format)
+    target = bytearray(len(rendered_glyph.data))
+    row_size = len(rendered_glyph.data) // rendered_glyph.size.y
+    face.render_glyph_into("W", size, target, 0, row_size, format=format)
+    assert target == rendered_glyph.data
+    with pytest.raises(ValueError) as excinfo:
+        face.render_glyph_into("W", size, target, 1, row_size, format=format)
+    assert str(excinfo.value) == "target is too small for the glyph"
+
+
+@pytest.mark.parametrize("character", ["a", "W", "g", "."])
+@pytest.mark.parametrize("use_glyph_index", [False, True])
+@pytest.mark.parametrize("format", [None] + list(RenderedGlyphFormat))
+@pytest.mark.parametrize("target_type", [bytearray, memoryview, mmap.mmap])
+def test_render_glyph_into(face, character, use_glyph_index, format, target_type):
+    size = face.request_pixel_size(height=14)
+    kwargs: dict[str, Any] = {}
+    if format is not None:
+        kwargs["format"] = format
+    rendered_glyph = face.render_glyph(character, size, **kwargs)
+    row_size = len(rendered_glyph.data) // rendered_glyph.size.y
+    stride = row_size + 7
+    offset = stride * 2 + 5
+    target_size = offset + stride * rendered_glyph.size.y
+    if target_type is mmap.mmap:
+        target = mmap.mmap(-1, target_size)
+        target.write(b"\xff" * target_size)
+    elif target_type is memoryview:
+        target = memoryview(bytearray(b"\xff" * target_size))
+    else:
+        target = bytearray(b"\xff" * target_size)
+
+    glyph_size, bearing = face.render_glyph_into(
+        face.get_glyph_index(character) if use_glyph_index else character,
+        size,
+        target,
+        offset,
+        stride,
+        **kwargs,
+    )
+    assert glyph_size == rendered_glyph.size
+    assert bearing == rendered_glyph.bearing
+
+    data = bytes(target)
+    assert data[:offset] == b"\xff" * offset
+    for y in range(rendered_glyph.size.y):
+        row_offset = offset + y * stride
+        assert (
+            data[row_offset : row_offset + row_size]
+            == rendered_glyph.data[y * row_size : (y + 1) * row_size]
+        )
+        assert data[row_offset + row_size : row_offset + stride] == b"\xff" * (stride - row_size)
+
+
+def test_render_glyph_into_empty_glyph(face):
+    size = face.request_pixel_size(height=14)
+    target = bytearray(b"\xff" * 16)
+    glyph_size, bearing = face.render_glyph_into(" ", size, target, 16, 0)
+    assert glyph_size == UVector2(0)
+    assert bearing == face.render_glyph(" ", size).bearing
+    assert target == b"\xff" * 16
+
+
+def test_render_glyphs_invalid_size(resource_dir, face):
+    other_face = FontFace.from_path(resource_dir / "OpenSans-Regular.ttf")
+    size = other_face.request_pixel_size(height=10)
+    with pytest.raises(ValueError) as excinfo:
+        face.render_glyphs([1], size)
+    assert str(excinfo.value) == "size is not compatible with this face"
+
+
+@pytest.mark.parametrize("glyph_index", [-1, 999999])
+def test_render_glyphs_invalid_index(face, glyph_index):
+    size = face.request_pixel_size(height=10)
+    with pytest.raises(ValueError) as excinfo:
+        face.render_glyphs([face.get_glyph_index("a"), glyph_index], size)
+    assert str(excinfo.value) == "face does not contain the specified glyph"
+
+
+@pytest.mark.parametrize("format", [None] + list(RenderedGlyphFormat))
+def test_render_glyphs(face, format):
+    size = face.request_pixel_size(height=12)
+    glyph_indices = [face.get_glyph_index(c) for c in "hello world"]
+    kwargs: dict[str, Any] = {}
+    if format is not None:
+        kwargs["format"] = format
+    rendered_glyphs = face.render_glyphs(glyph_indices, size, **kwargs)
+    if format is None:
+        format = RenderedGlyphFormat.ALPHA
+
+    assert isinstance(rendered_glyphs, RenderedGlyphs)
+    assert isinstance(rendered_glyphs.data, bytes)
+    assert rendered_glyphs.format is format
+    assert list(rendered_glyphs.glyph_indices) == list(dict.fromkeys(glyph_indices))
+    assert (
+        len(rendered_glyphs.glyph_indices)
+        == len(rendered_glyphs.offsets)
+        == len(rendered_glyphs.sizes)
+        == len(rendered_glyphs.bearings)
+    )
+
+    for glyph_index, offset, glyph_size, bearing in zip(
+        rendered_glyphs.glyph_indices,
+        rendered_glyphs.offsets,
+        rendered_glyphs.sizes,
+        rendered_glyphs.bearings,
+    ):
+        rendered_glyph = face.render_glyph(glyph_index, size, format=format)
+        assert glyph_size == rendered_glyph.size
+        assert bearing == rendered_glyph.bearing
+        assert rendered_glyphs.data[offset : offset + len(rendered_glyph.data)] == (
+            rendered_glyph.data
+        )
+    assert len(rendered_glyphs.data) == sum(
+        len(face.render_glyph(glyph_index, size, format=format).data)
+        for glyph_index in rendered_glyphs.glyph_indices
+    )
+
+
+def test_render_glyphs_buffer_protocol(face):
+    size = face.request_pixel_size(height=12)
+    rendered_glyphs = face.render_glyphs([face.get_glyph_index(c) for c in "ab"], size)
+    assert bytes(rendered_glyphs.glyph_indices) == struct.pack(
+        "=2I", *rendered_glyphs.glyph_indices
+    )
+    assert bytes(rendered_glyphs.offsets) == struct.pack(
+        "=2I", 0, len(face.render_glyph("a", size).data)
+    )
+    assert bytes(rendered_glyphs.sizes) == struct.pack(
+        "=4I", *(d for s in rendered_glyphs.sizes for d in s)
+    )
+    assert bytes(rendered_glyphs.bearings) == struct.pack(
+        "=4f", *(d for b in rendered_glyphs.bearings for d in b)
+    )
+
+
+def test_render_glyphs_empty(face):
+    size = face.request_pixel_size(height=12)
+    rendered_glyphs = face.render_glyphs([], size)
+    assert rendered_glyphs.data == b""
+    assert len(rendered_glyphs.glyph_indices) == 0
+    assert len(rendered_glyphs.offsets) == 0
+    assert len(rendered_glyphs.sizes) == 0
+    assert len(rendered_glyphs.bearings) == 0
+
+
+@pytest.fixture
+def fast_thread_switching():
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(switch_interval)
+
+
+def test_concurrent_layout_and_render(face, fast_thread_switching):
+    text = "The quick brown fox jumps over the lazy dog."
+    sizes = [face.request_pixel_size(height=h) for h in (9, 13, 21, 34)]
+
+    def work(size):
+        size.clear_glyph_metrics_cache()
+        text_layout = size.layout_text(text, break_text=break_text_icu_line, max_line_size=200)
+        assert text_layout is not None
+        return (
+            list(text_layout.glyphs),
+            [face.render_glyph(c, size) for c in "fox"],
+            face.render_glyphs([face.get_glyph_index(c) for c in "dog"], size).data,
+        )
+
+    expected = {size: work(size) for size in sizes}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tasks = [sizes[i % len(sizes)] for i in range(200)]
+        for size, result in zip(tasks, executor.map(work, tasks)):
+            assert result == expected[size]
+
+
 @pytest.mark.parametrize("break_text", [None, MagicMock()])
 @pytest.mark.parametrize("max_line_size", [None, 100])
 @pytest.mark.parametrize("is_character_rendered", [None, MagicMock()])
@@ -205,6 +809,9 @@ def test_render_glyph(face, character, use_glyph_index, format):
 @pytest.mark.parametrize("primary_axis_alignment", [None, *PrimaryAxisTextAlign])
 @pytest.mark.parametrize("secondary_axis_alignment", [None, *SecondaryAxisTextAlign])
 @pytest.mark.parametrize("origin", [None, FVector2(-1, 1)])
+@pytest.mark.parametrize("shaping", [None, TextShaping.RUN])
+@pytest.mark.parametrize("shaping_cache", [None, MagicMock()])
+@pytest.mark.parametrize("glyph_metrics", [None, TextGlyphMetrics.HARFBUZZ])
 def test_face_size_layout_text(
     face,
     break_text,
@@ -214,6 +821,9 @@ def test_face_size_layout_text(
     primary_axis_alignment,
     secondary_axis_alignment,
     origin,
+    shaping,
+    shaping_cache,
+    glyph_metrics,
 ):
     kwargs = {}
 
@@ -231,6 +841,12 @@ def test_face_size_layout_text(
         kwargs["secondary_axis_alignment"] = secondary_axis_alignment
     if origin is not None:
         kwargs["origin"] = origin
+    if shaping is not None:
+        kwargs["shaping"] = shaping
+    if shaping_cache is not None:
+        kwargs["shaping_cache"] = shaping_cache
+    if glyph_metrics is not None:
+        kwargs["glyph_metrics"] = glyph_metrics
 
     text = MagicMock()
     size = face.request_pixel_size(height=10)
@@ -247,6 +863,9 @@ def test_face_size_layout_text(
         primary_axis_alignment=primary_axis_alignment,
         secondary_axis_alignment=secondary_axis_alignment,
         origin=origin,
+        shaping=shaping,
+        shaping_cache=shaping_cache,
+        glyph_metrics=glyph_metrics,
     )
 
 
@@ -258,6 +877,9 @@ def test_face_size_layout_text(
 @pytest.mark.parametrize("primary_axis_alignment", [None, *PrimaryAxisTextAlign])
 @pytest.mark.parametrize("secondary_axis_alignment", [None, *SecondaryAxisTextAlign])
 @pytest.mark.parametrize("origin", [None, FVector2(-1, 1)])
+@pytest.mark.parametrize("shaping", [None, *TextShaping])
+@pytest.mark.parametrize("shaping_cache", [None, MagicMock()])
+@pytest.mark.parametrize("glyph_metrics", [None, TextGlyphMetrics.HARFBUZZ])
 def test_layout_text(
     face,
     text,
@@ -268,6 +890,9 @@ def test_layout_text(
     primary_axis_alignment,
     secondary_axis_alignment,
     origin,
+    shaping,
+    shaping_cache,
+    glyph_metrics,
 ):
     size = face.request_pixel_size(height=10)
 
@@ -310,6 +935,19 @@ def test_layout_text(
     else:
         kwargs["origin"] = expected_origin = origin
 
+    if shaping is None:
+        expected_shaping = TextShaping.CHUNK
+    else:
+        kwargs["shaping"] = expected_shaping = shaping
+
+    if shaping_cache is not None:
+        kwargs["shaping_cache"] = shaping_cache
+
+    if glyph_metrics is None:
+        expected_glyph_metrics = TextGlyphMetrics.FREETYPE
+    else:
+        kwargs["glyph_metrics"] = expected_glyph_metrics = glyph_metrics
+
     text_layout = MagicMock()
     with patch("etypography._font_face._TextLayout", return_value=text_layout) as TextLayoutMock:
         result = layout_text((RichText(text, size, None),), **kwargs)
@@ -322,6 +960,9 @@ def test_layout_text(
         expected_line_height,
         expected_primary_axis_alignment,
         expected_secondary_axis_alignment,
+        expected_shaping,
+        shaping_cache,
+        expected_glyph_metrics,
     )
     text_layout.to_text_layout.assert_called_once_with(expected_origin)
     assert result is text_layout.to_text_layout.return_value
@@ -333,10 +974,12 @@ TEXT_LAYOUT_FILES = [
 ]
 
 
+@pytest.mark.parametrize("simple_shaping", [False, True])
+@pytest.mark.parametrize("shaping", list(TextShaping))
 @pytest.mark.parametrize(
     "fixture_file_path", TEXT_LAYOUT_FILES, ids=[f.stem for f in TEXT_LAYOUT_FILES]
 )
-def test_text_layout(resource_dir, fixture_file_path):
+def test_text_layout(resource_dir, fixture_file_path, shaping, simple_shaping):
     with open(fixture_file_path, "r", encoding="utf8") as fixture_file:
         fixture = json.load(fixture_file)
 
@@ -347,6 +990,8 @@ def test_text_layout(resource_dir, fixture_file_path):
             face = FontFace(font_file)
         get_face_size = getattr(face, rich_text_fixture["size"]["method"])
         face_size = get_face_size(**rich_text_fixture["size"]["kwargs"])
+        if simple_shaping:
+            face_size.enable_simple_shaping()
         font_face_sizes[repr(face_size)] = face_size
         rich_text.append(RichText(rich_text_fixture["text"], face_size, None))
 
@@ -362,6 +1007,7 @@ def test_text_layout(resource_dir, fixture_file_path):
         max_line_size=fixture["layout_text_kwargs"]["max_line_size"],
         origin=FVector2(256),
         line_height=fixture["layout_text_kwargs"]["line_height"],
+        shaping=shaping,
     )
 
     if text_layout is None:
@@ -416,3 +1062,237 @@ def test_text_layout(resource_dir, fixture_file_path):
             for line in fixture["text_layout"]["lines"]
             for glyph in line["glyphs"]
         )
+
+
+def break_text_every_character(text):
+    for character in text:
+        yield BreakTextChunk(character, character == "\n")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        ("office affluent fjord",),
+        ("of", "fice"),
+        ("off", "ice", " ", "waffle"),
+        ("été", " caf", "é"),
+        ("hello\nworld\n", "\n", "こんにちは、世界"),
+    ],
+)
+@pytest.mark.parametrize(
+    "break_text", [break_text_never, break_text_icu_line, break_text_every_character]
+)
+@pytest.mark.parametrize("max_line_size", [None, 32])
+def test_layout_text_run_shaping_matches_chunk_shaping(face, text, break_text, max_line_size):
+    sizes = [face.request_pixel_size(height=12), face.request_pixel_size(height=24)]
+    rich_text = [RichText(t, sizes[i % len(sizes)], i) for i, t in enumerate(text)]
+
+    chunk_layout = layout_text(
+        rich_text, break_text=break_text, max_line_size=max_line_size, shaping=TextShaping.CHUNK
+    )
+    run_layout = layout_text(
+        rich_text, break_text=break_text, max_line_size=max_line_size, shaping=TextShaping.RUN
+    )
+    assert run_layout == chunk_layout
+
+
+def test_layout_text_run_shaping_shapes_once(face):
+    size = face.request_pixel_size(height=12)
+    text = "the quick brown fox jumps over the lazy dog " * 10
+
+    with patch("etypography._font_face.hb_shape", wraps=etypography._font_face.hb_shape) as shape:
+        size.layout_text(text, break_text=break_text_icu_line, shaping=TextShaping.RUN)
+    assert shape.call_count == 1
+
+    with patch("etypography._font_face.hb_shape", wraps=etypography._font_face.hb_shape) as shape:
+        size.layout_text(text, break_text=break_text_icu_line, shaping=TextShaping.CHUNK)
+    assert shape.call_count == 90
+
+
+@pytest.mark.parametrize("max_size", [-1, -100])
+def test_shaping_cache_invalid_max_size(max_size):
+    with pytest.raises(ValueError) as excinfo:
+        ShapingCache(max_size)
+    assert str(excinfo.value) == "max size must be 0 or greater"
+
+
+@pytest.mark.parametrize("shaping", list(TextShaping))
+def test_layout_text_shaping_cache(face, shaping):
+    size = face.request_pixel_size(height=12)
+    text = "the quick brown fox jumps over the lazy dog " * 10
+    expected = size.layout_text(text, break_text=break_text_icu_line, shaping=shaping)
+
+    shaping_cache = ShapingCache()
+    assert shaping_cache.info == CacheInfo(0, 0, 1024, 0)
+    assert len(shaping_cache) == 0
+    for i in range(2):
+        with patch(
+            "etypography._font_face.hb_shape", wraps=etypography._font_face.hb_shape
+        ) as shape:
+            layout = size.layout_text(
+                text, break_text=break_text_icu_line, shaping=shaping, shaping_cache=shaping_cache
+            )
+        assert layout == expected
+        if i:
+            shape.assert_not_called()
+
+    if shaping == TextShaping.CHUNK:
+        # only the 8 distinct words are shaped
+        assert shaping_cache.info == CacheInfo(172, 8, 1024, 8)
+    else:
+        assert shaping_cache.info == CacheInfo(1, 1, 1024, 1)
+
+    shaping_cache.clear()
+    assert shaping_cache.info == CacheInfo(0, 0, 1024, 0)
+    assert len(shaping_cache) == 0
+
+
+def test_shaping_cache_keyed_by_size(face):
+    sizes = [face.request_pixel_size(height=12), face.request_pixel_size(height=24)]
+    shaping_cache = ShapingCache()
+    for size in sizes:
+        assert size.layout_text("hello", shaping_cache=shaping_cache) == size.layout_text("hello")
+    assert shaping_cache.info == CacheInfo(0, 2, 1024, 2)
+
+
+@pytest.mark.parametrize("max_size", [0, 1, 3])
+def test_shaping_cache_max_size(face, max_size):
+    size = face.request_pixel_size(height=12)
+    shaping_cache = ShapingCache(max_size)
+    size.layout_text("a b c d e", break_text=break_text_icu_line, shaping_cache=shaping_cache)
+    assert len(shaping_cache) == max_size
+    assert shaping_cache.info.max_size == max_size
+
+
+def test_shaping_cache_scale_independent(face):
+    assert not ShapingCache().scale_independent
+    shaping_cache = ShapingCache(scale_independent=True)
+    assert shaping_cache.scale_independent
+
+    text = "the quick brown fox jumps over the lazy dog. Wavy AV To fi ffi 0123456789"
+    sizes = [
+        *(face.request_pixel_size(height=h) for h in (6, 8, 10, 13, 16, 24, 37, 48, 100)),
+        face.request_point_size(width=20, height=10),
+    ]
+    for size in sizes:
+        expected = list(size.layout_text(text).glyphs)
+        glyphs = list(size.layout_text(text, shaping_cache=shaping_cache).glyphs)
+        assert [g.glyph_index for g in glyphs] == [g.glyph_index for g in expected]
+        for i, (glyph, expected_glyph) in enumerate(zip(glyphs, expected)):
+            # harfbuzz rounds each position to 1/64th of a pixel, so the difference can build up
+            # by up to that much per glyph along the line
+            tolerance = (i + 1) / 64
+            assert glyph.advance_position.distance(expected_glyph.advance_position) <= tolerance
+            assert (
+                glyph.rendered_bounding_box.position.distance(
+                    expected_glyph.rendered_bounding_box.position
+                )
+                <= tolerance
+            )
+            assert glyph.rendered_bounding_box.size == expected_glyph.rendered_bounding_box.size
+
+    # the text was only shaped once for all of the sizes, with the result for each size kept
+    # alongside it
+    assert shaping_cache.info == CacheInfo(len(sizes) - 1, len(sizes) + 1, 1024, len(sizes) + 1)
+    with patch("etypography._font_face.hb_shape") as shape:
+        for size in sizes:
+            size.layout_text(text, shaping_cache=shaping_cache)
+    shape.assert_not_called()
+
+
+def test_simple_shaping(face):
+    size = face.request_pixel_size(height=13)
+    assert not size.simple_shaping_enabled
+    size.enable_simple_shaping()
+    assert size.simple_shaping_enabled
+
+    simple_text = "the quick brown box jumps over the hazy dog"
+    other_size = face.request_pixel_size(height=13)
+    for text, is_simple in (
+        (simple_text, True),
+        # a ligature and a combining mark both need harfbuzz
+        ("fi", False),
+        ("e\u0301", False),
+        ("1\u20442", False),
+    ):
+        for shaping in TextShaping:
+            with patch(
+                "etypography._font_face.hb_shape", wraps=etypography._font_face.hb_shape
+            ) as shape:
+                layout = size.layout_text(text, shaping=shaping)
+            assert shape.called != is_simple
+            expected = other_size.layout_text(text, shaping=shaping)
+            assert [g[:4] + g[5:] for g in layout.glyphs] == [
+                g[:4] + g[5:] for g in expected.glyphs
+            ]
+
+    size.disable_simple_shaping()
+    assert not size.simple_shaping_enabled
+    with patch("etypography._font_face.hb_shape", wraps=etypography._font_face.hb_shape) as shape:
+        size.layout_text(simple_text)
+    shape.assert_called_once()
+
+
+@pytest.mark.parametrize("height", [7, 13, 32])
+def test_simple_shaping_matches_harfbuzz(face, height):
+    size = face.request_pixel_size(height=height)
+    size.enable_simple_shaping()
+    table = size._simple_shaping_table
+    simple_characters = "".join(chr(i) for i, entry in enumerate(table) if entry is not None)
+    assert "a" in simple_characters
+    assert "f" not in simple_characters
+    assert "\u0301" not in simple_characters
+
+    # each character next to a sample of others, in both orders
+    sample = simple_characters[:: len(simple_characters) // 40]
+    for character in simple_characters:
+        for text in (character + sample, sample + character):
+            assert _shape_simple(table, text) == _shape(size._hb_font, text)
+
+
+@pytest.mark.parametrize("shaping", list(TextShaping))
+def test_layout_text_harfbuzz_glyph_metrics(face, shaping):
+    size = face.request_pixel_size(height=13)
+    text = "hello world\nfoo"
+    expected = size.layout_text(text, shaping=shaping)
+
+    with (
+        patch.object(face._ft_face, "load_glyph") as load_glyph,
+        patch.object(face, "_use_ft_size") as use_ft_size,
+    ):
+        layout = size.layout_text(text, shaping=shaping, glyph_metrics=TextGlyphMetrics.HARFBUZZ)
+    load_glyph.assert_not_called()
+    use_ft_size.assert_not_called()
+
+    glyphs = list(layout.glyphs)
+    expected_glyphs = list(expected.glyphs)
+    assert len(glyphs) == len(expected_glyphs)
+    for glyph, expected_glyph in zip(glyphs, expected_glyphs):
+        # only the size of the glyphs differ, harfbuzz doesn't hint so its extents aren't
+        # snapped to whole pixels like freetype's
+        assert glyph.advance_position == expected_glyph.advance_position
+        assert glyph.rendered_bounding_box.position == (
+            expected_glyph.rendered_bounding_box.position
+        )
+        assert glyph[2:] == expected_glyph[2:]
+        extents = size._hb_font.get_glyph_extents(glyph.glyph_index)
+        assert glyph.rendered_bounding_box.size == FVector2(
+            extents.width / 64.0, extents.height / -64.0
+        )
+        assert (
+            glyph.rendered_bounding_box.size.distance(expected_glyph.rendered_bounding_box.size)
+            < 2
+        )
+
+
+def test_harfbuzz_glyph_metrics_cache(face):
+    size = face.request_pixel_size(height=13)
+    glyph_index = face.get_glyph_index("a")
+    glyph_size = size._get_hb_glyph_size(glyph_index)
+    with patch.object(size, "_hb_font") as hb_font:
+        assert size._get_hb_glyph_size(glyph_index) is glyph_size
+    hb_font.get_glyph_extents.assert_not_called()
+    assert size._get_hb_glyph_size(999999) == FVector2(0)
+
+    size.clear_glyph_metrics_cache()
+    assert len(size._hb_glyph_metrics_cache) == 0
@@ -0,0 +1,279 @@
+from unittest.mock import patch
+
+import pytest
+from egeometry import IBoundingBox2d
+from emath import FVector2
+from emath import IVector2
+from emath import UVector2
+
+from etypography import FontFace
+from etypography import GlyphAtlas
+from etypography import GlyphAtlasGlyph
+from etypography import RenderedGlyphFormat
+
+
+@pytest.fixture
+def face(resource_dir):
+    yield FontFace.from_path(resource_dir / "OpenSans-Regular.ttf")
+
+
+def get_atlas_glyph_data(atlas, glyph):
+    page_data = atlas.get_page_data(glyph.page)
+    stride = atlas.page_size.x * atlas.channels
+    row_size = glyph.bounding_box.size.x * atlas.channels
+    offset = (
+        glyph.bounding_box.position.y * atlas.page_size.x + glyph.bounding_box.position.x
+    ) * atlas.channels
+    return b"".join(
+        page_data[offset + y * stride : offset + y * stride + row_size]
+        for y in range(glyph.bounding_box.size.y)
+    )
+
+
+def test_invalid_page_size():
+    with pytest.raises(ValueError) as excinfo:
+        GlyphAtlas(page_size=UVector2(0, 10))
+    assert str(excinfo.value) == "page size must be greater than 0"
+
+
+def test_invalid_max_pages():
+    with pytest.raises(ValueError) as excinfo:
+        GlyphAtlas(max_pages=0)
+    assert str(excinfo.value) == "max pages must be 1 or greater"
+
+
+def test_invalid_padding():
+    with pytest.raises(ValueError) as excinfo:
+        GlyphAtlas(padding=-1)
+    assert str(excinfo.value) == "padding must be 0 or greater"
+
+
+@pytest.mark.parametrize(
+    "format", [None, RenderedGlyphFormat.ALPHA, RenderedGlyphFormat.LCD, RenderedGlyphFormat.LCD_V]
+)
+def test_sdf_reference_size_invalid_format(format):
+    with pytest.raises(ValueError) as excinfo:
+        GlyphAtlas(format=format, sdf_reference_size=64)
+    assert str(excinfo.value) == "sdf reference size may only be used with the sdf format"
+
+
+@pytest.mark.parametrize("sdf_reference_size", [0, -1])
+def test_invalid_sdf_reference_size(sdf_reference_size):
+    with pytest.raises(ValueError) as excinfo:
+        GlyphAtlas(format=RenderedGlyphFormat.SDF, sdf_reference_size=sdf_reference_size)
+    assert str(excinfo.value) == "sdf reference size must be 1 or greater"
+
+
+@pytest.mark.parametrize(
+    "format, channels",
+    [
+        (None, 1),
+        (RenderedGlyphFormat.ALPHA, 1),
+        (RenderedGlyphFormat.SDF, 1),
+        (RenderedGlyphFormat.LCD, 3),
+        (RenderedGlyphFormat.LCD_V, 3),
+    ],
+)
+def test_properties(format, channels):
+    atlas = GlyphAtlas(format=format, page_size=UVector2(64, 32))
+    assert atlas.format == (RenderedGlyphFormat.ALPHA if format is None else format)
+    assert atlas.channels == channels
+    assert atlas.page_size == UVector2(64, 32)
+    assert atlas.page_count == 0
+    assert atlas.sdf_reference_size is None
+    assert len(atlas) == 0
+
+
+@pytest.mark.parametrize("character", ["", "ab"])
+def test_get_glyph_invalid_character(face, character):
+    atlas = GlyphAtlas()
+    with pytest.raises(ValueError) as excinfo:
+        atlas.get_glyph(character, face.request_pixel_size(height=10))
+    assert str(excinfo.value) == "only a single character may be rendered"
+
+
+@pytest.mark.parametrize("format", list(RenderedGlyphFormat))
+def test_get_glyph(face, format):
+    atlas = GlyphAtlas(format=format, page_size=UVector2(128, 128))
+    size = face.request_pixel_size(height=16)
+
+    glyphs = {}
+    for character in "hello world":
+        glyph = atlas.get_glyph(character, size)
+        assert isinstance(glyph, GlyphAtlasGlyph)
+        rendered_glyph = face.render_glyph(character, size, format=format)
+        assert glyph.bearing == rendered_glyph.bearing
+        assert glyph.scale == FVector2(1)
+        if character == " ":
+            assert glyph.page is None
+            continue
+        assert glyph.page == 0
+        assert glyph.bounding_box.size == IVector2(*rendered_glyph.size)
+        assert get_atlas_glyph_data(atlas, glyph) == rendered_glyph.data
+        glyphs[character] = glyph
+
+    assert atlas.page_count == 1
+    assert len(atlas) == 8
+    for a in glyphs.values():
+        for b in glyphs.values():
+            if a is not b:
+                assert not a.bounding_box.overlaps(b.bounding_box)
+
+
+def test_get_glyph_cached(face):
+    atlas = GlyphAtlas()
+    size = face.request_pixel_size(height=16)
+    glyph = atlas.get_glyph("a", size)
+
+    with patch.object(face, "render_glyph") as render_glyph:
+        assert atlas.get_glyph("a", size) is glyph
+        assert atlas.get_glyph(face.get_glyph_index("a"), size) is glyph
+    render_glyph.assert_not_called()
+
+    other_glyph = atlas.get_glyph("a", face.request_pixel_size(height=16))
+    assert other_glyph.bounding_box != glyph.bounding_box
+
+
+def test_get_glyph_too_large(face):
+    atlas = GlyphAtlas(page_size=UVector2(8, 8))
+    with pytest.raises(ValueError) as excinfo:
+        atlas.get_glyph("W", face.request_pixel_size(height=32))
+    assert str(excinfo.value) == "glyph is too large for the atlas page size"
+
+
+def test_new_pages(face):
+    atlas = GlyphAtlas(page_size=UVector2(32, 32))
+    size = face.request_pixel_size(height=16)
+    glyphs = [atlas.get_glyph(c, size) for c in "abcdefghijklmnopqrstuvwxyz"]
+    assert atlas.page_count > 1
+    assert {g.page for g in glyphs} == set(range(atlas.page_count))
+    for character, glyph in zip("abcdefghijklmnopqrstuvwxyz", glyphs):
+        assert get_atlas_glyph_data(atlas, glyph) == face.render_glyph(character, size).data
+
+
+def test_evict_least_recently_used_page(face):
+    sizes = [face.request_pixel_size(height=16) for _ in range(3)]
+    rendered_glyph = face.render_glyph("M", sizes[0])
+    # each page fits exactly one glyph
+    page_size = UVector2(rendered_glyph.size.x + 1, rendered_glyph.size.y + 1)
+    atlas = GlyphAtlas(page_size=page_size, max_pages=2)
+
+    assert atlas.get_glyph("M", sizes[0]).page == 0
+    assert atlas.get_glyph("M", sizes[1]).page == 1
+    assert atlas.get_glyph("M", sizes[0]).page == 0
+    atlas.pop_dirty_regions()
+
+    glyph = atlas.get_glyph("M", sizes[2])
+    assert glyph.page == 1
+    assert atlas.page_count == 2
+    assert len(atlas) == 2
+    assert atlas.pop_dirty_regions() == {1: IBoundingBox2d(IVector2(0), IVector2(*page_size))}
+    assert get_atlas_glyph_data(atlas, glyph) == rendered_glyph.data
+
+    with patch.object(face, "render_glyph", wraps=face.render_glyph) as render_glyph:
+        assert atlas.get_glyph("M", sizes[0]).page == 0
+        render_glyph.assert_not_called()
+        assert atlas.get_glyph("M", sizes[1]).page == 1
+        render_glyph.assert_called_once()
+
+
+def test_pop_dirty_regions(face):
+    atlas = GlyphAtlas(page_size=UVector2(64, 64))
+    size = face.request_pixel_size(height=12)
+    assert atlas.pop_dirty_regions() == {}
+
+    # a new page is entirely dirty
+    atlas.get_glyph("a", size)
+    assert atlas.pop_dirty_regions() == {0: IBoundingBox2d(IVector2(0), IVector2(64))}
+    assert atlas.pop_dirty_regions() == {}
+
+    atlas.get_glyph("a", size)
+    assert atlas.pop_dirty_regions() == {}
+
+    b = atlas.get_glyph("b", size)
+    c = atlas.get_glyph("c", size)
+    dirty_regions = atlas.pop_dirty_regions()
+    assert list(dirty_regions) == [0]
+    position = IVector2(
+        min(b.bounding_box.position.x, c.bounding_box.position.x),
+        min(b.bounding_box.position.y, c.bounding_box.position.y),
+    )
+    extent = IVector2(
+        max(b.bounding_box.extent.x, c.bounding_box.extent.x),
+        max(b.bounding_box.extent.y, c.bounding_box.extent.y),
+    )
+    assert dirty_regions[0] == IBoundingBox2d(position, extent - position)
+
+
+def test_clear(face):
+    atlas = GlyphAtlas(page_size=UVector2(64, 64))
+    size = face.request_pixel_size(height=12)
+    atlas.get_glyph("a", size)
+    atlas.pop_dirty_regions()
+
+    atlas.clear()
+    assert len(atlas) == 0
+    assert atlas.page_count == 1
+    assert atlas.get_page_data(0) == bytes(64 * 64)
+    assert atlas.pop_dirty_regions() == {0: IBoundingBox2d(IVector2(0), IVector2(64))}
+
+
+def test_page_data_is_readonly(face):
+    atlas = GlyphAtlas()
+    atlas.get_glyph("a", face.request_pixel_size(height=12))
+    page_data = atlas.get_page_data(0)
+    assert page_data.readonly
+    assert len(page_data) == 1024 * 1024
+
+
+def test_sdf_reference_size(face):
+    atlas = GlyphAtlas(format=RenderedGlyphFormat.SDF, sdf_reference_size=48)
+    assert atlas.sdf_reference_size == 48
+    sizes = [face.request_pixel_size(height=h) for h in (12, 24, 48, 96)] + [
+        face.request_point_size(height=20, dpi=UVector2(96, 144))
+    ]
+    reference_size = face.request_pixel_size(height=48)
+
+    with patch.object(face, "render_glyph", wraps=face.render_glyph) as render_glyph:
+        glyphs = {size: atlas.get_glyph("g", size) for size in sizes}
+        render_glyph.assert_called_once()
+    assert len(atlas) == 1
+    reference_glyph = face.render_glyph("g", reference_size, format=RenderedGlyphFormat.SDF)
+
+    for size, glyph in glyphs.items():
+        assert glyph.page == 0
+        assert glyph.bounding_box.size == IVector2(*reference_glyph.size)
+        assert get_atlas_glyph_data(atlas, glyph) == reference_glyph.data
+        assert glyph.scale == FVector2(
+            size._scale[0] / reference_size._scale[0], size._scale[1] / reference_size._scale[1]
+        )
+        assert glyph.bearing == reference_glyph.bearing * glyph.scale
+
+        # freetype pads distance fields by a spread of 8 pixels regardless of size, so the outline
+        # is compared rather than the padded bitmap
+        spread = FVector2(8)
+        rendered_glyph = face.render_glyph("g", size, format=RenderedGlyphFormat.SDF)
+        outline_position = rendered_glyph.bearing + spread
+        outline_size = FVector2(*rendered_glyph.size) - spread * 2
+        scaled_outline_position = (reference_glyph.bearing + spread) * glyph.scale
+        scaled_outline_size = (FVector2(*reference_glyph.size) - spread * 2) * glyph.scale
+        # each size's bitmap is rounded to whole pixels, the reference size's rounding is scaled
+        tolerance = 1 + max(glyph.scale)
+        for a, b in (
+            (outline_position, scaled_outline_position),
+            (outline_size, scaled_outline_size),
+        ):
+            assert abs(a.x - b.x) <= tolerance
+            assert abs(a.y - b.y) <= tolerance
+
+
+def test_sdf_reference_size_per_face(resource_dir, face):
+    other_face = FontFace.from_path(resource_dir / "OpenSans-Regular.ttf")
+    atlas = GlyphAtlas(format=RenderedGlyphFormat.SDF, sdf_reference_size=32)
+    a = atlas.get_glyph("a", face.request_pixel_size(height=10))
+    b = atlas.get_glyph("a", other_face.request_pixel_size(height=20))
+    assert len(atlas) == 2
+    assert a.bounding_box != b.bounding_box
+    assert atlas.get_glyph("a", face.request_pixel_size(height=20)).bounding_box == (
+        a.bounding_box
+    )
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import pytest
+
+import etypography
+
+
+def test_import_is_lazy():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, etypography; "
+            "print(' '.join(m for m in ('ctypes', 'emath', 'freetype', 'uharfbuzz') "
+            "if m in sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+    )
+    assert result.stdout.strip() == b""
+
+
+def test_break_text_loads_icu_lazily():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from etypography import _break_text, break_text_icu_line; "
+            "print(_break_text._icu is None); "
+            "list(break_text_icu_line('hello world')); "
+            "print(_break_text._icu is None)",
+        ],
+        capture_output=True,
+        check=True,
+    )
+    assert result.stdout.split() == [b"True", b"False"]
+
+
+@pytest.mark.parametrize("name", etypography.__all__)
+def test_attribute(name):
+    value = getattr(etypography, name)
+    assert name in dir(etypography)
+    assert getattr(etypography, name) is value
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError) as excinfo:
+        etypography.Missing
+    assert str(excinfo.value) == "module 'etypography' has no attribute 'Missing'"
@@ -0,0 +1,77 @@
+from random import Random
+
+import pytest
+
+from etypography import break_text_icu_line
+from etypography import break_text_uax14_line
+from etypography._break_text import _get_icu
+from etypography._unicode_tables import LB_CLASS_COUNT
+from etypography._unicode_tables import LB_MASK
+from etypography._unicode_tables import LB_SHIFT
+from etypography._unicode_tables import LB_STAGE_1
+from etypography._unicode_tables import LB_STAGE_2
+from etypography._unicode_tables import UNICODE_VERSION
+
+
+def _get_class_samples():
+    # the first code point of each class, which avoids the south east asian scripts that icu
+    # breaks with a dictionary, like the samples of the line break tests in the ucd
+    samples = {}
+    for code_point in range(0x110000):
+        if len(samples) == LB_CLASS_COUNT - 2:
+            break
+        c = LB_STAGE_2[LB_STAGE_1[code_point >> LB_SHIFT] << LB_SHIFT | code_point & LB_MASK]
+        samples.setdefault(c, chr(code_point))
+    return list(samples.values())
+
+
+CLASS_SAMPLES = _get_class_samples()
+# the separators of the line break tests in the ucd, along with a few that exercise the rules
+# that need more context than a pair of classes
+SEPARATORS = ["", " ", "  ", "́", "‍", " ́", "́́", ".", "-", "​"]
+
+
+@pytest.fixture
+def icu():
+    icu = _get_icu()
+    if icu.unicode_version != UNICODE_VERSION:
+        pytest.skip(f"icu is for unicode {icu.unicode_version}, not {UNICODE_VERSION}")
+    return icu
+
+
+def test_class_samples():
+    # every class except cp_ea and sot has code points
+    assert len(CLASS_SAMPLES) == LB_CLASS_COUNT - 2
+
+
+@pytest.mark.parametrize("before", CLASS_SAMPLES)
+def test_pairs_match_icu(icu, before):
+    for after in CLASS_SAMPLES:
+        for separator in SEPARATORS:
+            text = before + separator + after
+            assert list(break_text_uax14_line(text)) == list(break_text_icu_line(text)), text
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_match_icu(icu, seed):
+    random = Random(seed)
+    characters = CLASS_SAMPLES + ["a", "5", "$", "(", ")", "-", "‐", "\n", "\r\n"]
+    for _ in range(1000):
+        text = "".join(random.choices(characters, k=random.randint(1, 10)))
+        assert list(break_text_uax14_line(text)) == list(break_text_icu_line(text)), text
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "The quick (“brown”) fox can’t jump 32.3 feet, right?",
+        "$(12.35) 2,1234 (12)¢ 12.54¢ -.5 £12 -word x-ray",
+        "אב-ג דוד",
+        "今日は、よい天気です。「はい」",
+        "한국어 텍스트",
+        "\U0001f1fa\U0001f1f8\U0001f1e8\U0001f1e6\U0001f1eb \U0001f46e\U0001f3fb‍♀️",
+        "a⁠b c d e​f\rg\r\nh i\x85j\x0bk\x0cl",
+    ],
+)
+def test_text_matches_icu(icu, text):
+    assert list(break_text_uax14_line(text)) == list(break_text_icu_line(text))
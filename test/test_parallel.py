@@ -0,0 +1,58 @@
+import pytest
+from emath import FVector2Array
+from emath import U32Array
+from emath import UVector2Array
+
+from etypography import FontFace
+from etypography import RenderedGlyphFormat
+from etypography import RenderedGlyphs
+from etypography import render_glyphs_parallel
+
+
+@pytest.fixture
+def face(resource_dir):
+    yield FontFace.from_path(resource_dir / "OpenSans-Regular.ttf")
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_invalid_max_workers(face, max_workers):
+    with pytest.raises(ValueError) as excinfo:
+        render_glyphs_parallel([], max_workers=max_workers)
+    assert str(excinfo.value) == "max workers must be 1 or greater"
+
+
+def test_no_jobs():
+    assert render_glyphs_parallel([]) == []
+
+
+@pytest.mark.parametrize("format", [None, RenderedGlyphFormat.ALPHA, RenderedGlyphFormat.LCD])
+@pytest.mark.parametrize("max_workers", [None, 1, 2, 3])
+def test_render_glyphs_parallel(resource_dir, face, format, max_workers):
+    buffer_face = FontFace.from_buffer((resource_dir / "OpenSans-Regular.ttf").read_bytes())
+    sizes = [
+        face.request_pixel_size(height=10),
+        face.request_pixel_size(height=20),
+        buffer_face.request_point_size(height=14),
+        face.request_point_size(height=8),
+    ]
+    jobs = [
+        (size, [face.get_glyph_index(c) for c in text])
+        for size, text in zip(sizes, ["hello", "world", "etypography", "aaa"])
+    ]
+
+    results = render_glyphs_parallel(iter(jobs), format=format, max_workers=max_workers)
+    assert len(results) == len(jobs)
+    for (size, glyph_indices), rendered_glyphs in zip(jobs, results):
+        assert isinstance(rendered_glyphs, RenderedGlyphs)
+        assert isinstance(rendered_glyphs.glyph_indices, U32Array)
+        assert isinstance(rendered_glyphs.offsets, U32Array)
+        assert isinstance(rendered_glyphs.sizes, UVector2Array)
+        assert isinstance(rendered_glyphs.bearings, FVector2Array)
+        assert rendered_glyphs == size.face.render_glyphs(glyph_indices, size, format=format)
+
+
+def test_render_glyphs_parallel_error(face):
+    size = face.request_pixel_size(height=10)
+    with pytest.raises(ValueError) as excinfo:
+        render_glyphs_parallel([(size, [1]), (size, [999999])], max_workers=2)
+    assert str(excinfo.value) == "face does not contain the specified glyph"
@@ -0,0 +1,103 @@
+from unittest.mock import patch
+
+import pytest
+
+from etypography import CacheInfo
+from etypography import FontFace
+from etypography import RenderedGlyphCache
+from etypography import RenderedGlyphFormat
+
+
+@pytest.fixture
+def face(resource_dir):
+    with open(resource_dir / "OpenSans-Regular.ttf", "rb") as file:
+        face = FontFace(file)
+    yield face
+
+
+@pytest.mark.parametrize("max_bytes", [-1, -100])
+def test_invalid_max_bytes(max_bytes):
+    with pytest.raises(ValueError) as excinfo:
+        RenderedGlyphCache(max_bytes)
+    assert str(excinfo.value) == "max bytes must be 0 or greater"
+
+
+@pytest.mark.parametrize("character", ["", "ab"])
+def test_render_glyph_invalid_character(face, character):
+    cache = RenderedGlyphCache()
+    size = face.request_pixel_size(height=10)
+    with pytest.raises(ValueError) as excinfo:
+        cache.render_glyph(character, size)
+    assert str(excinfo.value) == "only a single character may be rendered"
+
+
+@pytest.mark.parametrize("glyph_index", [-1, 999999])
+def test_render_glyph_invalid_index(face, glyph_index):
+    cache = RenderedGlyphCache()
+    size = face.request_pixel_size(height=10)
+    with pytest.raises(ValueError) as excinfo:
+        cache.render_glyph(glyph_index, size)
+    assert str(excinfo.value) == "face does not contain the specified glyph"
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("format", [None] + list(RenderedGlyphFormat))
+def test_render_glyph(face, format):
+    cache = RenderedGlyphCache()
+    size = face.request_pixel_size(height=10)
+
+    rendered_glyph = cache.render_glyph("t", size, format=format)
+    assert rendered_glyph == face.render_glyph("t", size, format=format)
+    assert cache.info == CacheInfo(0, 1, 4 * 1024 * 1024, len(rendered_glyph.data))
+
+    with patch.object(face, "render_glyph") as render_glyph:
+        assert cache.render_glyph("t", size, format=format) is rendered_glyph
+        assert cache.render_glyph(face.get_glyph_index("t"), size, format=format) is (
+            rendered_glyph
+        )
+    render_glyph.assert_not_called()
+    assert cache.info == CacheInfo(2, 1, 4 * 1024 * 1024, len(rendered_glyph.data))
+
+
+def test_render_glyph_key(resource_dir, face):
+    with open(resource_dir / "OpenSans-Regular.ttf", "rb") as file:
+        other_face = FontFace(file)
+    cache = RenderedGlyphCache()
+    size = face.request_pixel_size(height=10)
+
+    cache.render_glyph("t", size)
+    cache.render_glyph("t", size, format=RenderedGlyphFormat.LCD)
+    cache.render_glyph("t", face.request_pixel_size(height=10))
+    cache.render_glyph("t", other_face.request_pixel_size(height=10))
+    cache.render_glyph("u", size)
+    assert len(cache) == 5
+    assert cache.info.misses == 5
+
+
+def test_max_bytes(face):
+    size = face.request_pixel_size(height=10)
+    a = face.render_glyph("a", size)
+    b = face.render_glyph("b", size)
+    cache = RenderedGlyphCache(len(a.data) + len(b.data))
+
+    cache.render_glyph("a", size)
+    cache.render_glyph("b", size)
+    assert len(cache) == 2
+    cache.render_glyph("a", size)
+    cache.render_glyph("c", size)
+    assert len(cache) < 3
+    assert cache.info.current_size <= len(a.data) + len(b.data)
+
+    with patch.object(face, "render_glyph", wraps=face.render_glyph) as render_glyph:
+        cache.render_glyph("b", size)
+    render_glyph.assert_called_once()
+
+
+def test_clear(face):
+    cache = RenderedGlyphCache()
+    size = face.request_pixel_size(height=10)
+    cache.render_glyph("a", size)
+    cache.render_glyph("a", size)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info == CacheInfo(0, 0, 4 * 1024 * 1024, 0)
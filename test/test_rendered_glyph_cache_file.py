@@ -0,0 +1,181 @@
+from unittest.mock import patch
+
+import pytest
+
+from etypography import FontFace
+from etypography import RenderedGlyphCacheFile
+from etypography import RenderedGlyphFormat
+from etypography._rendered_glyph_cache_file import _get_header
+
+
+@pytest.fixture
+def face(resource_dir):
+    yield FontFace.from_path(resource_dir / "OpenSans-Regular.ttf")
+
+
+@pytest.fixture
+def path(tmp_path):
+    yield tmp_path / "glyphs.cache"
+
+
+@pytest.mark.parametrize("character", ["", "ab"])
+def test_render_glyph_invalid_character(face, path, character):
+    with RenderedGlyphCacheFile(path) as cache:
+        with pytest.raises(ValueError) as excinfo:
+            cache.render_glyph(character, face.request_pixel_size(height=10))
+    assert str(excinfo.value) == "only a single character may be rendered"
+
+
+@pytest.mark.parametrize("glyph_index", [-1, 999999])
+def test_render_glyph_invalid_index(face, path, glyph_index):
+    with RenderedGlyphCacheFile(path) as cache:
+        with pytest.raises(ValueError) as excinfo:
+            cache.render_glyph(glyph_index, face.request_pixel_size(height=10))
+        assert len(cache) == 0
+    assert str(excinfo.value) == "face does not contain the specified glyph"
+
+
+def test_new_file(path):
+    with RenderedGlyphCacheFile(path) as cache:
+        assert cache.path == str(path)
+        assert len(cache) == 0
+    assert path.read_bytes() == _get_header()
+
+
+@pytest.mark.parametrize("format", [None] + list(RenderedGlyphFormat))
+def test_render_glyph(face, path, format):
+    size = face.request_pixel_size(height=10)
+    expected = face.render_glyph("t", size, format=format)
+
+    with RenderedGlyphCacheFile(path) as cache:
+        rendered_glyph = cache.render_glyph("t", size, format=format)
+        assert rendered_glyph == expected
+        assert len(cache) == 1
+        with patch.object(face, "render_glyph") as render_glyph:
+            assert cache.render_glyph("t", size, format=format) is rendered_glyph
+            assert cache.render_glyph(face.get_glyph_index("t"), size, format=format) is (
+                rendered_glyph
+            )
+        render_glyph.assert_not_called()
+
+    with RenderedGlyphCacheFile(path) as cache:
+        assert len(cache) == 1
+        with patch.object(face, "render_glyph") as render_glyph:
+            rendered_glyph = cache.render_glyph("t", size, format=format)
+        render_glyph.assert_not_called()
+        assert isinstance(rendered_glyph.data, memoryview)
+        assert rendered_glyph.data.readonly
+        assert rendered_glyph == expected
+        del rendered_glyph
+
+
+def test_keys(resource_dir, face, path):
+    sizes = [
+        face.request_pixel_size(height=10),
+        face.request_pixel_size(height=11),
+        face.request_point_size(height=10),
+    ]
+    with RenderedGlyphCacheFile(path) as cache:
+        for size in sizes:
+            for format in (RenderedGlyphFormat.ALPHA, RenderedGlyphFormat.LCD):
+                for character in "ab":
+                    cache.render_glyph(character, size, format=format)
+        assert len(cache) == 12
+
+    # the same font loaded in a different way and sizes requested again share the entries
+    buffer_face = FontFace.from_buffer((resource_dir / "OpenSans-Regular.ttf").read_bytes())
+    with RenderedGlyphCacheFile(path) as cache:
+        assert len(cache) == 12
+        with patch.object(buffer_face, "render_glyph") as render_glyph:
+            for height in (10, 11):
+                size = buffer_face.request_pixel_size(height=height)
+                rendered_glyph = cache.render_glyph("a", size, format=RenderedGlyphFormat.LCD)
+                assert rendered_glyph == face.render_glyph(
+                    "a",
+                    size=face.request_pixel_size(height=height),
+                    format=RenderedGlyphFormat.LCD,
+                )
+                del rendered_glyph
+        render_glyph.assert_not_called()
+
+
+def test_different_font_content(resource_dir, face, path):
+    with RenderedGlyphCacheFile(path) as cache:
+        cache.render_glyph("a", face.request_pixel_size(height=10))
+
+    # a change to the font's content means its glyphs are no longer found
+    data = bytearray((resource_dir / "OpenSans-Regular.ttf").read_bytes())
+    data.extend(b"\0\0\0\0")
+    changed_face = FontFace.from_buffer(bytes(data))
+    with RenderedGlyphCacheFile(path) as cache:
+        with patch.object(
+            changed_face, "render_glyph", wraps=changed_face.render_glyph
+        ) as render_glyph:
+            cache.render_glyph("a", changed_face.request_pixel_size(height=10))
+        render_glyph.assert_called_once()
+        assert len(cache) == 2
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: b"",
+        lambda data: b"garbage",
+        lambda data: data.replace(_get_header(), _get_header()[:-1] + b"x"),
+        lambda data: data[:-1],
+        lambda data: data + b"\0",
+    ],
+)
+def test_rebuild(face, path, corrupt):
+    size = face.request_pixel_size(height=10)
+    with RenderedGlyphCacheFile(path) as cache:
+        cache.render_glyph("a", size)
+    path.write_bytes(corrupt(path.read_bytes()))
+
+    with RenderedGlyphCacheFile(path) as cache:
+        assert len(cache) == 0
+        rendered_glyph = cache.render_glyph("a", size)
+        assert rendered_glyph == face.render_glyph("a", size)
+    assert path.read_bytes().startswith(_get_header())
+
+
+def test_rebuild_keeps_existing_mappings(face, path):
+    size = face.request_pixel_size(height=10)
+    expected = face.render_glyph("a", size)
+    with RenderedGlyphCacheFile(path) as cache:
+        cache.render_glyph("a", size)
+
+    cache = RenderedGlyphCacheFile(path)
+    rendered_glyph = cache.render_glyph("a", size)
+    assert isinstance(rendered_glyph.data, memoryview)
+    with patch("etypography._rendered_glyph_cache_file._get_header", return_value=b"ETYPOGLC\0\0"):
+        with RenderedGlyphCacheFile(path) as other_cache:
+            assert len(other_cache) == 0
+    assert rendered_glyph.data == expected.data
+    cache.close()
+    assert rendered_glyph.data == expected.data
+
+
+def test_clear(face, path):
+    size = face.request_pixel_size(height=10)
+    with RenderedGlyphCacheFile(path) as cache:
+        cache.render_glyph("a", size)
+        cache.clear()
+        assert len(cache) == 0
+        assert path.read_bytes() == _get_header()
+        cache.render_glyph("b", size)
+        assert len(cache) == 1
+
+    with RenderedGlyphCacheFile(path) as cache:
+        assert len(cache) == 1
+
+
+def test_closed(face, path):
+    size = face.request_pixel_size(height=10)
+    cache = RenderedGlyphCacheFile(path)
+    cache.close()
+    assert len(cache) == 0
+    with pytest.raises(ValueError) as excinfo:
+        cache.render_glyph("a", size)
+    assert str(excinfo.value) == "cache file is closed"
+    cache.close()
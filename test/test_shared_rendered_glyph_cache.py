@@ -0,0 +1,209 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from etypography import CacheInfo
+from etypography import FontFace
+from etypography import RenderedGlyphFormat
+from etypography import SharedRenderedGlyphCache
+
+
+@pytest.fixture
+def face(resource_dir):
+    yield FontFace.from_path(resource_dir / "OpenSans-Regular.ttf")
+
+
+@pytest.fixture
+def create_cache():
+    caches = []
+
+    def _(*args, **kwargs):
+        cache = SharedRenderedGlyphCache(*args, **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield _
+    for cache in caches:
+        cache.close()
+        cache.unlink()
+
+
+def test_invalid_max_bytes():
+    with pytest.raises(ValueError) as excinfo:
+        SharedRenderedGlyphCache(-1)
+    assert str(excinfo.value) == "max bytes must be 0 or greater"
+
+
+@pytest.mark.parametrize("max_glyphs", [0, -1])
+def test_invalid_max_glyphs(max_glyphs):
+    with pytest.raises(ValueError) as excinfo:
+        SharedRenderedGlyphCache(max_glyphs=max_glyphs)
+    assert str(excinfo.value) == "max glyphs must be 1 or greater"
+
+
+@pytest.mark.parametrize("character", ["", "ab"])
+def test_render_glyph_invalid_character(face, create_cache, character):
+    cache = create_cache()
+    with pytest.raises(ValueError) as excinfo:
+        cache.render_glyph(character, face.request_pixel_size(height=10))
+    assert str(excinfo.value) == "only a single character may be rendered"
+
+
+@pytest.mark.parametrize("format", [None] + list(RenderedGlyphFormat))
+def test_render_glyph(face, create_cache, format):
+    cache = create_cache(1024 * 1024)
+    assert isinstance(cache.name, str)
+    size = face.request_pixel_size(height=10)
+
+    rendered_glyph = cache.render_glyph("t", size, format=format)
+    assert rendered_glyph == face.render_glyph("t", size, format=format)
+    assert len(cache) == 1
+    assert cache.info.hits == 0
+    assert cache.info.misses == 1
+    assert cache.info.max_size == 1024 * 1024
+    assert cache.info.current_size >= len(rendered_glyph.data)
+
+    with patch.object(face, "render_glyph") as render_glyph:
+        assert cache.render_glyph("t", size, format=format) == rendered_glyph
+        assert cache.render_glyph(face.get_glyph_index("t"), size, format=format) == (
+            rendered_glyph
+        )
+        # the same size requested again and the same font loaded again share entries
+        assert cache.render_glyph("t", face.request_pixel_size(height=10), format=format) == (
+            rendered_glyph
+        )
+    render_glyph.assert_not_called()
+    assert len(cache) == 1
+    assert cache.info.hits == 3
+
+
+def test_too_large(face, create_cache):
+    cache = create_cache(16)
+    size = face.request_pixel_size(height=10)
+    assert cache.render_glyph("a", size) == face.render_glyph("a", size)
+    assert len(cache) == 0
+    assert cache.info == CacheInfo(0, 1, 16, 0)
+
+
+def test_evict_max_glyphs(face, create_cache):
+    cache = create_cache(max_glyphs=4)
+    size = face.request_pixel_size(height=10)
+    for character in "abcdefgh":
+        cache.render_glyph(character, size)
+        assert len(cache) <= 4
+    assert len(cache) == 4
+
+    # the oldest glyphs are evicted first
+    with patch.object(face, "render_glyph", wraps=face.render_glyph) as render_glyph:
+        for character in "efgh":
+            cache.render_glyph(character, size)
+        render_glyph.assert_not_called()
+        cache.render_glyph("a", size)
+        render_glyph.assert_called_once()
+
+
+@pytest.mark.parametrize("max_bytes", [200, 1000, 5000])
+@pytest.mark.parametrize("format", [RenderedGlyphFormat.ALPHA, RenderedGlyphFormat.LCD])
+def test_evict_max_bytes(face, create_cache, max_bytes, format):
+    cache = create_cache(max_bytes, max_glyphs=1000)
+    sizes = [face.request_pixel_size(height=h) for h in (8, 13, 21)]
+    characters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    expected = {
+        (size, character): face.render_glyph(character, size, format=format)
+        for size in sizes
+        for character in characters
+    }
+    for _ in range(3):
+        for size in sizes:
+            for character in characters:
+                rendered_glyph = cache.render_glyph(character, size, format=format)
+                assert rendered_glyph == expected[(size, character)]
+                assert cache.info.current_size <= max_bytes
+    assert 0 < len(cache) < len(expected)
+
+
+def test_clear(face, create_cache):
+    cache = create_cache()
+    size = face.request_pixel_size(height=10)
+    cache.render_glyph("a", size)
+    cache.render_glyph("a", size)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info.hits == 0
+    assert cache.info.misses == 0
+    assert cache.info.current_size == 0
+    with patch.object(face, "render_glyph", wraps=face.render_glyph) as render_glyph:
+        cache.render_glyph("a", size)
+    render_glyph.assert_called_once()
+
+
+def test_pickle_outside_of_process_start(create_cache):
+    cache = create_cache()
+    with pytest.raises(RuntimeError):
+        pickle.dumps(cache)
+
+
+_worker_cache = None
+
+
+def _init_worker(cache):
+    global _worker_cache
+    _worker_cache = cache
+
+
+def _render_glyphs(size, characters):
+    assert _worker_cache is not None
+    for character in characters:
+        _worker_cache.render_glyph(character, size)
+    return len(_worker_cache)
+
+
+def _render_and_check_glyphs(size, characters):
+    assert _worker_cache is not None
+    for _ in range(5):
+        for character in characters:
+            rendered_glyph = _worker_cache.render_glyph(character, size)
+            assert rendered_glyph == size.face.render_glyph(character, size)
+    assert _worker_cache.info.current_size <= 2000
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_concurrent_eviction(face, create_cache):
+    cache = create_cache(2000, max_glyphs=16)
+    sizes = [face.request_pixel_size(height=h) for h in (9, 12, 15, 18)]
+
+    with ProcessPoolExecutor(
+        max_workers=4,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(cache,),
+    ) as executor:
+        list(executor.map(_render_and_check_glyphs, sizes * 2, ["abcdefghijklmnopqrstuvwxyz"] * 8))
+    assert 0 < len(cache) <= 16
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_shared_between_processes(face, create_cache, start_method):
+    cache = create_cache(max_glyphs=64)
+    size = face.request_pixel_size(height=12)
+    characters = "abcdefghijklmnopqrstuvwxyz"
+
+    with ProcessPoolExecutor(
+        max_workers=4,
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_init_worker,
+        initargs=(cache,),
+    ) as executor:
+        for count in executor.map(_render_glyphs, [size] * 8, [characters] * 8):
+            assert count <= len(characters)
+
+    assert len(cache) == len(characters)
+    expected = {character: face.render_glyph(character, size) for character in characters}
+    with patch.object(face, "render_glyph") as render_glyph:
+        for character in characters:
+            assert cache.render_glyph(character, size) == expected[character]
+    render_glyph.assert_not_called()
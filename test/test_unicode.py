@@ -1,6 +1,20 @@
+import unicodedata
+
 import pytest
 
 from etypography import character_is_normally_rendered
+from etypography import get_character_general_category
+from etypography import get_character_script
+from etypography import rendered_mask
+from etypography._unicode_tables import UNICODE_VERSION
+
+
+@pytest.fixture
+def unicodedata_version():
+    if unicodedata.unidata_version.rsplit(".", 1)[0] != UNICODE_VERSION:
+        pytest.skip(
+            f"unicodedata is for unicode {unicodedata.unidata_version}, not {UNICODE_VERSION}"
+        )
 
 
 @pytest.mark.parametrize(
@@ -15,12 +29,55 @@ from etypography import character_is_normally_rendered
         ("a", True),
         ("A", True),
         ("食", True),
+        ("\U0001f600", True),
+        ("\U000e0001", False),
     ],
 )
 def test_character_is_normally_rendered(character, result):
     assert character_is_normally_rendered(character) == result
+    assert rendered_mask(character) == bytes((result,))
+
+
+@pytest.mark.parametrize(
+    "f", [character_is_normally_rendered, get_character_general_category, get_character_script]
+)
+@pytest.mark.parametrize("character", ["", "ab"])
+def test_character_not_single(f, character):
+    with pytest.raises(TypeError):
+        f(character)
+
+
+def test_general_category(unicodedata_version):
+    for code_point in range(0x110000):
+        character = chr(code_point)
+        category = unicodedata.category(character)
+        assert get_character_general_category(character) == category
+        assert character_is_normally_rendered(character) == (category[0] not in "CZ")
+
+
+@pytest.mark.parametrize(
+    "character, script",
+    [
+        ("a", "Latn"),
+        (" ", "Zyyy"),
+        ("1", "Zyyy"),
+        ("\u0301", "Zinh"),
+        ("α", "Grek"),
+        ("я", "Cyrl"),
+        ("ا", "Arab"),
+        ("あ", "Hira"),
+        ("ア", "Kana"),
+        ("食", "Hani"),
+        ("한", "Hang"),
+        ("\U0001f600", "Zyyy"),
+        ("\U00010000", "Linb"),
+        ("\U0010ffff", "Zzzz"),
+    ],
+)
+def test_get_character_script(character, script):
+    assert get_character_script(character) == script
 
 
-def test_character_normally_rendered_too_many():
-    with pytest.raises(TypeError) as excinfo:
-        character_is_normally_rendered("ab")
+@pytest.mark.parametrize("text", ["", "a", "hello world", "a\tb\nc ", "食 \U0001f600\U000e0001"])
+def test_rendered_mask(text):
+    assert rendered_mask(text) == bytes(character_is_normally_rendered(c) for c in text)